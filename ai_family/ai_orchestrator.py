@@ -4,12 +4,16 @@ AI Family Orchestrator - Manages CLAUDAE, NYALA, and DEON
 Fixes timeout issues and coordinates AI family communication
 """
 
-import ollama
 import json
+import sys
 import time
 from datetime import datetime
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ai_family.llm_telemetry import ollama_chat
+from ai_family.ollama_probe import get_probe
+
 class AIFamilyOrchestrator:
     def __init__(self):
         self.models = {
@@ -33,7 +37,8 @@ class AIFamilyOrchestrator:
         try:
             start_time = time.time()
             
-            response = ollama.chat(
+            response = ollama_chat(
+                f"orchestrator.{ai_name}",
                 model=model_info['name'],
                 messages=[{'role': 'user', 'content': prompt}],
                 options={
@@ -48,6 +53,7 @@ class AIFamilyOrchestrator:
             result = {
                 'ai': ai_name,
                 'status': 'success',
+                'prompt': prompt,
                 'response': response['message']['content'],
                 'elapsed_time': f"{elapsed:.2f}s",
                 'timestamp': datetime.now().isoformat()
@@ -129,30 +135,29 @@ class AIFamilyOrchestrator:
         with open(log_file, 'a') as f:
             f.write(json.dumps(result) + '\n')
     
-    def health_check(self):
-        """Check all AI models are responding"""
+    def health_check(self, generate=False):
+        """Check all AI models are ready from tags/ps; generate=True adds a cached one-token generation, loading each model"""
         print("\n🏥 HONEY DUO WEALTH - AI Family Health Check")
         print("=" * 50)
         
-        results = {}
-        for ai_name in self.models:
-            results[ai_name] = self.test_model(ai_name)
-            time.sleep(2)  # Avoid overwhelming system
+        probe = get_probe()
+        checks = probe.check_all([info['name'] for info in self.models.values()], generate=generate)
+        results = {ai_name: dict(checks[info['name']], ai=ai_name) for ai_name, info in self.models.items()}
         
         # Summary
         print("\n📊 Health Check Summary:")
         for ai_name, result in results.items():
             status_icon = "✅" if result['status'] == 'success' else "❌"
-            print(f"{status_icon} {ai_name.upper()}: {result['status']} ({result['elapsed_time']})")
+            state = "loaded" if result['loaded'] else "installed" if result['installed'] else "missing"
+            print(f"{status_icon} {ai_name.upper()}: {result['status']} ({result['elapsed_time']}, {state})")
         
         return results
 
-
 if __name__ == "__main__":
     orchestrator = AIFamilyOrchestrator()
     
-    # Run health check
-    orchestrator.health_check()
+    # Run health check (with generation: the decision test below loads every model anyway)
+    orchestrator.health_check(generate=True)
     
     # Test coordinated decision
     print("\n" + "="*50)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Model Artifact Store
+Stores model files once by SHA-256 as read-only copies and materialises releases by hardlinking those blobs
+"""
+
+import errno
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import stat
+from pathlib import Path
+from typing import Dict
+
+CHUNK_SIZE = 1024 * 1024
+BLOB_MODE = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH  # 0444
+FICLONE = 0x40049409  # Linux ioctl: share extents between files (btrfs/xfs)
+
+# Small mutable files are copied per release instead of shared by link
+MUTABLE_FILES = {"metadata.json"}
+SKIP_FILES = {"artifacts.json", "eval_cache.json", "training_status.json", "train.log"}
+SKIP_DIRS = {"checkpoints"}
+
+
+class ArtifactStore:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.blobs_dir = self.root / "blobs"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+
+    def ingest(self, version_dir: Path) -> Dict[str, str]:
+        """Add every artifact of a version to the store, returning {relative_path: sha256}"""
+        version_dir = Path(version_dir)
+        stat_cache_file = version_dir / "artifacts.json"
+        stat_cache = self._load_json(stat_cache_file)
+
+        manifest = {}
+        for file_path in sorted(version_dir.rglob("*")):
+            if not file_path.is_file() or file_path.is_symlink():
+                continue
+            rel = file_path.relative_to(version_dir)
+            rel_path = str(rel)
+            if rel_path in SKIP_FILES or rel_path in MUTABLE_FILES or rel.parts[0] in SKIP_DIRS:
+                continue
+
+            st = file_path.stat()
+            cached = stat_cache.get(rel_path)
+            if cached and (cached["size"], cached["mtime_ns"], cached["inode"]) == (st.st_size, st.st_mtime_ns, st.st_ino):
+                digest = cached["sha256"]
+            else:
+                digest = self._hash_file(file_path)
+
+            # Version files are rewritten in place by trainers, so a blob must never share their inode
+            blob = self.blob_path(digest)
+            if not blob.exists() or os.path.samefile(blob, file_path):
+                self._store_blob(file_path, blob)
+
+            stat_cache[rel_path] = {"sha256": digest, "size": st.st_size,
+                                    "mtime_ns": st.st_mtime_ns, "inode": st.st_ino}
+            manifest[rel_path] = digest
+
+        for rel_path in list(stat_cache):
+            if rel_path not in manifest:
+                del stat_cache[rel_path]
+        self._write_json(stat_cache_file, stat_cache)
+        return manifest
+
+    def materialize(self, manifest: Dict[str, str], version_dir: Path, release_dir: Path):
+        """Build a release directory from blobs without copying model data"""
+        release_dir = Path(release_dir)
+        tmp_dir = release_dir.with_name(f".{release_dir.name}.tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+
+        for rel_path, digest in manifest.items():
+            target = tmp_dir / rel_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._link_or_clone(self.blob_path(digest), target)
+
+        for name in MUTABLE_FILES:
+            if (Path(version_dir) / name).exists():
+                shutil.copy2(Path(version_dir) / name, tmp_dir / name)
+
+        self._write_json(tmp_dir / ".manifest.json", manifest)
+        os.rename(tmp_dir, release_dir)
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blobs_dir / digest[:2] / digest
+
+    @staticmethod
+    def manifest_id(manifest: Dict[str, str]) -> str:
+        """Short stable id for a set of artifacts"""
+        return hashlib.sha256(json.dumps(manifest, sort_keys=True).encode()).hexdigest()[:8]
+
+    @staticmethod
+    def swap_symlink(link_path: Path, target: Path):
+        """Atomically point link_path at target (rename over the old link)"""
+        link_path = Path(link_path)
+        tmp_link = link_path.with_name(f".{link_path.name}.tmp")
+        if tmp_link.is_symlink() or tmp_link.exists():
+            tmp_link.unlink()
+        os.symlink(os.path.relpath(target, link_path.parent), tmp_link)
+        os.replace(tmp_link, link_path)
+
+    def _store_blob(self, src: Path, blob: Path):
+        """Reflink or copy src into the store as a read-only blob (never a hardlink to src)"""
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp_blob = blob.with_name(f".{blob.name}.tmp")
+        tmp_blob.unlink(missing_ok=True)
+        self._clone_or_copy(src, tmp_blob)
+        os.chmod(tmp_blob, BLOB_MODE)
+        os.replace(tmp_blob, blob)
+
+    def _link_or_clone(self, blob: Path, dst: Path):
+        """Hardlink a read-only blob into a release, else reflink/copy it"""
+        try:
+            os.link(blob, dst)
+            return
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                raise
+        self._clone_or_copy(blob, dst)
+
+    def _clone_or_copy(self, src: Path, dst: Path):
+        """Reflink, else (filesystem without CoW) copy"""
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            dst.unlink(missing_ok=True)
+
+        shutil.copy2(src, dst)
+
+    def _hash_file(self, file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            while chunk := f.read(CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_json(self, path: Path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def _write_json(self, path: Path, data):
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
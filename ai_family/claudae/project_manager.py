@@ -5,31 +5,43 @@ Auto-updates documentation, manages Git, tracks project progress
 """
 
 import os
+import sys
 import json
 import subprocess
 from datetime import datetime
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+from ai_family.generated_files import write_if_changed, write_json_if_changed, ignore_lines
+
+CHANGE_FEED_LIMIT = 50  # entries kept in the cached change feed
+JOURNAL_PATTERNS = ("integrated_learning_*.json", "user_learning_*.json")  # same record schema
+
 class CLAUDAEProjectManager:
     def __init__(self, project_root="~/honey_duo_wealth"):
         self.project_root = Path(project_root).expanduser()
         self.docs_dir = self.project_root / "documentation"
         self.memory_dir = self.project_root / "project_memory"
+        self.journal_dir = self.project_root / "claudae_foundation" / "autonomous_learning"
+        self.change_feed_file = self.memory_dir / "change_feed.json"
+        self.training_summary_file = self.project_root / "ai_family/claudae/training/training_summary.json"
         
     def update_project_status(self):
         """Generate current project status"""
+        components = self._check_components()
         status = {
             "timestamp": datetime.now().isoformat(),
-            "components": self._check_components(),
+            "components": components,
+            "phase": self._get_current_phase(components),
             "ai_family": self._check_ai_status(),
+            "training_examples": self._get_training_count(),
             "recent_changes": self._get_recent_changes(),
-            "next_priorities": self._identify_next_tasks()
+            "next_priorities": self._identify_next_tasks(components)
         }
         
         # Save to project memory
         status_file = self.memory_dir / "current_status.json"
-        with open(status_file, 'w') as f:
-            json.dump(status, f, indent=2)
+        write_json_if_changed(status_file, status, ignore_keys=("timestamp",))
             
         return status
         
@@ -42,7 +54,7 @@ class CLAUDAEProjectManager:
 **Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
 
 ## 🎯 Current Status
-- **Phase:** {self._get_current_phase()}
+- **Phase:** {status['phase']}
 - **Components Ready:** {len([c for c in status['components'].values() if c == 'Ready'])}
 - **AI Family Status:** {status['ai_family']['status']}
 
@@ -57,7 +69,7 @@ python3 ai_family/ai_orchestrator.py
 {self._format_component_status(status['components'])}
 
 ## 🎓 CLAUDAE Training Progress
-- Total Examples Collected: {self._get_training_count()}
+- Total Examples Collected: {status['training_examples']}
 - Categories: Market Data, AI Integration, Trading, Monitoring
 
 ## 🔗 Links
@@ -67,8 +79,7 @@ python3 ai_family/ai_orchestrator.py
 """
         
         readme_file = self.project_root / "README.md"
-        with open(readme_file, 'w') as f:
-            f.write(readme_content)
+        write_if_changed(readme_file, readme_content, key=ignore_lines("**Last Updated:**"))
             
     def setup_git_repository(self):
         """Initialize and configure Git repository"""
@@ -130,7 +141,7 @@ python3 ai_family/ai_orchestrator.py
             
         report += f"""
 ## 📊 Training Progress
-- Examples Collected: {self._get_training_count()}
+- Examples Collected: {status['training_examples']}
 - Last Session: {self._get_last_training_session()}
 
 ## 🔧 Recent Changes
@@ -140,8 +151,7 @@ python3 ai_family/ai_orchestrator.py
             
         # Save report
         report_file = self.docs_dir / f"progress_report_{datetime.now().strftime('%Y%m%d')}.md"
-        with open(report_file, 'w') as f:
-            f.write(report)
+        write_if_changed(report_file, report, key=ignore_lines("**Generated:**"))
             
         return report
         
@@ -177,9 +187,9 @@ python3 ai_family/ai_orchestrator.py
         else:
             return "Missing"
             
-    def _get_current_phase(self):
+    def _get_current_phase(self, components=None):
         """Determine current development phase"""
-        components = self._check_components()
+        components = components or self._check_components()
         ready_count = len([c for c in components.values() if c == "Ready"])
         
         if ready_count >= 5:
@@ -198,7 +208,12 @@ python3 ai_family/ai_orchestrator.py
         return output
         
     def _get_training_count(self):
-        """Get total training examples collected"""
+        """Get total training examples collected (from the collector's summary file when present)"""
+        try:
+            with open(self.training_summary_file, 'r') as f:
+                return json.load(f).get('total_examples', 0)
+        except (OSError, ValueError):
+            pass
         try:
             from ai_family.claudae.training.claudae_training_collector import CLAUDAETrainingCollector
             collector = CLAUDAETrainingCollector()
@@ -217,19 +232,99 @@ python3 ai_family/ai_orchestrator.py
                 return latest.stem
         return "No sessions found"
         
-    def _get_recent_changes(self):
-        """Get recent file changes"""
-        # Simple version - could integrate with Git log
-        return [
-            "Market data pipeline implemented",
-            "AI family communication established", 
-            "Training system activated",
-            "System monitoring configured"
-        ]
+    def _get_recent_changes(self, limit=10):
+        """Get recent commits and CLAUDAE learnings, newest first"""
+        feed = self._refresh_change_feed()
+        changes = []
+        for entry in feed["changes"][:limit]:
+            if entry["source"] == "git":
+                changes.append(f"{entry['commit'][:7]} {entry['summary']}")
+            else:
+                changes.append(f"📚 {entry['summary']}")
+        return changes or ["No recent changes recorded"]
+        
+    def _refresh_change_feed(self):
+        """Extend the cached change feed with commits and journal entries newer than those already seen"""
+        try:
+            with open(self.change_feed_file, 'r') as f:
+                feed = json.load(f)
+        except (OSError, ValueError):
+            feed = {"last_commit": None, "journal_cursor": "", "changes": []}
+        if "last_journal_entry" in feed:
+            # Older feeds kept a per-name cursor that cannot span both journal kinds - re-read the journal
+            del feed["last_journal_entry"]
+            feed["journal_cursor"] = ""
+            feed["changes"] = [c for c in feed["changes"] if c["source"] != "journal"]
+        
+        new_changes = self._new_commits(feed) + self._new_journal_entries(feed)
+        if new_changes:
+            feed["changes"] = sorted(new_changes + feed["changes"], key=lambda c: c["timestamp"], reverse=True)
+            feed["changes"] = feed["changes"][:CHANGE_FEED_LIMIT]
+            self.memory_dir.mkdir(parents=True, exist_ok=True)
+            write_json_if_changed(self.change_feed_file, feed)
+        return feed
         
-    def _identify_next_tasks(self):
+    def _git(self, *args):
+        result = subprocess.run(["git", *args], cwd=self.project_root, capture_output=True, text=True, timeout=10)
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, args, result.stdout, result.stderr)
+        return result.stdout
+        
+    def _new_commits(self, feed):
+        """Commits since the cached head; one rev-parse when nothing changed"""
+        try:
+            head = self._git("rev-parse", "HEAD").strip()
+            if head == feed["last_commit"]:
+                return []
+            log_format = "--format=%H%x09%ct%x09%s"
+            try:
+                if not feed["last_commit"]:
+                    raise subprocess.CalledProcessError(1, "no cached commit")
+                log = self._git("log", log_format, f"{feed['last_commit']}..{head}")
+            except subprocess.CalledProcessError:
+                # First run, or history was rewritten - start again from the latest commits
+                log = self._git("log", log_format, "-n", str(CHANGE_FEED_LIMIT), head)
+                feed["changes"] = [c for c in feed["changes"] if c["source"] != "git"]
+        except (OSError, subprocess.SubprocessError):
+            return []
+        
+        feed["last_commit"] = head
+        commits = []
+        for line in log.splitlines()[:CHANGE_FEED_LIMIT]:
+            commit, timestamp, subject = line.split("\t", 2)
+            commits.append({"source": "git", "commit": commit, "summary": subject,
+                            "timestamp": datetime.fromtimestamp(int(timestamp)).isoformat()})
+        return commits
+        
+    def _new_journal_entries(self, feed):
+        """Learning journal records newer than the last one seen (ordered by the timestamp in the file name)"""
+        if not self.journal_dir.exists():
+            return []
+        names = sorted((p.name for pattern in JOURNAL_PATTERNS for p in self.journal_dir.glob(pattern)
+                        if self._journal_key(p.name) > feed["journal_cursor"]), key=self._journal_key)
+        entries = []
+        for name in names[-CHANGE_FEED_LIMIT:]:
+            try:
+                with open(self.journal_dir / name, 'r') as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                continue
+            analysis = record.get("claudae_analysis", {})
+            entries.append({"source": "journal", "summary": f"{analysis.get('development_pattern', 'Code change')} "
+                                                             f"in {Path(record.get('file_path', name)).name}",
+                            "timestamp": record.get("timestamp", "")})
+        if names:
+            feed["journal_cursor"] = self._journal_key(names[-1])
+        return entries
+        
+    @staticmethod
+    def _journal_key(name):
+        """<kind>_learning_YYYYMMDD_HHMMSS.json -> 'YYYYMMDD_HHMMSS.json/<name>', comparable across kinds"""
+        return f"{name.split('_learning_', 1)[1]}/{name}"
+        
+    def _identify_next_tasks(self, components=None):
         """Identify next development priorities"""
-        components = self._check_components()
+        components = components or self._check_components()
         
         tasks = []
         if components.get("Market Data Pipeline") != "Ready":
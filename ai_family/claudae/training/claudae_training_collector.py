@@ -5,6 +5,7 @@ Automatically captures code examples, decisions, and patterns during development
 Part of HONEY DUO WEALTH AI Family Training System
 """
 
+import sys
 import json
 import os
 import datetime
@@ -12,6 +13,9 @@ from pathlib import Path
 from typing import Dict, List, Any
 import hashlib
 
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent.parent))
+from ai_family.generated_files import write_json_if_changed
+
 class CLAUDAETrainingCollector:
     def __init__(self, project_root: str = "~/honey_duo_wealth"):
         self.project_root = Path(project_root).expanduser()
@@ -129,8 +133,7 @@ class CLAUDAETrainingCollector:
                 
         # Save summary
         summary_path = self.training_dir / "training_summary.json"
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        write_json_if_changed(summary_path, summary, ignore_keys=("generation_date",))
             
         return summary
         
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Training Dataset Builder
+Builds the per-AI training datasets in parallel, parsing each shared source only once
+"""
+
+import hashlib
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+# (parser, path relative to the project root) per AI - an AI may list several sources
+DATASET_SOURCES = {
+    "claudae": [("code_examples", "ai_family/claudae/training/code_examples")],
+    "nyala": [("interactions", "ai_family/logs/nyala_interactions.jsonl")],
+    "deon": [("interactions", "ai_family/logs/deon_interactions.jsonl")],
+}
+
+AI_ROLES = {"claudae": "System Guardian", "nyala": "Trading Engine", "deon": "Risk Grader"}
+
+
+def parse_code_examples(path: Path) -> List[Dict[str, Any]]:
+    """CLAUDAE collector output: code_examples/*_examples.json (daily logs duplicate these)"""
+    training_data = []
+    for category_file in sorted(Path(path).glob("*_examples.json")):
+        try:
+            with open(category_file) as f:
+                examples = json.load(f)
+        except json.JSONDecodeError:
+            continue
+        for example in examples:
+            training_data.append({
+                "input": f"Context: {example['context']}\nCategory: {example['category']}",
+                "output": example['code'],
+                "metadata": {
+                    "reasoning": example.get('reasoning', ''),
+                    "tags": example.get('tags', []),
+                    "timestamp": example['timestamp']
+                }
+            })
+    return training_data
+
+
+def parse_interactions(path: Path) -> List[Dict[str, Any]]:
+    """Orchestrator interaction log: successful responses become training examples"""
+    training_data = []
+    path = Path(path)
+    if not path.exists():
+        return training_data
+
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("status") != "success" or not record.get("response", "").strip():
+                continue
+            ai_name = record.get("ai", path.stem.replace("_interactions", ""))
+            # Older records were logged without their prompt - that was the role check-in
+            prompt = record.get("prompt") or (
+                f"You are {ai_name.upper()}, the {AI_ROLES.get(ai_name, 'assistant')} for HONEY DUO WEALTH. "
+                "Confirm your role and readiness."
+            )
+            training_data.append({
+                "input": prompt,
+                "output": record["response"].strip(),
+                "metadata": {
+                    "elapsed_time": record.get("elapsed_time"),
+                    "timestamp": record.get("timestamp")
+                }
+            })
+    return training_data
+
+
+PARSERS = {
+    "code_examples": parse_code_examples,
+    "interactions": parse_interactions,
+}
+
+
+def _parse_source(parser: str, path: str) -> Tuple[List[Dict[str, Any]], float]:
+    start = time.perf_counter()
+    records = PARSERS[parser](Path(path))
+    return records, time.perf_counter() - start
+
+
+def _write_dataset(dataset_file: str, parts: List[List[Dict[str, Any]]]) -> Tuple[int, str, float]:
+    start = time.perf_counter()
+    training_data = [record for part in parts for record in part]
+    payload = json.dumps(training_data, indent=2).encode()
+    tmp_file = Path(dataset_file).with_suffix(".json.tmp")
+    tmp_file.write_bytes(payload)
+    tmp_file.replace(dataset_file)
+    return len(training_data), hashlib.sha256(payload).hexdigest(), time.perf_counter() - start
+
+
+class DatasetBuilder:
+    def __init__(self, project_root: Path, output_dir: Path, sources: Dict[str, list] = None,
+                 max_workers: int = None):
+        self.project_root = Path(project_root)
+        self.output_dir = Path(output_dir)
+        self.sources = sources or DATASET_SOURCES
+        self.max_workers = max_workers
+
+    def build(self, ai_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Build datasets for the given AIs; returns file, size, hash and timings per AI"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        unique_sources = sorted({
+            (parser, str(self.project_root / rel_path))
+            for ai_name in ai_names for parser, rel_path in self.sources[ai_name]
+        })
+
+        results = {}
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            # Pass 1: every distinct source parsed once, in parallel
+            parse_futures = {source: executor.submit(_parse_source, *source) for source in unique_sources}
+            parsed = {source: future.result() for source, future in parse_futures.items()}
+
+            # Pass 2: assemble, hash and write each AI's dataset in parallel
+            stamp = datetime.now().strftime('%Y%m%d')
+            write_futures = {}
+            for ai_name in ai_names:
+                sources = [(parser, str(self.project_root / rel_path)) for parser, rel_path in self.sources[ai_name]]
+                dataset_file = self.output_dir / f"{ai_name}_training_{stamp}.json"
+                write_futures[ai_name] = (sources, dataset_file, executor.submit(
+                    _write_dataset, str(dataset_file), [parsed[source][0] for source in sources]
+                ))
+
+            for ai_name, (sources, dataset_file, future) in write_futures.items():
+                examples, sha256, write_sec = future.result()
+                parse_sec = max((parsed[source][1] for source in sources), default=0.0)
+                results[ai_name] = {
+                    "dataset_file": dataset_file,
+                    "examples": examples,
+                    "sha256": sha256,
+                    "sources": [path for _, path in sources],
+                    "parse_sec": round(parse_sec, 3),
+                    "write_sec": round(write_sec, 3),
+                    "build_sec": round(parse_sec + write_sec, 3)
+                }
+
+        return results
@@ -3,9 +3,14 @@
 Fast AI Configuration - Optimized for trading speed
 """
 
-import ollama
+import sys
 import time
 from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ai_family.llm_telemetry import ollama_chat
+from ai_family.ollama_probe import get_probe
 
 class FastAIFamily:
     def __init__(self):
@@ -32,20 +37,25 @@ class FastAIFamily:
         self.preload_models()
         
     def preload_models(self):
-        """Keep models warm in memory"""
+        """Keep models warm in memory (load only - no generation)"""
         print("⚡ Pre-loading AI models for fast response...")
         
+        probe = get_probe()
+        primaries = {config['primary'] for config in self.models.values()}
+        checks = probe.check_all(sorted(primaries))
+        
         for ai_name, config in self.models.items():
-            try:
-                # Load primary model
-                ollama.chat(
-                    model=config['primary'],
-                    messages=[{'role': 'user', 'content': 'Initialize'}],
-                    keep_alive='24h'
-                )
-                print(f"✅ {ai_name}: {config['primary']} loaded")
-            except:
-                print(f"❌ {ai_name}: Failed to load {config['primary']}")
+            model = config['primary']
+            check = checks[model]
+            if not check['installed']:
+                print(f"❌ {ai_name}: {model} not available ({check['error'] or 'not installed'})")
+            elif check['loaded']:
+                print(f"✅ {ai_name}: {model} already loaded")
+            elif probe.warm(model, keep_alive='24h'):
+                check['loaded'] = True  # models shared between AIs load once
+                print(f"✅ {ai_name}: {model} loaded")
+            else:
+                print(f"❌ {ai_name}: Failed to load {model}")
     
     def quick_decision(self, market_data):
         """Ultra-fast trading decision (<5 seconds total)"""
@@ -69,7 +79,8 @@ class FastAIFamily:
         """Fast market analysis"""
         prompt = f"QUICK: BUY/SELL/HOLD for {data['symbol']} at ${data['price']}? (10 words max)"
         
-        response = ollama.chat(
+        response = ollama_chat(
+            "fast_ai.analysis",
             model=self.models[ai_name]['primary'],
             messages=[{'role': 'user', 'content': prompt}],
             options={'temperature': 0.1, 'num_predict': 50}
@@ -84,7 +95,8 @@ class FastAIFamily:
         """Fast risk check"""
         prompt = f"Risk level LOW/MEDIUM/HIGH for {data['symbol']}? (5 words max)"
         
-        response = ollama.chat(
+        response = ollama_chat(
+            "fast_ai.risk",
             model=self.models[ai_name]['primary'],
             messages=[{'role': 'user', 'content': prompt}],
             options={'temperature': 0.1, 'num_predict': 30}
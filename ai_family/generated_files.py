@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Generated File Writer
+Writes generated files atomically and only when their content changed, and tags those writes so file watchers can skip them
+"""
+
+import fcntl
+import json
+import os
+import threading
+from contextlib import contextmanager
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# Shared by every process so a watcher can recognise writes made by another one
+TAG_REGISTRY = Path(__file__).resolve().parent / "logs" / "generated_writes.json"
+TAG_LOCK = TAG_REGISTRY.with_name(f"{TAG_REGISTRY.name}.lock")  # flock'd across each registry update
+TEMP_SUFFIX = ".claudae-tmp"
+MAX_TAGS = 500
+
+_lock = threading.Lock()
+_tags: Dict[str, list] = {}  # resolved path -> [st_ino, st_mtime_ns, st_size, digest]
+_tags_mtime_ns = None
+
+
+def write_if_changed(path, content: str, key: Callable[[str], Any] = None) -> bool:
+    """Write text atomically unless the file already holds it; key() normalises volatile parts such as timestamps"""
+    path = Path(path)
+    data = content.encode("utf-8")
+    if key is not None:
+        try:
+            if key(path.read_text(encoding="utf-8")) == key(content):
+                return False
+        except (OSError, ValueError):
+            pass
+    elif _current_digest(path) == _digest(data):
+        return False
+
+    with generated_file(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def write_json_if_changed(path, data: Any, indent: int = 2, ignore_keys: Iterable[str] = ()) -> bool:
+    """write_if_changed for JSON; top-level ignore_keys do not count as a change"""
+    ignore_keys = set(ignore_keys)
+
+    def key(text):
+        loaded = json.loads(text)
+        if isinstance(loaded, dict):
+            return {k: v for k, v in loaded.items() if k not in ignore_keys}
+        return loaded
+
+    return write_if_changed(path, json.dumps(data, indent=indent), key if ignore_keys else None)
+
+
+def ignore_lines(*prefixes: str) -> Callable[[str], str]:
+    """key for write_if_changed that drops lines such as "Generated: <timestamp>" from the comparison"""
+    def key(text):
+        return "\n".join(line for line in text.splitlines() if not line.startswith(prefixes))
+    return key
+
+
+@contextmanager
+def generated_file(path, mode: str = "w", encoding: Optional[str] = "utf-8"):
+    """Stream a generated file into a temp file, then rename it over the target only if the content differs"""
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}{TEMP_SUFFIX}")
+    try:
+        with open(temp_path, mode, encoding=None if "b" in mode else encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        digest = _file_digest(temp_path)
+        if digest == _current_digest(path):
+            temp_path.unlink()
+            return
+        # Tag before the rename (which keeps inode and mtime) so a watcher never sees the write untagged
+        _tag(path, temp_path, digest)
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def is_generated(path) -> bool:
+    """True when the file is unchanged since one of our tagged writes (or is one of our temp files)"""
+    path = Path(path)
+    if path.name.endswith(TEMP_SUFFIX) or path.resolve() in (TAG_REGISTRY, TAG_LOCK):
+        return True
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    tag = _load_tags().get(str(path.resolve()))
+    return tag is not None and tag[:3] == [stat.st_ino, stat.st_mtime_ns, stat.st_size]
+
+
+def _digest(data: bytes) -> str:
+    return blake2b(data, digest_size=16).hexdigest()
+
+
+def _file_digest(path: Path) -> str:
+    h = blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _current_digest(path: Path) -> Optional[str]:
+    """Digest of what is on disk; taken from our tag without reading the file when it is untouched"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    tag = _load_tags().get(str(path.resolve()))
+    if tag is not None and tag[:3] == [stat.st_ino, stat.st_mtime_ns, stat.st_size]:
+        return tag[3]
+    return _file_digest(path)
+
+
+def _load_tags() -> Dict[str, list]:
+    """Registry contents, re-read only when another process has updated it"""
+    global _tags, _tags_mtime_ns
+    try:
+        mtime_ns = TAG_REGISTRY.stat().st_mtime_ns
+    except OSError:
+        return _tags
+    with _lock:
+        if mtime_ns != _tags_mtime_ns:
+            try:
+                _tags = _read_registry()
+                _tags_mtime_ns = mtime_ns
+            except (OSError, ValueError):
+                pass
+        return _tags
+
+
+def _read_registry() -> Dict[str, list]:
+    with open(TAG_REGISTRY, "r") as f:
+        return json.load(f)
+
+
+def _tag(path: Path, written: Path, digest: str):
+    """Record the stat that path will have once written is renamed over it"""
+    global _tags, _tags_mtime_ns
+    stat = written.stat()
+    key = str(path.resolve())
+    TAG_REGISTRY.parent.mkdir(parents=True, exist_ok=True)
+
+    # Other processes tag too, so the load-update-replace happens under an exclusive flock
+    with open(TAG_LOCK, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            tags = _read_registry()
+        except (OSError, ValueError):
+            tags = {}
+        tags.pop(key, None)
+        tags[key] = [stat.st_ino, stat.st_mtime_ns, stat.st_size, digest]
+        if len(tags) > MAX_TAGS:
+            tags = dict(list(tags.items())[-MAX_TAGS:])  # oldest writes first
+
+        temp_path = TAG_REGISTRY.with_name(f".{TAG_REGISTRY.name}.{os.getpid()}.{threading.get_ident()}{TEMP_SUFFIX}")
+        with open(temp_path, "w") as f:
+            json.dump(tags, f)
+        os.replace(temp_path, TAG_REGISTRY)
+        with _lock:
+            _tags = tags
+            _tags_mtime_ns = TAG_REGISTRY.stat().st_mtime_ns
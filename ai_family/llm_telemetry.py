@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+LLM Call Telemetry
+Structured latency/throughput records for every Ollama call, written to the monitoring metrics store
+"""
+
+import atexit
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Process-wide metrics store, created on first use and flushed at exit"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            from monitoring.metrics_store import MetricsStore
+            _store = MetricsStore()
+            atexit.register(_store.flush)
+    return _store
+
+
+def call_metrics(response: Optional[Any], wall_sec: float) -> Dict[str, Any]:
+    """Token counts and timings from an Ollama response (dict or ollama client object, durations in ns)"""
+    def field(name):
+        if response is None:
+            return 0
+        value = response.get(name) if hasattr(response, "get") else getattr(response, name, None)
+        return value or 0
+
+    total_sec = field("total_duration") / 1e9
+    eval_sec = field("eval_duration") / 1e9
+    output_tokens = field("eval_count")
+    return {
+        "prompt_tokens": field("prompt_eval_count"),
+        "output_tokens": output_tokens,
+        # Wall time Ollama did not account for: HTTP plus waiting behind other requests
+        "queue_wait_sec": round(max(0.0, wall_sec - total_sec), 3) if total_sec else None,
+        # Model load and prompt evaluation happen before the first output token
+        "ttft_sec": round((field("load_duration") + field("prompt_eval_duration")) / 1e9, 3) if total_sec else None,
+        "latency_sec": round(wall_sec, 3),
+        "tokens_per_sec": round(output_tokens / eval_sec, 2) if eval_sec > 0 else None
+    }
+
+
+def record_llm_call(model: str, caller: str, started: float, response: Any = None,
+                    status: str = "success", error: str = None):
+    """Record one finished LLM call; telemetry failures never reach the caller"""
+    try:
+        call = {"ts": started, "model": model, "caller": caller, "status": status,
+                "error": str(error)[:200] if error else None}
+        call.update(call_metrics(response, time.time() - started))
+        get_store().record_llm_call(call)
+    except Exception:
+        pass
+
+
+def record_metrics(values: Dict[str, float]):
+    """Gauge readings from a long-running process (e.g. learner queue depths); never raises"""
+    try:
+        get_store().record_many(values)
+    except Exception:
+        pass
+
+
+def post_generate(caller: str, url: str, payload: Dict[str, Any], timeout: float):
+    """requests.post to Ollama's /api/generate with the call recorded; returns the response unchanged"""
+    import requests
+
+    started = time.time()
+    try:
+        response = requests.post(url, json=payload, timeout=timeout)
+    except Exception as e:
+        record_llm_call(payload.get("model"), caller, started, status="error", error=e)
+        raise
+
+    data = None
+    if response.status_code == 200:
+        try:
+            data = response.json()
+        except ValueError:
+            pass
+    record_llm_call(payload.get("model"), caller, started, data,
+                    "success" if data is not None else f"http_{response.status_code}")
+    return response
+
+
+def ollama_chat(caller: str, **kwargs):
+    """ollama.chat with the call recorded; exceptions propagate as before"""
+    import ollama
+
+    started = time.time()
+    try:
+        response = ollama.chat(**kwargs)
+    except Exception as e:
+        record_llm_call(kwargs.get("model"), caller, started, status="error", error=e)
+        raise
+    record_llm_call(kwargs.get("model"), caller, started, response)
+    return response
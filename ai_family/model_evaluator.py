@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Model Evaluation Harness
+Runs versioned prompt suites against AI family model versions through the local Ollama API
+"""
+
+import json
+import hashlib
+import math
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .llm_telemetry import post_generate
+
+
+class ModelEvaluator:
+    def __init__(self, suites_dir: Path, base_url: str = "http://localhost:11434",
+                 max_workers: int = 2, timeout: int = 120):
+        self.suites_dir = Path(suites_dir)
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def load_suite(self, ai_name: str) -> Dict[str, Any]:
+        """Load the versioned evaluation suite for an AI"""
+        suite_file = self.suites_dir / f"{ai_name}.json"
+        with open(suite_file) as f:
+            suite = json.load(f)
+        suite.setdefault("pass_threshold", 0.6)
+        suite.setdefault("options", {})
+        return suite
+
+    def run_suite(self, suite: Dict[str, Any], version_dir: Path, model: str,
+                  refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Run every case in the suite, reusing cached outputs for this version"""
+        cache_file = Path(version_dir) / "eval_cache.json"
+        cache = self._load_cache(cache_file)
+
+        results = {}
+        pending = {}
+        for case_id, case in suite["cases"].items():
+            key = self._cache_key(suite, case_id, case, model)
+            if not refresh and key in cache:
+                results[case_id] = dict(cache[key], cached=True)
+            else:
+                pending[case_id] = key
+
+        # Bounded parallelism - Ollama serialises per model, so keep this small
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    case_id: executor.submit(self.run_case, model, suite["cases"][case_id],
+                                             suite["options"], suite["pass_threshold"])
+                    for case_id in pending
+                }
+                for case_id, future in futures.items():
+                    result = future.result()
+                    results[case_id] = result
+                    # Errors are not cached so the next run retries them
+                    if result["status"] == "success":
+                        cache[pending[case_id]] = result
+
+            self._save_cache(cache_file, cache)
+
+        return {case_id: results[case_id] for case_id in suite["cases"]}
+
+    def run_case(self, model: str, case: Dict[str, Any], options: Dict[str, Any] = None,
+                 pass_threshold: float = 0.6) -> Dict[str, Any]:
+        """Run a single prompt and score the output against its expected patterns"""
+        patterns = case.get("expected_patterns") or [case["expected_pattern"]]
+        request_options = dict(options or {})
+        request_options.update(case.get("options", {}))
+
+        start_time = time.time()
+        try:
+            response = post_generate(
+                "model_evaluator",
+                f"{self.base_url}/api/generate",
+                {
+                    "model": model,
+                    "prompt": case["input"],
+                    "stream": False,
+                    "options": request_options
+                },
+                timeout=self.timeout
+            )
+            latency = time.time() - start_time
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": str(e),
+                "score": 0.0,
+                "passed": False,
+                "latency_sec": round(time.time() - start_time, 3),
+                "tokens_per_sec": 0.0,
+                "output_tokens": 0,
+                "timestamp": datetime.now().isoformat()
+            }
+
+        output = data.get("response", "")
+        matched = [p for p in patterns if re.search(p, output, re.IGNORECASE)]
+        score = len(matched) / len(patterns)
+
+        # Ollama reports durations in nanoseconds
+        output_tokens = data.get("eval_count", 0)
+        eval_seconds = data.get("eval_duration", 0) / 1e9
+        tokens_per_sec = output_tokens / eval_seconds if eval_seconds > 0 else 0.0
+
+        return {
+            "status": "success",
+            "score": round(score, 3),
+            "passed": score >= case.get("pass_threshold", pass_threshold),
+            "matched_patterns": matched,
+            "missed_patterns": [p for p in patterns if p not in matched],
+            "output": output,
+            "latency_sec": round(latency, 3),
+            "tokens_per_sec": round(tokens_per_sec, 2),
+            "prompt_tokens": data.get("prompt_eval_count", 0),
+            "output_tokens": output_tokens,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def compare(self, metadata_a: Dict[str, Any], metadata_b: Dict[str, Any]) -> Dict[str, Any]:
+        """Compare two validated versions on both quality and speed"""
+        metrics_a = metadata_a.get("performance_metrics", {})
+        metrics_b = metadata_b.get("performance_metrics", {})
+
+        def delta(key):
+            a, b = metrics_a.get(key), metrics_b.get(key)
+            return {"a": a, "b": b, "delta": round(b - a, 3) if a is not None and b is not None else None}
+
+        cases_a = metadata_a.get("validation_results", {})
+        cases_b = metadata_b.get("validation_results", {})
+        per_case = {}
+        for case_id in sorted(set(cases_a) | set(cases_b)):
+            a, b = cases_a.get(case_id, {}), cases_b.get(case_id, {})
+            per_case[case_id] = {
+                "score": (a.get("score"), b.get("score")),
+                "latency_sec": (a.get("latency_sec"), b.get("latency_sec")),
+                "tokens_per_sec": (a.get("tokens_per_sec"), b.get("tokens_per_sec"))
+            }
+
+        return {
+            "versions": (metadata_a.get("version"), metadata_b.get("version")),
+            "suite_versions": (metrics_a.get("suite_version"), metrics_b.get("suite_version")),
+            "quality": {
+                "average_score": delta("average_score"),
+                "pass_rate": delta("pass_rate")
+            },
+            "speed": {
+                "latency_p50_sec": delta("latency_p50_sec"),
+                "latency_p95_sec": delta("latency_p95_sec"),
+                "avg_tokens_per_sec": delta("avg_tokens_per_sec")
+            },
+            "per_case": per_case
+        }
+
+    def _cache_key(self, suite: Dict[str, Any], case_id: str, case: Dict[str, Any], model: str) -> str:
+        """Cache key changes whenever the suite, prompt or model changes"""
+        case_hash = hashlib.md5(json.dumps(case, sort_keys=True).encode()).hexdigest()[:8]
+        return f"{suite['suite_version']}:{case_id}:{case_hash}:{model}"
+
+    def _load_cache(self, cache_file: Path) -> Dict[str, Any]:
+        try:
+            with open(cache_file) as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def _save_cache(self, cache_file: Path, cache: Dict[str, Any]):
+        with open(cache_file, 'w') as f:
+            json.dump(cache, f, indent=2)
+
+
+def percentile(values, pct: float) -> Optional[float]:
+    """Nearest-rank percentile, None for an empty list"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Model Registry
+SQLite index of AI family model versions, datasets and deployment history
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    ai_name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    version_num INTEGER NOT NULL,
+    base_model TEXT,
+    status TEXT,
+    created TEXT,
+    updated TEXT,
+    notes TEXT,
+    training_data_size INTEGER DEFAULT 0,
+    dataset_hash TEXT,
+    metrics TEXT,
+    PRIMARY KEY (ai_name, version_num)
+);
+CREATE INDEX IF NOT EXISTS idx_versions_status ON versions(ai_name, status);
+
+CREATE TABLE IF NOT EXISTS deployments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ai_name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    action TEXT,
+    release TEXT,
+    timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_deployments_ai ON deployments(ai_name, id);
+
+CREATE TABLE IF NOT EXISTS datasets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ai_name TEXT NOT NULL,
+    path TEXT,
+    sha256 TEXT,
+    examples INTEGER,
+    created TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_datasets_ai ON datasets(ai_name, id);
+
+CREATE TABLE IF NOT EXISTS legacy_imports (
+    ai_name TEXT PRIMARY KEY,
+    timestamp TEXT
+);
+"""
+
+
+class ModelRegistry:
+    def __init__(self, db_path: Path, versions_dir: Path, models_dir: Path):
+        self.db_path = Path(db_path)
+        self.versions_dir = Path(versions_dir)
+        self.models_dir = Path(models_dir)
+
+        # Nothing is created until the first write, so read-only commands leave a fresh install untouched
+        self._lock = threading.Lock()
+        self._connect_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writable = False
+
+    def _connection(self, write: bool = False) -> Optional[sqlite3.Connection]:
+        """Read-only connection to an existing DB (None if there is none yet); write=True creates it"""
+        with self._connect_lock:
+            if write and not self._writable:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(SCHEMA)
+                conn.commit()
+                self._conn, self._writable = conn, True
+            elif self._conn is None and self.db_path.exists():
+                conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True,
+                                       check_same_thread=False, timeout=10)
+                conn.row_factory = sqlite3.Row
+                self._conn = conn
+            return self._conn
+
+    def _rows(self, sql: str, params=()) -> List[sqlite3.Row]:
+        conn = self._connection()
+        return conn.execute(sql, params).fetchall() if conn else []
+
+    def _write(self, sql: str, params=()):
+        with self._lock:
+            conn = self._connection(write=True)
+            conn.execute(sql, params)
+            conn.commit()
+
+    def ensure_imported(self, ai_names: List[str]):
+        """One-time import of versions/<ai>/v*/metadata.json and deployment_log.json"""
+        imported = {row["ai_name"] for row in self._rows("SELECT ai_name FROM legacy_imports")}
+        for ai_name in ai_names:
+            if ai_name in imported:
+                continue
+            # With no DB and nothing to import there is nothing to record yet
+            if not self.db_path.exists() and not self._has_legacy(ai_name):
+                continue
+            self._import_legacy(ai_name)
+
+    def upsert_version(self, metadata: Dict[str, Any]):
+        """Insert or update a version from its metadata.json contents"""
+        self._write("""
+            INSERT INTO versions (ai_name, version, version_num, base_model, status, created,
+                                  updated, notes, training_data_size, dataset_hash, metrics)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(ai_name, version_num) DO UPDATE SET
+                base_model=excluded.base_model, status=excluded.status, updated=excluded.updated,
+                notes=excluded.notes, training_data_size=excluded.training_data_size,
+                dataset_hash=excluded.dataset_hash, metrics=excluded.metrics
+        """, (
+            metadata["ai_name"], metadata["version"], int(metadata["version"][1:]),
+            metadata.get("base_model"), metadata.get("status"), metadata.get("created"),
+            datetime.now().isoformat(), metadata.get("notes", ""),
+            metadata.get("training_data_size", 0), metadata.get("dataset_hash"),
+            json.dumps(metadata.get("performance_metrics", {}))
+        ))
+
+    def next_version_num(self, ai_name: str) -> int:
+        rows = self._rows("SELECT COALESCE(MAX(version_num), 0) + 1 FROM versions WHERE ai_name = ?", (ai_name,))
+        return rows[0][0] if rows else 1
+
+    def record_deployment(self, ai_name: str, version: str, action: str, release: str = None,
+                          timestamp: str = None):
+        self._write(
+            "INSERT INTO deployments (ai_name, version, action, release, timestamp) VALUES (?, ?, ?, ?, ?)",
+            (ai_name, version, action, release, timestamp or datetime.now().isoformat())
+        )
+
+    def deployment_history(self, ai_name: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent deployments first"""
+        rows = self._rows(
+            "SELECT version, action, release, timestamp FROM deployments WHERE ai_name = ? ORDER BY id DESC LIMIT ?",
+            (ai_name, limit)
+        )
+        return [dict(row) for row in rows]
+
+    def record_dataset(self, ai_name: str, path: str, sha256: str, examples: int):
+        self._write(
+            "INSERT INTO datasets (ai_name, path, sha256, examples, created) VALUES (?, ?, ?, ?, ?)",
+            (ai_name, path, sha256, examples, datetime.now().isoformat())
+        )
+
+    def latest_dataset(self, ai_name: str) -> Optional[Dict[str, Any]]:
+        rows = self._rows(
+            "SELECT path, sha256, examples, created FROM datasets WHERE ai_name = ? ORDER BY id DESC LIMIT 1",
+            (ai_name,)
+        )
+        return dict(rows[0]) if rows else None
+
+    def status_summary(self, ai_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Per-AI version counts, latest version and its status, production version and dataset size in one query"""
+        if not self.db_path.exists():
+            return {ai_name: {"ai_name": ai_name, "total_versions": 0, "latest_version": None,
+                              "latest_status": None, "production_version": None,
+                              "training_examples": None, "training_versions": 0}
+                    for ai_name in ai_names}
+        placeholders = ", ".join("(?)" for _ in ai_names)
+        rows = self._rows(f"""
+            WITH ais(ai_name) AS (VALUES {placeholders})
+            SELECT ais.ai_name,
+                   (SELECT COUNT(*) FROM versions v WHERE v.ai_name = ais.ai_name) AS total_versions,
+                   (SELECT version FROM versions v WHERE v.ai_name = ais.ai_name
+                      ORDER BY version_num DESC LIMIT 1) AS latest_version,
+                   (SELECT status FROM versions v WHERE v.ai_name = ais.ai_name
+                      ORDER BY version_num DESC LIMIT 1) AS latest_status,
+                   (SELECT version FROM deployments d WHERE d.ai_name = ais.ai_name
+                      ORDER BY id DESC LIMIT 1) AS production_version,
+                   (SELECT examples FROM datasets ds WHERE ds.ai_name = ais.ai_name
+                      ORDER BY id DESC LIMIT 1) AS training_examples,
+                   (SELECT COUNT(*) FROM versions v WHERE v.ai_name = ais.ai_name
+                      AND v.status = 'training') AS training_versions
+            FROM ais
+        """, ai_names)
+        return {row["ai_name"]: dict(row) for row in rows}
+
+    def version_timeline(self) -> List[Dict[str, Any]]:
+        """Versions with the period each one was the newest"""
+        rows = self._rows("""
+            SELECT ai_name, version, status, created,
+                   LEAD(created) OVER (PARTITION BY ai_name ORDER BY version_num) AS superseded
+            FROM versions ORDER BY ai_name, version_num
+        """)
+        return [dict(row) for row in rows]
+
+    def metrics_history(self) -> List[Dict[str, Any]]:
+        """Validated versions with their quality and speed metrics"""
+        rows = self._rows("""
+            SELECT ai_name, version, created, metrics FROM versions
+            WHERE metrics IS NOT NULL AND metrics != '{}'
+            ORDER BY ai_name, version_num
+        """)
+        return [dict(row, metrics=json.loads(row["metrics"])) for row in rows]
+
+    def _has_legacy(self, ai_name: str) -> bool:
+        return (any((self.versions_dir / ai_name).glob("v*/metadata.json"))
+                or (self.models_dir / ai_name / "deployment_log.json").exists())
+
+    def _import_legacy(self, ai_name: str):
+        for version_dir in (self.versions_dir / ai_name).glob("v*"):
+            metadata_file = version_dir / "metadata.json"
+            if not version_dir.name[1:].isdigit() or not metadata_file.exists():
+                continue
+            try:
+                with open(metadata_file) as f:
+                    metadata = json.load(f)
+            except json.JSONDecodeError:
+                continue
+            metadata.setdefault("ai_name", ai_name)
+            metadata["version"] = version_dir.name
+            self.upsert_version(metadata)
+
+        deployment_log = self.models_dir / ai_name / "deployment_log.json"
+        if deployment_log.exists():
+            try:
+                with open(deployment_log) as f:
+                    for entry in json.load(f):
+                        self.record_deployment(ai_name, entry["version"], entry.get("action", "deployed"),
+                                               entry.get("release"), entry.get("timestamp"))
+            except (json.JSONDecodeError, KeyError):
+                pass
+
+        self._write("INSERT OR REPLACE INTO legacy_imports VALUES (?, ?)", (ai_name, datetime.now().isoformat()))
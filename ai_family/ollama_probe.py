@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Ollama Readiness Probe
+Tiered model health check: server/tags, loaded models, then an optional cached one-token generation
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any
+
+import requests
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ai_family.llm_telemetry import post_generate
+
+_probe = None
+_probe_lock = threading.Lock()
+
+
+def get_probe():
+    """Process-wide probe so every caller shares the same caches"""
+    global _probe
+    with _probe_lock:
+        if _probe is None:
+            _probe = OllamaProbe()
+    return _probe
+
+
+class OllamaProbe:
+    def __init__(self, base_url: str = "http://localhost:11434", timeout: float = 3.0,
+                 ttl: float = 60.0, generate_timeout: float = 30.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.ttl = ttl
+        self.generate_timeout = generate_timeout
+
+        self._lock = threading.Lock()
+        self._tags = None
+        self._tags_at = 0.0
+        self._generated: Dict[str, Dict[str, Any]] = {}  # model -> last one-token generation result
+
+    def check(self, model: str, generate: bool = False) -> Dict[str, Any]:
+        """Readiness of one model; the generation tier only runs when asked and its result is reused for ttl"""
+        started = time.time()
+        result = {"model": model, "online": False, "installed": False, "loaded": False,
+                  "responding": None, "cached": False, "error": None}
+        try:
+            result["installed"] = model in self._installed_models()
+            result["online"] = True
+            if result["installed"]:
+                result["loaded"] = model in self._loaded_models()
+        except (requests.RequestException, ValueError) as e:
+            result["error"] = f"Ollama not reachable: {e}"
+
+        if generate and result["installed"]:
+            result.update(self._generate_once(model))
+
+        result["ready"] = result["installed"] and result["responding"] is not False
+        result["status"] = "success" if result["ready"] else "error"
+        result["elapsed_time"] = f"{time.time() - started:.2f}s"
+        result["timestamp"] = datetime.now().isoformat()
+        return result
+
+    def max_check_sec(self, generate: bool = False) -> float:
+        """Longest check() can take: /api/tags and /api/ps, plus one generation when asked"""
+        return 2 * self.timeout + (self.generate_timeout if generate else 0)
+
+    def check_all(self, models: List[str], generate: bool = False) -> Dict[str, Dict[str, Any]]:
+        """check() for several models at once"""
+        with ThreadPoolExecutor(max_workers=max(1, len(models))) as pool:
+            results = pool.map(lambda model: self.check(model, generate), models)
+            return dict(zip(models, results))
+
+    def warm(self, model: str, keep_alive: str = "24h") -> bool:
+        """Load a model without generating (Ollama loads on an empty prompt)"""
+        try:
+            response = post_generate("ollama_probe.warm", f"{self.base_url}/api/generate",
+                                     {"model": model, "keep_alive": keep_alive, "stream": False},
+                                     timeout=self.generate_timeout)
+            return response.status_code == 200
+        except requests.RequestException:
+            return False
+
+    def _installed_models(self) -> List[str]:
+        with self._lock:
+            if self._tags is None or time.monotonic() - self._tags_at > self.ttl:
+                response = requests.get(f"{self.base_url}/api/tags", timeout=self.timeout)
+                response.raise_for_status()
+                self._tags = [m.get("name", "") for m in response.json().get("models", [])]
+                self._tags_at = time.monotonic()
+            return self._tags
+
+    def _loaded_models(self) -> List[str]:
+        response = requests.get(f"{self.base_url}/api/ps", timeout=self.timeout)
+        response.raise_for_status()
+        return [m.get("name", "") for m in response.json().get("models", [])]
+
+    def _generate_once(self, model: str) -> Dict[str, Any]:
+        with self._lock:
+            cached = self._generated.get(model)
+        if cached and time.monotonic() - cached["at"] < self.ttl:
+            return dict(cached["result"], cached=True)
+
+        started = time.time()
+        try:
+            response = post_generate("ollama_probe", f"{self.base_url}/api/generate",
+                                     {"model": model, "prompt": "ok", "stream": False,
+                                      "options": {"num_predict": 1}},
+                                     timeout=self.generate_timeout)
+            result = {"responding": response.status_code == 200,
+                      "error": None if response.status_code == 200 else f"HTTP {response.status_code}"}
+        except requests.RequestException as e:
+            result = {"responding": False, "error": str(e)}
+        result["generate_sec"] = round(time.time() - started, 3)
+
+        with self._lock:
+            self._generated[model] = {"at": time.monotonic(), "result": result}
+        return result
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Training Job Runner
+Runs generated train.py scripts in background subprocesses with checkpoint resume and progress status files
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional
+
+# Generated into each version directory as train.py; configuration is read from train_config.json
+TRAINING_SCRIPT = r'''#!/usr/bin/env python3
+# Auto-generated training script for {ai_name}
+import json
+import math
+import os
+import random
+import time
+from pathlib import Path
+
+VERSION_DIR = Path(__file__).resolve().parent
+CONFIG = json.loads((VERSION_DIR / "train_config.json").read_text())
+CHECKPOINT_DIR = VERSION_DIR / "checkpoints"
+STATUS_FILE = Path(os.environ.get("HDW_STATUS_FILE", VERSION_DIR / "training_status.json"))
+STARTED = time.time()
+
+
+def report(state, step, total_steps, loss=None, resumed_from=None, **extra):
+    """Atomically publish progress for the job runner and dashboards"""
+    elapsed = time.time() - STARTED
+    steps_done = step - (resumed_from or 0)
+    rate = steps_done / elapsed if elapsed > 0 and steps_done > 0 else 0.0
+    status = {
+        "state": state,
+        "pid": os.getpid(),
+        "step": step,
+        "total_steps": total_steps,
+        "loss": loss,
+        "steps_per_sec": round(rate, 3),
+        "samples_per_sec": round(rate * CONFIG["batch_size"], 3),
+        "eta_sec": round((total_steps - step) / rate, 1) if rate > 0 else None,
+        "resumed_from": resumed_from,
+        "updated": time.time(),
+    }
+    status.update(extra)
+    tmp = STATUS_FILE.with_name(STATUS_FILE.name + ".tmp")
+    tmp.write_text(json.dumps(status, indent=2))
+    os.replace(tmp, STATUS_FILE)
+
+
+def latest_checkpoint():
+    checkpoints = [p for p in CHECKPOINT_DIR.glob("checkpoint-*") if p.name.split("-")[-1].isdigit()]
+    if not checkpoints:
+        return None
+    return max(checkpoints, key=lambda p: int(p.name.split("-")[-1]))
+
+
+def load_dataset():
+    with open(CONFIG["dataset_file"]) as f:
+        return json.load(f)
+
+
+def train_dummy(dataset):
+    """CPU-only stand-in trainer: same checkpoint/progress protocol, no ML dependencies"""
+    steps_per_epoch = max(1, math.ceil(len(dataset) / CONFIG["batch_size"]))
+    total_steps = steps_per_epoch * CONFIG["epochs"]
+    step, loss = 0, None
+
+    checkpoint = latest_checkpoint()
+    if checkpoint:
+        state = json.loads((checkpoint / "trainer_state.json").read_text())
+        step, loss = state["step"], state["loss"]
+    resumed_from = step if checkpoint else None
+
+    rng = random.Random(step)
+    while step < total_steps:
+        time.sleep(CONFIG.get("dummy_step_sec", 0.05))
+        step += 1
+        loss = 2.5 * math.exp(-3.0 * step / total_steps) + rng.uniform(0, 0.05)
+        if step % CONFIG["save_steps"] == 0 or step == total_steps:
+            target = CHECKPOINT_DIR / f"checkpoint-{step}"
+            target.mkdir(parents=True, exist_ok=True)
+            (target / "trainer_state.json").write_text(json.dumps({"step": step, "loss": loss}))
+        report("running", step, total_steps, round(loss, 4), resumed_from)
+
+    (VERSION_DIR / "model.bin").write_bytes(b"dummy-model-" + str(step).encode())
+    return step, total_steps, loss, resumed_from
+
+
+def train_transformers(dataset):
+    from transformers import (AutoTokenizer, AutoModelForCausalLM, TrainingArguments,
+                              Trainer, TrainerCallback)
+
+    tokenizer = AutoTokenizer.from_pretrained(CONFIG["hf_model"])
+    tokenizer.pad_token = tokenizer.pad_token or tokenizer.eos_token
+    model = AutoModelForCausalLM.from_pretrained(CONFIG["hf_model"])
+
+    encoded = [
+        tokenizer(example["input"] + "\n" + example["output"], truncation=True, max_length=1024)
+        for example in dataset
+    ]
+    for item in encoded:
+        item["labels"] = list(item["input_ids"])
+
+    checkpoint = latest_checkpoint()
+    resumed_from = int(checkpoint.name.split("-")[-1]) if checkpoint else None
+
+    class ProgressCallback(TrainerCallback):
+        def on_log(self, args, state, control, logs=None, **kwargs):
+            report("running", state.global_step, state.max_steps, (logs or {}).get("loss"), resumed_from)
+
+    training_args = TrainingArguments(
+        output_dir=str(CHECKPOINT_DIR),
+        num_train_epochs=CONFIG["epochs"],
+        per_device_train_batch_size=CONFIG["batch_size"],
+        learning_rate=CONFIG["learning_rate"],
+        logging_steps=10,
+        save_strategy="steps",
+        save_steps=CONFIG["save_steps"],
+        save_total_limit=2,
+    )
+    trainer = Trainer(model=model, args=training_args, train_dataset=encoded,
+                      callbacks=[ProgressCallback()])
+    result = trainer.train(resume_from_checkpoint=str(checkpoint) if checkpoint else None)
+    trainer.save_model(str(VERSION_DIR / "model"))
+    return trainer.state.global_step, trainer.state.max_steps, result.training_loss, resumed_from
+
+
+def train_model():
+    dataset = load_dataset()
+    print(f"🎓 Training {CONFIG['ai_name']} with {len(dataset)} examples")
+    trainer = train_dummy if CONFIG["trainer"] == "dummy" else train_transformers
+    step, total_steps, loss, resumed_from = trainer(dataset)
+    report("completed", step, total_steps, loss, resumed_from)
+
+
+if __name__ == "__main__":
+    train_model()
+'''
+
+ACTIVE_STATES = {"queued", "running"}
+# Running trainers register here (<job_id>.pid) so monitors need not scan the process table
+PID_DIR_NAME = "pids"
+
+
+class TrainingJobRunner:
+    def __init__(self, jobs_dir: Path, max_workers: int = 1):
+        self.jobs_dir = Path(jobs_dir)
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self.pid_dir = self.jobs_dir / PID_DIR_NAME
+        self.pid_dir.mkdir(exist_ok=True)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="training-job")
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def submit(self, ai_name: str, version_id: str, script_path: Path,
+               on_complete: Callable[[Dict[str, Any]], None] = None) -> str:
+        """Queue a training script; returns the job id"""
+        job_id = f"{ai_name}_{version_id}"
+        version_dir = Path(script_path).parent
+        job = {
+            "job_id": job_id,
+            "ai_name": ai_name,
+            "version": version_id,
+            "script": str(script_path),
+            "version_dir": str(version_dir),
+            "status_file": str(version_dir / "training_status.json"),
+            "log_file": str(version_dir / "train.log"),
+            "submitted": datetime.now().isoformat()
+        }
+        self._write_json(self.jobs_dir / f"{job_id}.json", job)
+        if not Path(job["status_file"]).exists() or self.status(job_id)["state"] not in ACTIVE_STATES:
+            self._write_status(job, {"state": "queued", "step": 0, "total_steps": None, "updated": time.time()})
+
+        with self._lock:
+            self._futures[job_id] = self.executor.submit(self._run, job, on_complete)
+        return job_id
+
+    def wait(self, job_id: str, poll_interval: float = 1.0,
+             on_progress: Callable[[Dict[str, Any]], None] = None) -> Dict[str, Any]:
+        """Block until the job finishes, reporting progress as it changes"""
+        last_update = None
+        while True:
+            status = self.status(job_id)
+            if on_progress and status.get("updated") != last_update:
+                on_progress(status)
+                last_update = status.get("updated")
+            future = self._futures.get(job_id)
+            if status["state"] not in ACTIVE_STATES and (future is None or future.done()):
+                return status
+            time.sleep(poll_interval)
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """Latest progress for a job (step, loss, throughput, ETA)"""
+        job = self._read_json(self.jobs_dir / f"{job_id}.json")
+        status = self._read_json(Path(job["status_file"])) if job else {}
+        status.setdefault("state", "unknown")
+        return dict(job or {}, **status)
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        return [self.status(job_file.stem) for job_file in sorted(self.jobs_dir.glob("*.json"))]
+
+    def resume_interrupted(self, on_complete: Callable[[Dict[str, Any]], None] = None,
+                           poll_interval: float = 2.0) -> List[str]:
+        """Relaunch jobs whose trainer died mid-run (they continue from the latest checkpoint)
+        and re-attach on_complete to trainers that outlived the process which started them"""
+        resumed = []
+        for status in self.list_jobs():
+            if status["state"] not in ACTIVE_STATES or status["job_id"] in self._futures:
+                continue
+            if status.get("pid") and self._pid_alive(status["pid"], status["script"]):
+                job = self._read_json(self.jobs_dir / f"{status['job_id']}.json")
+                with self._lock:
+                    self._futures[job["job_id"]] = self.executor.submit(self._watch, job, on_complete,
+                                                                             poll_interval)
+                continue
+            self.submit(status["ai_name"], status["version"], Path(status["script"]), on_complete)
+            resumed.append(status["job_id"])
+        return resumed
+
+    def _run(self, job: Dict[str, Any], on_complete: Optional[Callable]):
+        env = dict(os.environ, HDW_STATUS_FILE=job["status_file"])
+        self._write_status(job, dict(self._read_json(Path(job["status_file"])),
+                                     state="running", updated=time.time()))
+        with open(job["log_file"], 'a') as log:
+            # Own session + log file (not a pipe): the trainer survives a dashboard restart
+            process = subprocess.Popen(
+                [sys.executable, "-u", job["script"]],
+                cwd=job["version_dir"], stdout=log, stderr=subprocess.STDOUT,
+                env=env, start_new_session=True
+            )
+            # The trainer owns the status file from here on; the pid goes in the job record
+            self._write_json(self.jobs_dir / f"{job['job_id']}.json", dict(job, pid=process.pid))
+            pid_file = self.pid_dir / f"{job['job_id']}.pid"
+            self._write_json(pid_file, {"pid": process.pid, "job_id": job["job_id"], "ai_name": job["ai_name"],
+                                        "version": job["version"], "script": job["script"],
+                                        "status_file": job["status_file"], "started": time.time()})
+            try:
+                returncode = process.wait()
+            except BaseException:
+                pid_file.unlink(missing_ok=True)
+                raise
+
+        self._finish(job, returncode, on_complete)
+
+    def _watch(self, job: Dict[str, Any], on_complete: Optional[Callable], poll_interval: float = 2.0):
+        """Wait for a trainer started by an earlier process (not our child, so no exit code)"""
+        while self._pid_alive(job["pid"], job["script"]):
+            time.sleep(poll_interval)
+        self._finish(job, None, on_complete)
+
+    def _finish(self, job: Dict[str, Any], returncode: Optional[int], on_complete: Optional[Callable]):
+        status = self._read_json(Path(job["status_file"]))
+        if (returncode or 0) != 0 or status.get("state") != "completed":
+            status.update(state="failed", returncode=returncode, updated=time.time())
+            self._write_status(job, status)
+        # Only now: monitors read the final state from the status file when the pidfile goes away
+        (self.pid_dir / f"{job['job_id']}.pid").unlink(missing_ok=True)
+
+        with self._lock:
+            self._futures.pop(job["job_id"], None)
+        if on_complete:
+            on_complete(dict(job, **status))
+
+    def _write_status(self, job: Dict[str, Any], status: Dict[str, Any]):
+        self._write_json(Path(job["status_file"]), status)
+
+    @staticmethod
+    def _pid_alive(pid: int, script: str) -> bool:
+        try:
+            os.kill(pid, 0)
+        except (ProcessLookupError, PermissionError):
+            return False
+        proc = Path(f"/proc/{pid}")
+        if not proc.exists():
+            return True
+        try:
+            if (proc / "stat").read_text().rsplit(")", 1)[-1].split()[0] == "Z":
+                return False  # Exited, not yet reaped
+            # Guard against PID reuse
+            return script.encode() in (proc / "cmdline").read_bytes()
+        except OSError:
+            return False
+
+    @staticmethod
+    def _read_json(path: Path) -> Dict[str, Any]:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]):
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+CLAUDAE Backup Tools
+====================
+
+Backup integrity verification that stays disk-bound on large trees:
+- Size (and optionally mtime) compared before any hashing
+- Chunked BLAKE2b digests with one reusable buffer per worker
+- Hashing spread across a thread pool, optional stop at first mismatch
+
+Incremental snapshots:
+- File contents stored once as blobs named by digest
+- One manifest per snapshot; unchanged files (size + mtime) are not re-read
+- Restore any snapshot into a directory
+- Verify a snapshot by re-hashing every blob it references
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple, Union
+
+CHUNK_SIZE = 1024 * 1024
+SNAPSHOT_TIME_FORMAT = "%Y%m%d_%H%M%S_%f"
+SNAPSHOT_TIME_PATTERN = r"\d{8}_\d{6}_\d{6}"  # what SNAPSHOT_TIME_FORMAT produces
+
+
+def blake2b_file(path: Path, buffer: bytearray = None) -> str:
+    """BLAKE2b of a file, read in fixed-size chunks into buffer"""
+    if buffer is None:
+        buffer = bytearray(CHUNK_SIZE)
+    view = memoryview(buffer)
+    digest = hashlib.blake2b()
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+def scan_tree(root: Path) -> Dict[str, Tuple[int, int]]:
+    """Relative path -> (size, mtime_ns) for every file, from directory entries only"""
+    files = {}
+    stack = [Path(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    files[os.path.relpath(entry.path, root)] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+class BackupVerifier:
+    """Compares an original tree with its backup"""
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE, max_workers: int = 4,
+                 fail_fast: bool = False, trust_mtime: bool = False, max_reported: int = 50):
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.fail_fast = fail_fast
+        # Skip hashing files whose size and mtime match (copy2/copytree preserve mtime)
+        self.trust_mtime = trust_mtime
+        self.max_reported = max_reported
+        self._local = threading.local()
+
+    def verify(self, original_dir: Path, backup_dir: Path) -> Dict[str, Any]:
+        """Verification report: ok, mismatches and throughput"""
+        started = time.perf_counter()
+        original_dir, backup_dir = Path(original_dir), Path(backup_dir)
+        original = scan_tree(original_dir)
+        backup = scan_tree(backup_dir)
+
+        mismatches: List[Dict[str, str]] = []
+        for rel_path in sorted(original.keys() - backup.keys()):
+            mismatches.append({"path": rel_path, "reason": "missing from backup"})
+        for rel_path in sorted(backup.keys() - original.keys()):
+            mismatches.append({"path": rel_path, "reason": "not in original"})
+
+        to_hash = []
+        skipped = 0
+        for rel_path in sorted(original.keys() & backup.keys()):
+            (size_a, mtime_a), (size_b, mtime_b) = original[rel_path], backup[rel_path]
+            if size_a != size_b:
+                mismatches.append({"path": rel_path, "reason": f"size {size_a} != {size_b}"})
+            elif self.trust_mtime and mtime_a == mtime_b:
+                skipped += 1
+            else:
+                to_hash.append((rel_path, size_a))
+
+        bytes_hashed = 0
+        if not (self.fail_fast and mismatches):
+            hash_mismatches, bytes_hashed = self._hash_pairs(original_dir, backup_dir, to_hash)
+            mismatches.extend(hash_mismatches)
+
+        elapsed = time.perf_counter() - started
+        return {
+            "ok": not mismatches,
+            "files": len(original),
+            "hashed": len(to_hash),
+            "skipped_unchanged": skipped,
+            "mismatch_count": len(mismatches),
+            "mismatches": mismatches[:self.max_reported],
+            "bytes_hashed": bytes_hashed,
+            "elapsed_sec": round(elapsed, 3),
+            "bytes_per_sec": round(bytes_hashed / elapsed) if elapsed > 0 else 0
+        }
+
+    def file_digest(self, path: Path) -> str:
+        """BLAKE2b of a file, read in fixed-size chunks into this thread's buffer"""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = bytearray(self.chunk_size)
+        return blake2b_file(path, buffer)
+
+    def digest_many(self, items: Iterable[Tuple[Any, Path]]) -> Iterator[Tuple[Any, Optional[str]]]:
+        """(key, BLAKE2b or None if unreadable) for each (key, path), hashed in the pool a few files at a time"""
+        def digest(key, path):
+            try:
+                return key, self.file_digest(path)
+            except OSError:
+                return key, None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="backup-verify") as pool:
+            pending = set()
+            remaining = iter(items)
+            while True:
+                while len(pending) < self.max_workers * 2:
+                    item = next(remaining, None)
+                    if item is None:
+                        break
+                    pending.add(pool.submit(digest, *item))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+    def _hash_pairs(self, original_dir: Path, backup_dir: Path,
+                    pairs: List[Tuple[str, int]]) -> Tuple[List[Dict[str, str]], int]:
+        """Hash original and backup copies in a pool, keeping only a few files in flight"""
+        stop = threading.Event()
+        mismatches = []
+        bytes_hashed = 0
+
+        def compare(rel_path: str, size: int) -> Tuple[Optional[Dict[str, str]], int]:
+            if stop.is_set():
+                return None, 0
+            try:
+                same = self.file_digest(original_dir / rel_path) == self.file_digest(backup_dir / rel_path)
+            except OSError as e:
+                return {"path": rel_path, "reason": f"unreadable: {e}"}, 0
+            return (None if same else {"path": rel_path, "reason": "content differs"}), 2 * size
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="backup-verify") as pool:
+            pending = set()
+            remaining = iter(pairs)
+            while True:
+                while not stop.is_set() and len(pending) < self.max_workers * 2:
+                    pair = next(remaining, None)
+                    if pair is None:
+                        break
+                    pending.add(pool.submit(compare, *pair))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    mismatch, hashed = future.result()
+                    bytes_hashed += hashed
+                    if mismatch:
+                        mismatches.append(mismatch)
+                        if self.fail_fast:
+                            stop.set()
+        return mismatches, bytes_hashed
+
+
+class SnapshotStore:
+    """Content-addressed snapshots: blobs/<aa>/<digest> plus manifests/<snapshot_id>.json"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.blobs_dir = self.root / "blobs"
+        self.manifests_dir = self.root / "manifests"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        self._buffer = bytearray(CHUNK_SIZE)
+
+    def snapshot(self, source_root: Path, label: str, files: Iterable[Path] = None) -> Dict[str, Any]:
+        """Record source_root (or just files under it); only new content is written"""
+        started = time.perf_counter()
+        source_root = Path(source_root)
+        if files is None:
+            entries = scan_tree(source_root)
+        else:
+            entries = {}
+            for file_path in files:
+                try:
+                    st = Path(file_path).stat()
+                except FileNotFoundError:
+                    continue
+                entries[os.path.relpath(file_path, source_root)] = (st.st_size, st.st_mtime_ns)
+
+        previous = self.latest(label)
+        previous_files = previous["files"] if previous else {}
+
+        manifest_files = {}
+        failed: List[Dict[str, str]] = []
+        new_digests: List[str] = []
+        bytes_written = rehashed = 0
+        for rel_path, (size, mtime_ns) in sorted(entries.items()):
+            known = previous_files.get(rel_path)
+            if known and known["size"] == size and known["mtime_ns"] == mtime_ns:
+                digest = known["digest"]
+            else:
+                # A file that vanishes or changes mid-copy is left out of this snapshot, not fatal to it
+                try:
+                    digest = blake2b_file(source_root / rel_path, self._buffer)
+                    rehashed += 1
+                    if not self.blob_path(digest).exists():
+                        self._store_blob(source_root / rel_path, digest)
+                        new_digests.append(digest)
+                        bytes_written += size
+                except OSError as e:
+                    failed.append({"path": rel_path, "reason": str(e)})
+                    continue
+            manifest_files[rel_path] = {"digest": digest, "size": size, "mtime_ns": mtime_ns}
+
+        created = datetime.now()
+        snapshot_id = f"{label}-{created.strftime(SNAPSHOT_TIME_FORMAT)}"
+        manifest = {
+            "snapshot_id": snapshot_id,
+            "label": label,
+            "created": created.isoformat(),
+            "source_root": str(source_root),
+            "files": manifest_files,
+            "failed": failed
+        }
+        tmp_path = self.manifests_dir / f".{snapshot_id}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, self.manifests_dir / f"{snapshot_id}.json")
+
+        return {
+            "snapshot_id": snapshot_id,
+            "files": len(manifest_files),
+            "total_bytes": sum(entry["size"] for entry in manifest_files.values()),
+            "rehashed": rehashed,
+            "new_blobs": len(new_digests),
+            "new_digests": new_digests,
+            "bytes_written": bytes_written,
+            "failed": failed,
+            "elapsed_sec": round(time.perf_counter() - started, 3)
+        }
+
+    def restore(self, snapshot_id: str, target_dir: Path, paths: Iterable[str] = None) -> int:
+        """Write a snapshot's files (or a subset) under target_dir; returns files restored"""
+        manifest = self.load(snapshot_id)
+        wanted = set(paths) if paths is not None else None
+        target_dir = Path(target_dir)
+        restored = 0
+        for rel_path, entry in manifest["files"].items():
+            if wanted is not None and rel_path not in wanted:
+                continue
+            target = target_dir / rel_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(f".{target.name}.restore")
+            shutil.copyfile(self.blob_path(entry["digest"]), tmp_path)
+            os.utime(tmp_path, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            os.replace(tmp_path, target)
+            restored += 1
+        return restored
+
+    def verify(self, snapshot_id: str, rehash: Union[bool, Iterable[str]] = True,
+               max_workers: int = 4) -> Dict[str, Any]:
+        """Check every blob a snapshot references: present, right size and (with rehash) right BLAKE2b,
+        hashed in parallel with one chunk buffer per worker (see BackupVerifier).
+        rehash may also be a set of digests, e.g. a snapshot's new_digests, to hash only those"""
+        started = time.perf_counter()
+        manifest = self.load(snapshot_id)
+        blobs = {entry["digest"]: entry["size"] for entry in manifest["files"].values()}
+        selected = None if isinstance(rehash, bool) else set(rehash)
+
+        missing, corrupt, to_hash = [], [], []
+        for digest, size in sorted(blobs.items()):
+            try:
+                if self.blob_path(digest).stat().st_size != size:
+                    corrupt.append(digest)
+                elif rehash is True or (selected is not None and digest in selected):
+                    to_hash.append(digest)
+            except FileNotFoundError:
+                missing.append(digest)
+
+        verifier = BackupVerifier(max_workers=max_workers)
+        for digest, actual in verifier.digest_many((digest, self.blob_path(digest)) for digest in to_hash):
+            if actual != digest:
+                corrupt.append(digest)
+        bytes_hashed = sum(blobs[digest] for digest in to_hash)
+
+        return {
+            "snapshot_id": snapshot_id,
+            "ok": not missing and not corrupt,
+            "files": len(manifest["files"]),
+            "blobs": len(blobs),
+            "rehashed": len(to_hash),
+            "missing": missing,
+            "corrupt": corrupt,
+            "bytes_hashed": bytes_hashed,
+            "elapsed_sec": round(time.perf_counter() - started, 3)
+        }
+
+    def list_snapshots(self, label: str = None) -> List[str]:
+        """Snapshot ids, oldest first (label must match exactly, so "phase2" excludes "phase2b")"""
+        if not label:
+            return sorted(path.stem for path in self.manifests_dir.glob("*.json"))
+        snapshot_id = re.compile(f"{re.escape(label)}-{SNAPSHOT_TIME_PATTERN}")
+        return sorted(path.stem for path in self.manifests_dir.glob("*.json")
+                      if snapshot_id.fullmatch(path.stem))
+
+    def latest(self, label: str) -> Optional[Dict[str, Any]]:
+        snapshots = self.list_snapshots(label)
+        return self.load(snapshots[-1]) if snapshots else None
+
+    def load(self, snapshot_id: str) -> Dict[str, Any]:
+        with open(self.manifests_dir / f"{snapshot_id}.json") as f:
+            return json.load(f)
+
+    def prune(self, label: str, keep: int = 10) -> int:
+        """Drop all but the newest keep snapshots of label, then unreferenced blobs"""
+        for snapshot_id in self.list_snapshots(label)[:-keep or None]:
+            (self.manifests_dir / f"{snapshot_id}.json").unlink()
+
+        referenced = set()
+        for snapshot_id in self.list_snapshots():
+            referenced.update(entry["digest"] for entry in self.load(snapshot_id)["files"].values())
+        removed = 0
+        for blob in self.blobs_dir.glob("*/*"):
+            if blob.name not in referenced:
+                blob.unlink()
+                removed += 1
+        return removed
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blobs_dir / digest[:2] / digest
+
+    def _store_blob(self, source: Path, digest: str):
+        """Copy into the store, re-hash the copy, then publish it under its digest"""
+        blob = self.blob_path(digest)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = blob.with_name(f".{digest}.tmp")
+        shutil.copyfile(source, tmp_path)
+        if blake2b_file(tmp_path, self._buffer) != digest:
+            tmp_path.unlink()
+            raise IOError(f"{source} changed while being backed up")
+        os.replace(tmp_path, blob)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CLAUDAE backup tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    verify = commands.add_parser("verify", help="Verify a backup tree against its original")
+    verify.add_argument("original")
+    verify.add_argument("backup")
+    verify.add_argument("--workers", type=int, default=4)
+    verify.add_argument("--fail-fast", action="store_true", help="Stop at the first mismatch")
+    verify.add_argument("--trust-mtime", action="store_true", help="Skip files with equal size and mtime")
+
+    snap = commands.add_parser("snapshot", help="Snapshot a directory into a store")
+    snap.add_argument("store")
+    snap.add_argument("source")
+    snap.add_argument("--label", default="manual")
+
+    restore = commands.add_parser("restore", help="Restore a snapshot into a directory")
+    restore.add_argument("store")
+    restore.add_argument("snapshot_id")
+    restore.add_argument("target")
+
+    check = commands.add_parser("check", help="Re-hash every blob a snapshot references")
+    check.add_argument("store")
+    check.add_argument("snapshot_id")
+    check.add_argument("--stat-only", action="store_true", help="Only check blobs exist with the right size")
+    check.add_argument("--workers", type=int, default=4)
+
+    listing = commands.add_parser("list", help="List snapshots in a store")
+    listing.add_argument("store")
+    listing.add_argument("--label")
+    args = parser.parse_args()
+
+    if args.command == "verify":
+        verifier = BackupVerifier(max_workers=args.workers, fail_fast=args.fail_fast, trust_mtime=args.trust_mtime)
+        report = verifier.verify(Path(args.original), Path(args.backup))
+        print(f"{'✅' if report['ok'] else '❌'} {report['files']} files, {report['hashed']} hashed, "
+              f"{report['mismatch_count']} mismatches in {report['elapsed_sec']}s "
+              f"({report['bytes_per_sec'] / 1024 / 1024:.1f} MB/s)")
+        for mismatch in report["mismatches"]:
+            print(f"   {mismatch['path']}: {mismatch['reason']}")
+    elif args.command == "snapshot":
+        result = SnapshotStore(Path(args.store)).snapshot(Path(args.source), args.label)
+        print(f"📸 {result['snapshot_id']}: {result['files']} files, {result['new_blobs']} new blobs "
+              f"({result['bytes_written']} bytes written) in {result['elapsed_sec']}s")
+        for failure in result["failed"]:
+            print(f"   ⚠️ skipped {failure['path']}: {failure['reason']}")
+    elif args.command == "restore":
+        restored = SnapshotStore(Path(args.store)).restore(args.snapshot_id, Path(args.target))
+        print(f"✅ Restored {restored} files to {args.target}")
+    elif args.command == "check":
+        report = SnapshotStore(Path(args.store)).verify(args.snapshot_id, rehash=not args.stat_only,
+                                                        max_workers=args.workers)
+        print(f"{'✅' if report['ok'] else '❌'} {report['snapshot_id']}: {report['blobs']} blobs, "
+              f"{len(report['missing'])} missing, {len(report['corrupt'])} corrupt in {report['elapsed_sec']}s")
+    else:
+        for snapshot_id in SnapshotStore(Path(args.store)).list_snapshots(args.label):
+            print(snapshot_id)
@@ -18,14 +18,15 @@ import os
 import json
 import asyncio
 import logging
-import requests
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import queue
 
+from ai_family.llm_telemetry import post_generate
+from ai_family.generated_files import write_json_if_changed, is_generated
+
 class CleanCLAUDAESystem:
     """Clean autonomous learning system - monitors user code only"""
     
@@ -126,6 +127,10 @@ class CleanCLAUDAESystem:
         """
         file_str = str(file_path)
         
+        # Skip anything written by the generated-file writer since its last user edit
+        if is_generated(file_path):
+            return False
+        
         # Skip system outputs that create loops
         system_output_patterns = [
             'claudae_foundation/autonomous_learning/',      # Our own outputs
@@ -307,8 +312,7 @@ Focus on learning from the USER'S development decisions and patterns."""
                 
                 # Save session status
                 status_file = self.learning_dir / "clean_session_status.json"
-                with open(status_file, 'w') as f:
-                    json.dump(session_status, f, indent=2)
+                write_json_if_changed(status_file, session_status, ignore_keys=("last_update",))
                 
                 # Log progress periodically
                 if len(self.session_learnings) > 0 and len(self.session_learnings) % 5 == 0:
@@ -373,8 +377,7 @@ Focus on learning from the USER'S development decisions and patterns."""
             
             # Save handoff
             handoff_file = self.learning_dir / f"CLEAN_HANDOFF_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(handoff_file, 'w') as f:
-                json.dump(handoff_data, f, indent=2)
+            write_json_if_changed(handoff_file, handoff_data)
             
             self.logger.info("✅ Clean handoff generated successfully!")
             self.logger.info(f"📄 Handoff file: {handoff_file.name}")
@@ -390,9 +393,10 @@ Focus on learning from the USER'S development decisions and patterns."""
     async def query_claudae(self, prompt: str) -> Optional[Dict[str, Any]]:
         """Query CLAUDAE with clean error handling"""
         try:
-            response = requests.post(
+            response = post_generate(
+                "clean_autonomous",
                 self.claudae_url,
-                json={
+                {
                     "model": self.claudae_model,
                     "prompt": prompt,
                     "stream": False
@@ -428,9 +432,12 @@ class CleanFileMonitor(FileSystemEventHandler):
         self.watch_path = watch_path
         self.change_queue = change_queue
         self.logger = logger
-        self.observer = Observer()
+        self.observer = None
         
     def start(self):
+        from watchdog.observers import Observer  # picks and loads the platform backend, so only when watching starts
+        
+        self.observer = Observer()
         self.observer.schedule(self, str(self.watch_path), recursive=True)
         self.observer.start()
         self.logger.info(f"📁 Clean file monitoring started: {self.watch_path}")
@@ -17,16 +17,20 @@ Status: Foundation Phase - SAFE DEPLOYMENT
 import os
 import json
 import time
-import hashlib
 import asyncio
 import logging
-import shutil
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
-import requests
+
+REQUIRED_PACKAGES = ["watchdog", "requests"]
+# Passing static checks (structure, dependencies) are reused until their inputs change or this expires
+VALIDATION_CACHE_TTL = 24 * 3600
+VALIDATION_TIMEOUT_MARGIN = 5  # seconds on top of a validator's own worst case
 
 # Configure comprehensive logging
 def setup_logging(log_dir: Path):
@@ -75,7 +79,13 @@ class CLAUDAEFoundationSystem:
         self.logger.info(f"Foundation dir: {self.foundation_dir}")
     
     async def run_comprehensive_validation(self) -> Dict[str, Any]:
-        """Run comprehensive system validation before any deployment"""
+        """Run comprehensive system validation before any deployment
+        
+        Validators run on a dedicated thread pool. A thread cannot be cancelled, so a validator that
+        overruns its timeout is abandoned: the pool is shut down without waiting and the report is
+        returned straight away. Each validator's own I/O timeouts (HTTP, subprocess) bound how long
+        such a thread lingers, and the process waits for it only at exit.
+        """
         self.logger.info("🔍 Starting comprehensive system validation...")
         
         validation_results = {
@@ -85,40 +95,73 @@ class CLAUDAEFoundationSystem:
             "ready_for_deployment": False
         }
         
-        # Validation sequence
-        validations = [
-            self._validate_environment,
-            self._validate_claudae_connection,
-            self._validate_project_structure,
-            self._validate_existing_documentation,
-            self._validate_git_repository,
-            self._validate_dependencies,
-            self._validate_permissions
-        ]
+        specs = self._validator_specs()
+        cache = self._load_validation_cache()
+        tasks = {}
+        # Not the loop's default executor, which asyncio.run() joins - a hung validator would block it
+        pool = ThreadPoolExecutor(max_workers=len(specs), thread_name_prefix="validation")
+        loop = asyncio.get_running_loop()
         
-        all_passed = True
-        for validation_func in validations:
+        async def run(name):
+            validator, timeout, depends_on, cache_key = specs[name]
+            component = name.replace("_", " ").title()
+            for dependency in depends_on:
+                if not (await tasks[dependency]).status:
+                    return SystemValidation(
+                        component=component,
+                        status=False,
+                        message=f"Skipped: {dependency} validation failed",
+                        timestamp=datetime.now().isoformat()
+                    )
+            
+            key = cache_key() if cache_key else None
+            cached = cache.get(name)
+            if key is not None and cached and cached["key"] == key and time.time() - cached["at"] < VALIDATION_CACHE_TTL:
+                result = SystemValidation(**cached["result"])
+                result.details = dict(result.details or {}, cached=True)
+                return result
+            
+            # Validators block (HTTP, subprocess, rglob), so each runs in its own thread
+            started = time.perf_counter()
             try:
-                result = await validation_func()
-                self.validations.append(result)
-                validation_results["validations"].append(asdict(result))
-                
-                if result.status:
-                    self.logger.info(f"✅ {result.component}: {result.message}")
-                else:
-                    self.logger.error(f"❌ {result.component}: {result.message}")
-                    all_passed = False
-                    
+                result = await asyncio.wait_for(loop.run_in_executor(pool, validator), timeout)
+            except asyncio.TimeoutError:
+                result = SystemValidation(
+                    component=component,
+                    status=False,
+                    message=f"Validation timed out after {timeout}s",
+                    timestamp=datetime.now().isoformat()
+                )
             except Exception as e:
-                error_result = SystemValidation(
-                    component=validation_func.__name__,
+                result = SystemValidation(
+                    component=component,
                     status=False,
                     message=f"Validation error: {str(e)}",
                     timestamp=datetime.now().isoformat()
                 )
-                self.validations.append(error_result)
-                validation_results["validations"].append(asdict(error_result))
-                self.logger.error(f"❌ {validation_func.__name__}: {str(e)}")
+            result.details = dict(result.details or {}, duration_sec=round(time.perf_counter() - started, 3))
+            
+            if key is not None and result.status:
+                cache[name] = {"key": key, "at": time.time(), "result": asdict(result)}
+            return result
+        
+        for name in specs:
+            tasks[name] = asyncio.create_task(run(name))
+        try:
+            results = await asyncio.gather(*tasks.values())
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._save_validation_cache(cache)
+        
+        all_passed = True
+        for result in results:
+            self.validations.append(result)
+            validation_results["validations"].append(asdict(result))
+            
+            if result.status:
+                self.logger.info(f"✅ {result.component}: {result.message}")
+            else:
+                self.logger.error(f"❌ {result.component}: {result.message}")
                 all_passed = False
         
         validation_results["overall_status"] = all_passed
@@ -133,7 +176,47 @@ class CLAUDAEFoundationSystem:
         self.logger.info(f"🎯 Validation complete: {'READY' if all_passed else 'NOT READY'}")
         return validation_results
     
-    async def _validate_environment(self) -> SystemValidation:
+    def _validator_specs(self) -> Dict[str, Tuple[Any, float, Tuple[str, ...], Any]]:
+        """name -> (validator, timeout seconds, validators it depends on, cache key function or None)"""
+        return {
+            "environment": (self._validate_environment, 5, (), None),
+            "claudae_connection": (self._validate_claudae_connection, self._claudae_connection_timeout(), (), None),
+            "project_structure": (self._validate_project_structure, 5, (), self._structure_cache_key),
+            "existing_documentation": (self._validate_existing_documentation, 60, ("project_structure",), None),
+            "git_repository": (self._validate_git_repository, 15, (), None),
+            "dependencies": (self._validate_dependencies, 10, (), self._dependencies_cache_key),
+            "permissions": (self._validate_permissions, 5, (), None)
+        }
+    
+    def _claudae_connection_timeout(self) -> float:
+        """The probe's own worst case for a generate check, so its timeout fires before ours"""
+        try:
+            from ai_family.ollama_probe import get_probe
+        except ImportError:
+            return VALIDATION_TIMEOUT_MARGIN  # the validator fails on the same import
+        return get_probe().max_check_sec(generate=True) + VALIDATION_TIMEOUT_MARGIN
+    
+    def _structure_cache_key(self) -> List[Any]:
+        """Adding or removing a top-level directory changes the project root's mtime"""
+        return [str(self.project_root), self.project_root.stat().st_mtime_ns]
+    
+    def _dependencies_cache_key(self) -> List[Any]:
+        """Installs and removals change the site-packages directory mtimes"""
+        site_dirs = [p for p in sys.path if p.endswith("site-packages") and os.path.isdir(p)]
+        return [sys.executable, REQUIRED_PACKAGES] + [os.stat(p).st_mtime_ns for p in site_dirs]
+    
+    def _load_validation_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.foundation_dir / "validation_cache.json") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+    
+    def _save_validation_cache(self, cache: Dict[str, Any]):
+        with open(self.foundation_dir / "validation_cache.json", 'w') as f:
+            json.dump(cache, f, indent=2)
+    
+    def _validate_environment(self) -> SystemValidation:
         """Validate the basic environment"""
         try:
             # Check project directory
@@ -180,12 +263,13 @@ class CLAUDAEFoundationSystem:
                 timestamp=datetime.now().isoformat()
             )
     
-    async def _validate_claudae_connection(self) -> SystemValidation:
+    def _validate_claudae_connection(self) -> SystemValidation:
         """Validate CLAUDAE (Ollama) connection and model availability"""
         try:
-            # Check Ollama service
-            response = requests.get("http://localhost:11434/api/tags", timeout=10)
-            if response.status_code != 200:
+            from ai_family.ollama_probe import get_probe
+            
+            check = get_probe().check("mistral:7b", generate=True)
+            if not check["online"]:
                 return SystemValidation(
                     component="CLAUDAE Connection",
                     status=False,
@@ -193,15 +277,7 @@ class CLAUDAEFoundationSystem:
                     timestamp=datetime.now().isoformat()
                 )
             
-            # Check for mistral:7b model
-            models = response.json()
-            mistral_found = False
-            for model in models.get("models", []):
-                if "mistral:7b" in model.get("name", ""):
-                    mistral_found = True
-                    break
-            
-            if not mistral_found:
+            if not check["installed"]:
                 return SystemValidation(
                     component="CLAUDAE Connection",
                     status=False,
@@ -209,32 +285,20 @@ class CLAUDAEFoundationSystem:
                     timestamp=datetime.now().isoformat()
                 )
             
-            # Test basic CLAUDAE query
-            test_response = requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": "mistral:7b",
-                    "prompt": "Respond with 'CLAUDAE OPERATIONAL' if you can understand this.",
-                    "stream": False
-                },
-                timeout=30
-            )
-            
-            if test_response.status_code == 200:
-                result = test_response.json()
-                if "operational" in result.get("response", "").lower():
-                    return SystemValidation(
-                        component="CLAUDAE Connection",
-                        status=True,
-                        message="CLAUDAE connection validated successfully",
-                        timestamp=datetime.now().isoformat(),
-                        details={"model": "mistral:7b", "response_time": "OK"}
-                    )
+            if check["responding"]:
+                return SystemValidation(
+                    component="CLAUDAE Connection",
+                    status=True,
+                    message="CLAUDAE connection validated successfully",
+                    timestamp=datetime.now().isoformat(),
+                    details={"model": "mistral:7b", "loaded": check["loaded"],
+                             "generate_sec": check.get("generate_sec"), "cached": check["cached"]}
+                )
             
             return SystemValidation(
                 component="CLAUDAE Connection",
                 status=False,
-                message="CLAUDAE test query failed",
+                message=f"CLAUDAE test query failed: {check['error']}",
                 timestamp=datetime.now().isoformat()
             )
             
@@ -246,7 +310,7 @@ class CLAUDAEFoundationSystem:
                 timestamp=datetime.now().isoformat()
             )
     
-    async def _validate_project_structure(self) -> SystemValidation:
+    def _validate_project_structure(self) -> SystemValidation:
         """Validate existing project structure"""
         try:
             required_dirs = [
@@ -284,22 +348,21 @@ class CLAUDAEFoundationSystem:
                 timestamp=datetime.now().isoformat()
             )
     
-    async def _validate_existing_documentation(self) -> SystemValidation:
+    def _validate_existing_documentation(self) -> SystemValidation:
         """Validate existing documentation without modifying it"""
         try:
-            doc_patterns = ["*.md", "*.json", "*.yaml", "*.yml"]
+            doc_suffixes = {".md", ".json", ".yaml", ".yml"}
             total_docs = 0
             total_size = 0
             doc_types = {}
             
-            for pattern in doc_patterns:
-                docs = list(self.project_root.rglob(pattern))
-                for doc in docs:
-                    if doc.is_file():
-                        total_docs += 1
-                        total_size += doc.stat().st_size
-                        ext = doc.suffix.lower()
-                        doc_types[ext] = doc_types.get(ext, 0) + 1
+            # One walk of the tree instead of one per pattern
+            for doc in self.project_root.rglob("*"):
+                ext = doc.suffix.lower()
+                if ext in doc_suffixes and doc.is_file():
+                    total_docs += 1
+                    total_size += doc.stat().st_size
+                    doc_types[ext] = doc_types.get(ext, 0) + 1
             
             if total_docs == 0:
                 return SystemValidation(
@@ -329,7 +392,7 @@ class CLAUDAEFoundationSystem:
                 timestamp=datetime.now().isoformat()
             )
     
-    async def _validate_git_repository(self) -> SystemValidation:
+    def _validate_git_repository(self) -> SystemValidation:
         """Validate Git repository status"""
         try:
             # Check if git repo exists
@@ -347,7 +410,8 @@ class CLAUDAEFoundationSystem:
                 ["git", "status", "--porcelain"],
                 cwd=self.project_root,
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=10
             )
             
             if result.returncode != 0:
@@ -380,13 +444,12 @@ class CLAUDAEFoundationSystem:
                 timestamp=datetime.now().isoformat()
             )
     
-    async def _validate_dependencies(self) -> SystemValidation:
+    def _validate_dependencies(self) -> SystemValidation:
         """Validate required dependencies"""
         try:
-            required_packages = ["watchdog", "requests"]
             missing_packages = []
             
-            for package in required_packages:
+            for package in REQUIRED_PACKAGES:
                 try:
                     __import__(package)
                 except ImportError:
@@ -405,7 +468,7 @@ class CLAUDAEFoundationSystem:
                 status=True,
                 message="All dependencies validated successfully",
                 timestamp=datetime.now().isoformat(),
-                details={"validated_packages": required_packages}
+                details={"validated_packages": REQUIRED_PACKAGES}
             )
             
         except Exception as e:
@@ -416,7 +479,7 @@ class CLAUDAEFoundationSystem:
                 timestamp=datetime.now().isoformat()
             )
     
-    async def _validate_permissions(self) -> SystemValidation:
+    def _validate_permissions(self) -> SystemValidation:
         """Validate file and directory permissions"""
         try:
             # Check write permissions
@@ -464,8 +527,10 @@ class CLAUDAEFoundationSystem:
         """Create comprehensive backup system BEFORE any changes"""
         self.logger.info("🛡️ Creating bulletproof backup system...")
         
-        backup_dir = self.foundation_dir / "original_state_backup"
-        backup_dir.mkdir(exist_ok=True)
+        backup_dir = self.foundation_dir / "snapshots"
+        from claudae_backup import SnapshotStore
+        
+        store = SnapshotStore(backup_dir)
         
         backup_report = {
             "start_time": datetime.now().isoformat(),
@@ -477,26 +542,29 @@ class CLAUDAEFoundationSystem:
         }
         
         try:
-            # Copy entire project_memory directory
+            # Snapshot project_memory (only content not already in the store is written)
             if self.memory_dir.exists():
-                memory_backup = backup_dir / "project_memory"
-                shutil.copytree(self.memory_dir, memory_backup, dirs_exist_ok=True)
-                
-                # Count files and calculate size
-                for file_path in memory_backup.rglob("*"):
-                    if file_path.is_file():
-                        backup_report["files_backed_up"] += 1
-                        backup_report["total_size_mb"] += file_path.stat().st_size / 1024 / 1024
-                
-                backup_report["total_size_mb"] = round(backup_report["total_size_mb"], 2)
+                snapshot = store.snapshot(self.memory_dir, label="project_memory")
+                backup_report["snapshot_id"] = snapshot["snapshot_id"]
+                backup_report["files_backed_up"] = snapshot["files"]
+                backup_report["total_size_mb"] = round(snapshot["total_bytes"] / 1024 / 1024, 2)
+                backup_report["new_blobs"] = snapshot["new_blobs"]
+                backup_report["written_mb"] = round(snapshot["bytes_written"] / 1024 / 1024, 2)
                 
-                # Verify backup integrity
-                backup_report["backup_verification"] = self._verify_backup_integrity(
-                    self.memory_dir, memory_backup
-                )
-                backup_report["backup_integrity"] = backup_report["backup_verification"]
+                self.logger.info(f"✅ Snapshot {snapshot['snapshot_id']}: {snapshot['files']} files "
+                                 f"({backup_report['total_size_mb']} MB, {backup_report['written_mb']} MB new) "
+                                 f"in {snapshot['elapsed_sec']}s")
                 
-                self.logger.info(f"✅ Backup created: {backup_report['files_backed_up']} files ({backup_report['total_size_mb']} MB)")
+                # Blobs reused from earlier snapshots were hashed when first written: stat them, hash only new ones
+                verification = store.verify(snapshot["snapshot_id"], rehash=snapshot["new_digests"])
+                backup_report["backup_verification"] = not verification["missing"]
+                backup_report["backup_integrity"] = verification["ok"]
+                backup_report["missing_blobs"] = len(verification["missing"])
+                backup_report["corrupt_blobs"] = len(verification["corrupt"])
+                if not verification["ok"]:
+                    self.logger.error(f"❌ Snapshot {snapshot['snapshot_id']} failed verification: "
+                                      f"{len(verification['missing'])} missing, "
+                                      f"{len(verification['corrupt'])} corrupt blobs")
             
             # Create git commit for current state
             try:
@@ -519,7 +587,8 @@ class CLAUDAEFoundationSystem:
                 self.logger.warning("⚠️ Git commit failed (may be no changes)")
             
             backup_report["end_time"] = datetime.now().isoformat()
-            backup_report["success"] = True
+            # A snapshot that fails verification is no safety net for the steps that follow
+            backup_report["success"] = backup_report["backup_integrity"] or "snapshot_id" not in backup_report
             
             # Save backup report
             report_file = backup_dir / "backup_report.json"
@@ -534,33 +603,6 @@ class CLAUDAEFoundationSystem:
             self.logger.error(f"❌ Backup creation failed: {e}")
             return backup_report
     
-    def _verify_backup_integrity(self, original_dir: Path, backup_dir: Path) -> bool:
-        """Verify backup integrity by comparing file hashes"""
-        try:
-            original_files = {}
-            backup_files = {}
-            
-            # Hash original files
-            for file_path in original_dir.rglob("*"):
-                if file_path.is_file():
-                    rel_path = file_path.relative_to(original_dir)
-                    with open(file_path, 'rb') as f:
-                        original_files[str(rel_path)] = hashlib.md5(f.read()).hexdigest()
-            
-            # Hash backup files
-            for file_path in backup_dir.rglob("*"):
-                if file_path.is_file():
-                    rel_path = file_path.relative_to(backup_dir)
-                    with open(file_path, 'rb') as f:
-                        backup_files[str(rel_path)] = hashlib.md5(f.read()).hexdigest()
-            
-            # Compare
-            return original_files == backup_files
-            
-        except Exception as e:
-            self.logger.error(f"Backup verification failed: {e}")
-            return False
-    
     async def setup_foundation_infrastructure(self) -> Dict[str, Any]:
         """Setup foundation infrastructure without touching existing docs"""
         self.logger.info("🏗️ Setting up foundation infrastructure...")
@@ -18,15 +18,20 @@ import json
 import time
 import asyncio
 import logging
-import requests
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import threading
 import queue
 
+from ai_family.llm_telemetry import post_generate, record_metrics
+from ai_family.generated_files import write_json_if_changed, is_generated
+
+HANDOFF_INTERVAL_SEC = 15 * 60  # one learning cycle, closed by each periodic handoff
+CYCLE_INSIGHTS = 5              # insights per cycle passed to CLAUDAE
+HANDOFF_CYCLES = 8              # most recent cycle summaries quoted in the final handoff
+
 class IntegratedCLAUDAESystem:
     """Integrated system combining learning and documentation"""
     
@@ -61,6 +66,12 @@ class IntegratedCLAUDAESystem:
         self.session_learnings = []
         self.significant_changes = []
         
+        # Hierarchical summaries: one cached mini-summary per learning cycle plus a rolling session summary
+        self.cycle_summaries: List[Dict[str, Any]] = []
+        self.cycle_start_index = 0
+        self.session_summary = ""
+        self.cycle_file = self.learning_dir / f"cycle_summaries_{self.session_start.strftime('%Y%m%d_%H%M%S')}.json"
+        
         # CLAUDAE connection
         self.claudae_url = "http://localhost:11434/api/generate"
         self.claudae_model = "mistral:7b"
@@ -92,13 +103,14 @@ class IntegratedCLAUDAESystem:
         learning_task = asyncio.create_task(self.process_learning())
         documentation_task = asyncio.create_task(self.process_documentation())
         session_task = asyncio.create_task(self.manage_session())
+        handoff_task = asyncio.create_task(self.schedule_periodic_handoffs())
         
         self.logger.info("✅ Integrated system active!")
         self.logger.info("🧠 CLAUDAE learning from every change...")
         self.logger.info("📝 Documentation updating automatically...")
         
         try:
-            await asyncio.gather(learning_task, documentation_task, session_task)
+            await asyncio.gather(learning_task, documentation_task, session_task, handoff_task)
         except KeyboardInterrupt:
             self.logger.info("🛑 Shutting down integrated system...")
             file_monitor.stop()
@@ -302,8 +314,7 @@ Provide response in JSON format:
             
             # Save update plan
             update_file = self.learning_dir / f"doc_update_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(update_file, 'w') as f:
-                json.dump(updates_log, f, indent=2)
+            write_json_if_changed(update_file, updates_log)
             
             self.logger.info(f"📋 Documentation update plan saved: {update_file.name}")
             
@@ -392,24 +403,98 @@ Provide response in JSON format:
                     "last_update": datetime.now().isoformat()
                 }
                 
+                record_metrics({
+                    "learner_queue:integrated:changes": self.change_queue.qsize(),
+                    "learner_queue:integrated:documentation": self.doc_update_queue.qsize()
+                })
+                
                 # Save session status
                 status_file = self.learning_dir / "current_session_status.json"
-                with open(status_file, 'w') as f:
-                    json.dump(current_status, f, indent=2)
-                
-                # Generate periodic handoff if significant activity
-                if (len(self.significant_changes) > 0 and 
-                    session_duration % 15 < 1):  # Every 15 minutes
-                    await self.generate_periodic_handoff()
+                write_json_if_changed(status_file, current_status, ignore_keys=("last_update",))
                     
             except Exception as e:
                 self.logger.error(f"Session management error: {e}")
     
+    async def schedule_periodic_handoffs(self):
+        """Close a learning cycle every HANDOFF_INTERVAL_SEC; intervals missed while busy are skipped, not replayed"""
+        next_run = time.monotonic() + HANDOFF_INTERVAL_SEC
+        while True:
+            await asyncio.sleep(max(0.0, next_run - time.monotonic()))
+            try:
+                await self.generate_periodic_handoff()
+            except Exception as e:
+                self.logger.error(f"Periodic handoff scheduling error: {e}")
+            while next_run <= time.monotonic():
+                next_run += HANDOFF_INTERVAL_SEC
+    
+    def _cycle_digest(self, learnings: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Bounded facts about one cycle's learnings"""
+        analyses = [l.get("claudae_analysis", {}) for l in learnings]
+        by_importance = sorted(analyses, key=lambda a: a.get("importance_score", 0), reverse=True)
+        categories: Dict[str, int] = {}
+        for analysis in analyses:
+            category = analysis.get("learning_category", "unknown")
+            categories[category] = categories.get(category, 0) + 1
+        
+        return {
+            "cycle_id": len(self.cycle_summaries) + 1,
+            "start": learnings[0]["timestamp"],
+            "end": learnings[-1]["timestamp"],
+            "learnings": len(learnings),
+            "significant": sum(1 for a in analyses if a.get("importance_score", 0) >= 0.7),
+            "categories": categories,
+            "patterns": sorted({a.get("development_pattern", "Unknown") for a in analyses})[:10],
+            "files": sorted({Path(l["file_path"]).name for l in learnings})[:10],
+            "architectural_changes": sorted({Path(l["file_path"]).name for l, a in zip(learnings, analyses)
+                                             if a.get("architectural_change")}),
+            "top_insights": [{"insight": a.get("key_insight"), "importance": a.get("importance_score", 0)}
+                             for a in by_importance[:CYCLE_INSIGHTS]]
+        }
+    
+    async def close_learning_cycle(self) -> Optional[Dict[str, Any]]:
+        """Summarise only the learnings since the last cycle and fold them into the rolling session summary"""
+        learnings = self.session_learnings[self.cycle_start_index:]
+        if not learnings:
+            return None
+        self.cycle_start_index = len(self.session_learnings)
+        cycle = self._cycle_digest(learnings)
+        
+        prompt = f"""You are CLAUDAE, keeping a running summary of a HONEY DUO WEALTH development session.
+
+SESSION SO FAR:
+{self.session_summary or "Session just started."}
+
+NEW LEARNING CYCLE:
+{json.dumps(cycle, indent=2)}
+
+Respond in JSON format:
+{{
+    "cycle_summary": "2-3 sentences on what this cycle accomplished",
+    "session_summary": "updated 3-5 sentence summary of the whole session"
+}}"""
+        
+        response = await self.query_claudae(prompt) or {}
+        cycle["summary"] = response.get("cycle_summary") or "; ".join(
+            str(i["insight"]) for i in cycle["top_insights"] if i["insight"])
+        self.session_summary = response.get("session_summary") or " ".join(
+            filter(None, [self.session_summary, cycle["summary"]]))[-2000:]
+        
+        self.cycle_summaries.append(cycle)
+        write_json_if_changed(self.cycle_file, {"session_summary": self.session_summary,
+                                                "cycles": self.cycle_summaries})
+        self.logger.info(f"🧩 Learning cycle {cycle['cycle_id']} summarised: {cycle['learnings']} learnings")
+        return cycle
+    
     async def generate_comprehensive_handoff(self):
         """Generate final comprehensive handoff with learning and documentation status"""
         try:
             self.logger.info("📋 Generating comprehensive final handoff...")
             
+            # Only the still-open cycle is summarised now; earlier cycles are merged from their cached summaries
+            await self.close_learning_cycle()
+            insights = sorted((i for c in self.cycle_summaries for i in c["top_insights"]),
+                              key=lambda i: i["importance"], reverse=True)
+            
             handoff_data = {
                 "session_summary": {
                     "duration_minutes": (datetime.now() - self.session_start).total_seconds() / 60,
@@ -419,10 +504,11 @@ Provide response in JSON format:
                     "documentation_updates_processed": len([l for l in self.session_learnings 
                                                           if l.get("claudae_analysis", {}).get("documentation_trigger")])
                 },
-                "learning_insights": [l.get("claudae_analysis", {}).get("key_insight") 
-                                    for l in self.session_learnings[-5:]],
-                "architectural_changes": [l for l in self.significant_changes 
-                                        if l.get("claudae_analysis", {}).get("architectural_change")],
+                "session_overview": self.session_summary,
+                "cycle_summaries": [{"cycle_id": c["cycle_id"], "end": c["end"], "summary": c["summary"]}
+                                    for c in self.cycle_summaries[-HANDOFF_CYCLES:]],
+                "learning_insights": [i["insight"] for i in insights[:CYCLE_INSIGHTS]],
+                "architectural_changes": sorted({f for c in self.cycle_summaries for f in c["architectural_changes"]}),
                 "documentation_status": "integrated_and_synchronized",
                 "next_session_priorities": [
                     "Continue integrated learning and documentation",
@@ -451,12 +537,11 @@ This handoff should eliminate any "getting up to speed" time."""
             
             # Save comprehensive handoff
             handoff_file = self.learning_dir / f"COMPREHENSIVE_HANDOFF_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(handoff_file, 'w') as f:
-                json.dump({
-                    "handoff_data": handoff_data,
-                    "claudae_handoff": handoff_content,
-                    "generation_time": datetime.now().isoformat()
-                }, f, indent=2)
+            write_json_if_changed(handoff_file, {
+                "handoff_data": handoff_data,
+                "claudae_handoff": handoff_content,
+                "generation_time": datetime.now().isoformat()
+            })
             
             self.logger.info("✅ Comprehensive handoff complete!")
             self.logger.info("🎯 Next session can continue seamlessly with full context")
@@ -467,17 +552,21 @@ This handoff should eliminate any "getting up to speed" time."""
     async def generate_periodic_handoff(self):
         """Generate periodic handoff for continuous documentation"""
         try:
-            # Similar to comprehensive but lighter weight
+            cycle = await self.close_learning_cycle()
+            if cycle is None or not self.significant_changes:
+                return
+            
             periodic_data = {
                 "timestamp": datetime.now().isoformat(),
+                "cycle": cycle,
+                "session_summary": self.session_summary,
+                "cycles_so_far": len(self.cycle_summaries),
                 "recent_changes": self.session_changes[-3:],
-                "recent_learnings": self.session_learnings[-2:],
                 "status": "active_development"
             }
             
             periodic_file = self.learning_dir / f"periodic_handoff_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
-            with open(periodic_file, 'w') as f:
-                json.dump(periodic_data, f, indent=2)
+            write_json_if_changed(periodic_file, periodic_data, ignore_keys=("timestamp",))
                 
         except Exception as e:
             self.logger.error(f"Periodic handoff error: {e}")
@@ -485,9 +574,10 @@ This handoff should eliminate any "getting up to speed" time."""
     async def query_claudae(self, prompt: str) -> Optional[Dict[str, Any]]:
         """Query CLAUDAE with enhanced error handling"""
         try:
-            response = requests.post(
+            response = post_generate(
+                "integrated_autonomous",
                 self.claudae_url,
-                json={
+                {
                     "model": self.claudae_model,
                     "prompt": prompt,
                     "stream": False
@@ -523,7 +613,7 @@ This handoff should eliminate any "getting up to speed" time."""
         ]
         
         file_str = str(file_path)
-        return any(pattern in file_str for pattern in skip_patterns)
+        return is_generated(file_path) or any(pattern in file_str for pattern in skip_patterns)
 
 
 class FileChangeMonitor(FileSystemEventHandler):
@@ -534,9 +624,12 @@ class FileChangeMonitor(FileSystemEventHandler):
         self.watch_path = watch_path
         self.change_queue = change_queue
         self.logger = logger
-        self.observer = Observer()
+        self.observer = None
         
     def start(self):
+        from watchdog.observers import Observer  # picks and loads the platform backend, so only when watching starts
+        
+        self.observer = Observer()
         self.observer.schedule(self, str(self.watch_path), recursive=True)
         self.observer.start()
         self.logger.info(f"📁 Integrated file monitoring started: {self.watch_path}")
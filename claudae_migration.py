@@ -17,15 +17,21 @@ Status: Phase 2 - DOCUMENT MIGRATION
 import os
 import json
 import time
-import hashlib
-import asyncio
 import logging
-import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
-import requests
+
+from ai_family.llm_telemetry import post_generate
+
+DOCUMENT_INDEX = "document_index.jsonl"
+PREVIEW_CHARS = 500
+ANALYSIS_CHARS = 2000  # CLAUDAE only ever sees the head of a document
+# "copy" (default): full copies with an embedded metadata header; "link" (opt-in): organized_docs entries
+# are hardlinks (symlinks across filesystems) to the originals, so editing one edits the original, and the
+# analysis lives only in the document index
+MIGRATION_MODES = ("copy", "link")
 
 # Configure logging
 def setup_logging(log_dir: Path):
@@ -107,9 +113,10 @@ Respond in this exact JSON format:
 """
         
         try:
-            response = requests.post(
+            response = post_generate(
+                "claudae_migration",
                 f"{self.base_url}/api/generate",
-                json={
+                {
                     "model": self.model,
                     "prompt": prompt,
                     "stream": False,
@@ -218,8 +225,11 @@ Respond in this exact JSON format:
 class CLAUDAEMigrationSystem:
     """Phase 2: Document migration with CLAUDAE intelligence"""
     
-    def __init__(self, project_root: str = "/home/honey-duo-wealth/honey_duo_wealth"):
+    def __init__(self, project_root: str = "/home/honey-duo-wealth/honey_duo_wealth", mode: str = "copy"):
+        if mode not in MIGRATION_MODES:
+            raise ValueError(f"Unknown migration mode: {mode}")
         self.project_root = Path(project_root)
+        self.mode = mode
         self.foundation_dir = self.project_root / "claudae_foundation"
         self.migration_dir = self.foundation_dir / "migration"
         self.memory_dir = self.project_root / "project_memory"
@@ -235,6 +245,7 @@ class CLAUDAEMigrationSystem:
         
         # Migration results
         self.migration_results: List[MigrationResult] = []
+        self.document_index: List[Dict[str, Any]] = []
         
         self.logger.info("🎯 CLAUDAE Migration System initializing...")
         self.logger.info(f"Migration directory: {self.migration_dir}")
@@ -268,8 +279,8 @@ class CLAUDAEMigrationSystem:
                 try:
                     self.logger.info(f"🔍 Processing: {doc_path}")
                     
-                    # Read document content
-                    content = doc_path.read_text(encoding='utf-8')
+                    # Read document content (only the analysed head unless the body is copied)
+                    content = self._read_document(doc_path)
                     
                     # Have CLAUDAE analyze the document
                     analysis = await self.claudae.analyze_document(str(doc_path), content)
@@ -309,8 +320,9 @@ class CLAUDAEMigrationSystem:
                     self.migration_results.append(error_result)
                     migration_report["migration_results"].append(asdict(error_result))
             
-            # Step 4: Create migration summary
+            # Step 4: Create migration summary and the per-document index read by the review generator
             await self._create_migration_summary()
+            self._save_document_index()
             
             migration_report["end_time"] = datetime.now().isoformat()
             migration_report["success"] = migration_report["documents_migrated"] > 0
@@ -348,23 +360,20 @@ class CLAUDAEMigrationSystem:
         return documents
     
     async def _create_phase2_backup(self):
-        """Create additional backup before Phase 2 migration"""
-        backup_dir = self.migration_dir / "phase2_backup"
-        backup_dir.mkdir(exist_ok=True)
+        """Snapshot all discovered documents before Phase 2 migration (unchanged content is not copied again)"""
+        from claudae_backup import SnapshotStore
         
-        # Copy all discovered documents
-        for doc_path in self._discover_documents():
-            try:
-                # Create backup path preserving directory structure
-                rel_path = doc_path.relative_to(self.project_root)
-                backup_path = backup_dir / rel_path
-                backup_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                shutil.copy2(doc_path, backup_path)
-            except Exception as e:
-                self.logger.warning(f"Failed to backup {doc_path}: {e}")
+        store = SnapshotStore(self.foundation_dir / "snapshots")
+        snapshot = store.snapshot(self.project_root, label="phase2", files=self._discover_documents())
         
-        self.logger.info(f"✅ Phase 2 backup created at {backup_dir}")
+        for failure in snapshot["failed"]:
+            self.logger.warning(f"⚠️ Could not back up {failure['path']}: {failure['reason']}")
+        if snapshot["failed"] and not snapshot["files"]:
+            raise IOError(f"Phase 2 snapshot {snapshot['snapshot_id']} captured no documents")
+        
+        self.logger.info(f"✅ Phase 2 snapshot {snapshot['snapshot_id']}: {snapshot['files']} documents, "
+                         f"{snapshot['new_blobs']} new ({snapshot['bytes_written'] / 1024:.1f} KB written, "
+                         f"{len(snapshot['failed'])} skipped) in {snapshot['elapsed_sec']}s")
     
     async def _migrate_document(self, doc_path: Path, content: str, analysis: DocumentAnalysis) -> MigrationResult:
         """Migrate a single document with CLAUDAE's analysis"""
@@ -373,14 +382,18 @@ class CLAUDAEMigrationSystem:
             category_dir = self.migration_dir / "organized_docs" / analysis.content_type
             category_dir.mkdir(parents=True, exist_ok=True)
             
-            # Create migrated file with enhanced metadata
             migrated_path = category_dir / f"{doc_path.stem}_migrated{doc_path.suffix}"
             
-            # Enhanced document with CLAUDAE analysis
-            enhanced_content = self._create_enhanced_document(doc_path, content, analysis)
-            
-            # Write enhanced document
-            migrated_path.write_text(enhanced_content, encoding='utf-8')
+            if self.mode == "copy":
+                # Enhanced document with CLAUDAE analysis
+                enhanced_content = self._create_enhanced_document(doc_path, content, analysis)
+                if migrated_path.is_symlink() or migrated_path.exists():
+                    migrated_path.unlink()  # never write through a view left by link mode into the original
+                migrated_path.write_text(enhanced_content, encoding='utf-8')
+                view = "copy"
+            else:
+                view = self._link_document(doc_path, migrated_path)
+            self._index_document(doc_path, migrated_path, content, analysis, view)
             
             return MigrationResult(
                 original_path=str(doc_path),
@@ -398,6 +411,28 @@ class CLAUDAEMigrationSystem:
                 error_message=str(e)
             )
     
+    def _read_document(self, doc_path: Path) -> str:
+        """Full text in copy mode, otherwise just the head CLAUDAE analyses"""
+        if self.mode == "copy":
+            return doc_path.read_text(encoding='utf-8')
+        with open(doc_path, 'r', encoding='utf-8') as f:
+            return f.read(ANALYSIS_CHARS)
+    
+    def _link_document(self, doc_path: Path, view_path: Path) -> str:
+        """Point an organized_docs entry at the original without copying it"""
+        if view_path.is_symlink() and view_path.resolve() == doc_path.resolve():
+            return "symlink"
+        if view_path.exists() and not view_path.is_symlink() and os.path.samefile(view_path, doc_path):
+            return "hardlink"
+        if view_path.is_symlink() or view_path.exists():
+            view_path.unlink()
+        try:
+            os.link(doc_path, view_path)
+            return "hardlink"
+        except OSError:
+            view_path.symlink_to(doc_path.resolve())
+            return "symlink"
+    
     def _create_enhanced_document(self, doc_path: Path, content: str, analysis: DocumentAnalysis) -> str:
         """Create enhanced document with CLAUDAE analysis metadata"""
         
@@ -421,6 +456,35 @@ Migration Date: {datetime.now().isoformat()}
         
         return enhanced_content
     
+    def _index_document(self, doc_path: Path, migrated_path: Path, content: str, analysis: DocumentAnalysis,
+                        view: str):
+        """Record the analysis and a bounded preview so reviews never re-read migrated files"""
+        self.document_index.append({
+            "original_path": str(doc_path),
+            "migrated_path": str(migrated_path.relative_to(self.migration_dir / "organized_docs")),
+            "view": view,
+            "content_type": analysis.content_type,
+            "importance_score": analysis.importance_score,
+            "key_topics": analysis.key_topics,
+            "relationships": analysis.relationships,
+            "summary": analysis.summary,
+            "claudae_confidence": analysis.claudae_confidence,
+            "processing_time": round(analysis.processing_time, 2),
+            "size_bytes": doc_path.stat().st_size,
+            "preview": content[:PREVIEW_CHARS],
+            "truncated": len(content) > PREVIEW_CHARS,
+            "migrated_at": datetime.now().isoformat()
+        })
+    
+    def _save_document_index(self):
+        """Write the document index as one JSON object per line, ordered by category and file name"""
+        self.document_index.sort(key=lambda entry: entry["migrated_path"])
+        with open(self.migration_dir / DOCUMENT_INDEX, 'w', encoding='utf-8') as f:
+            for entry in self.document_index:
+                f.write(json.dumps(entry) + "\n")
+        
+        self.logger.info(f"✅ Document index written: {len(self.document_index)} entries")
+    
     async def _create_migration_summary(self):
         """Create comprehensive migration summary"""
         summary = {
@@ -464,7 +528,7 @@ Migration Date: {datetime.now().isoformat()}
         self.logger.info("✅ Migration summary created")
 
 # CLI Interface for Phase 2
-async def main():
+async def main(mode: str = "copy"):
     """Main execution for Phase 2 migration"""
     print("🔄 CLAUDAE Memory System - Phase 2: Document Migration")
     print("=" * 60)
@@ -476,7 +540,7 @@ async def main():
     print()
     
     # Initialize migration system
-    migration = CLAUDAEMigrationSystem()
+    migration = CLAUDAEMigrationSystem(mode=mode)
     
     # Run migration
     print("🔄 Starting CLAUDAE-powered document migration...")
@@ -497,6 +561,7 @@ async def main():
         print("📁 Migration results available at:")
         print("   - claudae_foundation/migration/migration_report.json")
         print("   - claudae_foundation/migration/migration_summary.json")
+        print(f"   - claudae_foundation/migration/{DOCUMENT_INDEX}")
         print("   - claudae_foundation/migration/organized_docs/")
         print()
         print("✅ Ready for Phase 3: Automated Processing")
@@ -512,5 +577,13 @@ async def main():
 
 if __name__ == "__main__":
     import sys
-    success = asyncio.run(main())
+    import argparse
+    parser = argparse.ArgumentParser(description="CLAUDAE Phase 2 document migration")
+    parser.add_argument("--mode", choices=MIGRATION_MODES, default="copy",
+                        help="copy (default): full copies with a metadata header; "
+                             "link: organized_docs entries are hardlinks to the originals (symlinks across "
+                             "filesystems), so editing one edits the original - no extra disk space")
+    args = parser.parse_args()
+    import asyncio
+    success = asyncio.run(main(args.mode))
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -17,7 +17,10 @@ import os
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, TextIO
+
+from claudae_migration import DOCUMENT_INDEX, PREVIEW_CHARS
+from ai_family.generated_files import generated_file
 
 class CLAUDAEReviewGenerator:
     """Generate comprehensive review of CLAUDAE's migration work"""
@@ -42,22 +45,17 @@ class CLAUDAEReviewGenerator:
         # Load migration data
         migration_report = self._load_migration_report()
         migration_summary = self._load_migration_summary()
+        documents = self._load_document_index()
         
-        # Generate reports
-        master_report = self._create_master_report(migration_report, migration_summary)
-        content_review = self._create_content_review()
-        file_listing = self._create_file_listing()
-        analysis_review = self._create_analysis_review(migration_report)
-        
-        # Save all reports
-        self._save_report("master_review.md", master_report)
-        self._save_report("content_review.md", content_review)
-        self._save_report("file_listing.txt", file_listing)
-        self._save_report("analysis_review.json", json.dumps(analysis_review, indent=2))
+        # Stream each report straight to its file
+        self._write_report("master_review.md", self._write_master_report, migration_report, migration_summary)
+        self._write_report("content_review.md", self._write_content_review, documents)
+        self._write_report("file_listing.txt", self._write_file_listing, documents)
+        self._write_report("analysis_review.json", self._write_analysis_review, migration_report)
         
         # Create single consolidated file
-        consolidated = self._create_consolidated_report(master_report, content_review, file_listing)
-        self._save_report("COMPLETE_CLAUDAE_REVIEW.md", consolidated)
+        self._write_report("COMPLETE_CLAUDAE_REVIEW.md", self._write_consolidated_report,
+                           migration_report, migration_summary, documents)
         
         print(f"\n✅ Complete review generated!")
         print(f"📄 Main file: {self.review_dir}/COMPLETE_CLAUDAE_REVIEW.md")
@@ -81,9 +79,55 @@ class CLAUDAEReviewGenerator:
             print(f"⚠️ Could not load migration summary: {e}")
             return {}
     
-    def _create_master_report(self, migration_report: Dict, migration_summary: Dict) -> str:
-        """Create master review report"""
-        report = f"""# CLAUDAE Migration Review - Master Report
+    def _load_document_index(self) -> List[Dict[str, Any]]:
+        """Load the per-document index written by the migration (one scan of organized_docs if it is missing)"""
+        index_file = self.migration_dir / DOCUMENT_INDEX
+        if not index_file.exists():
+            print(f"⚠️ No {DOCUMENT_INDEX} found - scanning organized_docs once")
+            return self._scan_organized_docs()
+        
+        documents = []
+        with open(index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    documents.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return documents
+    
+    def _scan_organized_docs(self) -> List[Dict[str, Any]]:
+        """Build index entries from migrated files for migrations that predate the index"""
+        documents = []
+        if not self.organized_docs_dir.exists():
+            return documents
+        
+        for file_path in sorted(self.organized_docs_dir.rglob("*")):
+            if not file_path.is_file():
+                continue
+            entry = {"migrated_path": str(file_path.relative_to(self.organized_docs_dir)),
+                     "content_type": file_path.relative_to(self.organized_docs_dir).parts[0]}
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except Exception as e:
+                entry["error"] = str(e)
+                documents.append(entry)
+                continue
+            
+            # Split the CLAUDAE metadata header from the original content
+            if content.startswith("<!-- CLAUDAE Analysis Metadata"):
+                end_marker = content.find("-->")
+                if end_marker != -1:
+                    entry["metadata"] = content[:end_marker + 3]
+                    content = content[end_marker + 3:].strip()
+            entry["size_bytes"] = len(content.encode('utf-8'))
+            entry["preview"] = content[:PREVIEW_CHARS]
+            entry["truncated"] = len(content) > PREVIEW_CHARS
+            documents.append(entry)
+        return documents
+    
+    def _write_master_report(self, out: TextIO, migration_report: Dict, migration_summary: Dict):
+        """Write master review report"""
+        out.write(f"""# CLAUDAE Migration Review - Master Report
 Generated: {datetime.now().isoformat()}
 
 ## 🎯 Migration Overview
@@ -97,153 +141,111 @@ Generated: {datetime.now().isoformat()}
 - **End Time:** {migration_report.get('end_time', 'N/A')}
 
 ### Content Type Breakdown
-"""
-        
-        if migration_summary and 'content_type_breakdown' in migration_summary:
-            for content_type, count in migration_summary['content_type_breakdown'].items():
-                report += f"- **{content_type}:** {count} documents\n"
+""")
         
-        report += f"""
-### Importance Distribution
-"""
-        
-        if migration_summary and 'importance_distribution' in migration_summary:
-            for importance, count in migration_summary['importance_distribution'].items():
-                report += f"- **{importance}:** {count} documents\n"
+        for content_type, count in migration_summary.get('content_type_breakdown', {}).items():
+            out.write(f"- **{content_type}:** {count} documents\n")
         
-        report += f"""
-### CLAUDAE Performance
-"""
+        out.write("\n### Importance Distribution\n")
+        for importance, count in migration_summary.get('importance_distribution', {}).items():
+            out.write(f"- **{importance}:** {count} documents\n")
         
-        if migration_summary and 'claudae_performance' in migration_summary:
+        out.write("\n### CLAUDAE Performance\n")
+        if 'claudae_performance' in migration_summary:
             perf = migration_summary['claudae_performance']
-            report += f"""- **Average Confidence:** {perf.get('average_confidence', 'N/A')}
+            out.write(f"""- **Average Confidence:** {perf.get('average_confidence', 'N/A')}
 - **Average Processing Time:** {perf.get('average_processing_time', 'N/A')}s
 - **Total Processing Time:** {perf.get('total_processing_time', 'N/A')}s
-"""
+""")
+    
+    def _write_content_review(self, out: TextIO, documents: List[Dict[str, Any]]):
+        """Write detailed content review from the document index"""
+        by_category: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in documents:
+            by_category.setdefault(entry.get("content_type", "unknown"), []).append(entry)
+        
+        out.write("# CLAUDAE Content Review - Detailed Analysis\n\n## 📁 Document Organization Structure\n\n")
+        for category in sorted(by_category):
+            out.write(f"\n### Category: {category}\n")
+            out.write(f"**Files:** {len(by_category[category])}\n\n")
+            for entry in by_category[category]:
+                out.write(f"- `{Path(entry['migrated_path']).name}`\n")
+            out.write("\n")
         
-        return report
+        out.write("\n## 📄 Document Content Analysis\n\n")
+        for category in sorted(by_category):
+            out.write(f"\n### {category.upper()} DOCUMENTS\n\n")
+            for entry in by_category[category]:
+                self._write_document_analysis(out, entry)
     
-    def _create_content_review(self) -> str:
-        """Create detailed content review"""
-        report = """# CLAUDAE Content Review - Detailed Analysis
+    def _write_document_analysis(self, out: TextIO, entry: Dict[str, Any]):
+        """Write the analysis and preview of a single migrated document"""
+        name = Path(entry["migrated_path"]).name
+        if "error" in entry:
+            out.write(f"#### ❌ {name}\nError reading file: {entry['error']}\n\n")
+            return
+        
+        out.write(f"""
+#### 📄 {name}
 
-## 📁 Document Organization Structure
+**File Path:** `{self.organized_docs_dir / entry['migrated_path']}`
+**File Size:** {entry.get('size_bytes', 'N/A')} bytes
+**View:** {entry.get('view', 'copy')}
 
-"""
-        
-        # Walk through organized docs directory
-        if self.organized_docs_dir.exists():
-            for category_dir in sorted(self.organized_docs_dir.iterdir()):
-                if category_dir.is_dir():
-                    report += f"\n### Category: {category_dir.name}\n"
-                    
-                    # List files in this category
-                    files_in_category = list(category_dir.rglob("*"))
-                    report += f"**Files:** {len([f for f in files_in_category if f.is_file()])}\n\n"
-                    
-                    for file_path in sorted(files_in_category):
-                        if file_path.is_file():
-                            report += f"- `{file_path.name}`\n"
-                    
-                    report += "\n"
+""")
         
-        report += """
-## 📄 Document Content Analysis
+        if "metadata" in entry:
+            out.write("**CLAUDAE Analysis:**\n```\n" + entry["metadata"] + "\n```\n\n")
+        elif "summary" in entry:
+            out.write(f"""**CLAUDAE Analysis:**
+```
+File: {entry.get('original_path', 'N/A')}
+Content Type: {entry['content_type']}
+Importance Score: {entry.get('importance_score', 'N/A')}
+Key Topics: {', '.join(entry.get('key_topics', []))}
+Relationships: {', '.join(entry.get('relationships', []))}
+Summary: {entry['summary']}
+CLAUDAE Confidence: {entry.get('claudae_confidence', 'N/A')}
+Processing Time: {entry.get('processing_time', 'N/A')}s
+Migration Date: {entry.get('migrated_at', 'N/A')}
+```
 
-"""
-        
-        # Analyze each migrated document
-        if self.organized_docs_dir.exists():
-            for category_dir in sorted(self.organized_docs_dir.iterdir()):
-                if category_dir.is_dir():
-                    report += f"\n### {category_dir.name.upper()} DOCUMENTS\n\n"
-                    
-                    for file_path in sorted(category_dir.rglob("*")):
-                        if file_path.is_file():
-                            report += self._analyze_migrated_file(file_path)
+""")
         
-        return report
-    
-    def _analyze_migrated_file(self, file_path: Path) -> str:
-        """Analyze a single migrated file"""
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            
-            # Extract CLAUDAE metadata if present
-            metadata_section = ""
-            original_content = content
-            
-            if content.startswith("<!-- CLAUDAE Analysis Metadata"):
-                # Find end of metadata
-                end_marker = content.find("-->")
-                if end_marker != -1:
-                    metadata_section = content[:end_marker + 3]
-                    original_content = content[end_marker + 3:].strip()
-            
-            analysis = f"""
-#### 📄 {file_path.name}
-
-**File Path:** `{file_path}`
-**File Size:** {len(content)} characters
-
-"""
-            
-            if metadata_section:
-                analysis += "**CLAUDAE Analysis:**\n```\n" + metadata_section + "\n```\n\n"
-            
-            # Show content preview
-            preview_length = 500
-            if len(original_content) > preview_length:
-                preview = original_content[:preview_length] + "..."
-            else:
-                preview = original_content
-            
-            analysis += f"**Content Preview:**\n```\n{preview}\n```\n\n"
-            analysis += "---\n\n"
-            
-            return analysis
-            
-        except Exception as e:
-            return f"#### ❌ {file_path.name}\nError reading file: {e}\n\n"
+        # Show content preview
+        preview = entry.get("preview", "")
+        if entry.get("truncated"):
+            preview += "..."
+        out.write(f"**Content Preview:**\n```\n{preview}\n```\n\n---\n\n")
     
-    def _create_file_listing(self) -> str:
-        """Create complete file listing"""
-        listing = f"""CLAUDAE Migration - Complete File Listing
+    def _write_file_listing(self, out: TextIO, documents: List[Dict[str, Any]]):
+        """Write complete file listing"""
+        out.write(f"""CLAUDAE Migration - Complete File Listing
 Generated: {datetime.now().isoformat()}
 
 === ORIGINAL FILES (Backed Up) ===
-"""
-        
-        # List backed up files
-        backup_dir = self.migration_dir / "phase2_backup"
-        if backup_dir.exists():
-            for file_path in sorted(backup_dir.rglob("*")):
-                if file_path.is_file():
-                    rel_path = file_path.relative_to(backup_dir)
-                    listing += f"{rel_path}\n"
+""")
         
-        listing += f"""
-=== MIGRATED FILES (CLAUDAE Organized) ===
-"""
+        # Originals are preserved in the phase2 snapshot under claudae_foundation/snapshots
+        for original_path in sorted(entry["original_path"] for entry in documents if "original_path" in entry):
+            try:
+                out.write(f"{Path(original_path).relative_to(self.project_root)}\n")
+            except ValueError:
+                out.write(f"{original_path}\n")
         
-        # List migrated files
-        if self.organized_docs_dir.exists():
-            for file_path in sorted(self.organized_docs_dir.rglob("*")):
-                if file_path.is_file():
-                    rel_path = file_path.relative_to(self.organized_docs_dir)
-                    listing += f"{rel_path}\n"
+        out.write("\n=== MIGRATED FILES (CLAUDAE Organized) ===\n")
+        for entry in documents:
+            out.write(f"{entry['migrated_path']}\n")
         
-        listing += f"""
+        out.write(f"""
 === MIGRATION METADATA ===
 migration_report.json
 migration_summary.json
-"""
-        
-        return listing
+{DOCUMENT_INDEX}
+""")
     
-    def _create_analysis_review(self, migration_report: Dict) -> Dict:
-        """Create detailed analysis review"""
+    def _write_analysis_review(self, out: TextIO, migration_report: Dict):
+        """Write detailed analysis review"""
         analysis = {
             "generation_time": datetime.now().isoformat(),
             "migration_overview": migration_report,
@@ -253,30 +255,29 @@ migration_summary.json
         }
         
         # Analyze each migration result
-        if 'migration_results' in migration_report:
-            for result in migration_report['migration_results']:
-                file_name = Path(result['original_path']).name
-                analysis["file_analysis"][file_name] = {
-                    "original_path": result['original_path'],
-                    "migrated_path": result['migrated_path'],
-                    "success": result['success'],
-                    "claudae_analysis": result.get('analysis', {})
-                }
+        for result in migration_report.get('migration_results', []):
+            file_name = Path(result['original_path']).name
+            analysis["file_analysis"][file_name] = {
+                "original_path": result['original_path'],
+                "migrated_path": result['migrated_path'],
+                "success": result['success'],
+                "claudae_analysis": result.get('analysis', {})
+            }
         
-        return analysis
+        json.dump(analysis, out, indent=2)
     
-    def _create_consolidated_report(self, master_report: str, content_review: str, file_listing: str) -> str:
-        """Create single consolidated report"""
-        header = "# COMPLETE CLAUDAE MIGRATION REVIEW\n"
-        header += f"Generated: {datetime.now().isoformat()}\n\n"
+    def _write_consolidated_report(self, out: TextIO, migration_report: Dict, migration_summary: Dict,
+                                   documents: List[Dict[str, Any]]):
+        """Write single consolidated report"""
+        out.write("# COMPLETE CLAUDAE MIGRATION REVIEW\n")
+        out.write(f"Generated: {datetime.now().isoformat()}\n\n")
         
-        summary = "## Migration Statistics Summary\n"
-        summary += "- Total Files Processed: Check migration report\n"
-        summary += "- Categories Created: Multiple (blueprint, session, status, etc.)\n"
-        summary += "- Analysis Quality: High (detailed metadata for each file)\n"
-        summary += "- Backup Status: Complete (all originals preserved)\n\n"
+        self._write_master_report(out, migration_report, migration_summary)
+        out.write("\n\n")
+        self._write_content_review(out, documents)
+        out.write("\n\n")
         
-        recommendations = """## Next Steps Recommendations
+        out.write("""## Next Steps Recommendations
 
 ### What Worked Well
 - 100% migration success rate
@@ -297,14 +298,17 @@ If the categorization and analysis look accurate:
 - Activate CLAUDAE learning system
 - Begin Phase 3: Automated Processing
 
-"""
+""")
         
-        consolidated = header + master_report + "\n\n" + content_review + "\n\n" + recommendations + summary
-        return consolidated
-    def _save_report(self, filename: str, content: str):
-        """Save report to file"""
+        out.write("## Migration Statistics Summary\n")
+        out.write("- Total Files Processed: Check migration report\n")
+        out.write("- Categories Created: Multiple (blueprint, session, status, etc.)\n")
+        out.write("- Analysis Quality: High (detailed metadata for each file)\n")
+        out.write("- Backup Status: Complete (all originals preserved)\n\n")
+    
+    def _write_report(self, filename: str, writer, *args):
+        """Stream a report to file (replaced atomically, untouched when identical)"""
         file_path = self.review_dir / filename
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        with generated_file(file_path) as f:
+            writer(f, *args)
         print(f"📄 Saved: {filename}")
-
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+HONEY DUO WEALTH - Alerting Engine
+Threshold, rate-of-change and absence rules evaluated incrementally over the metrics store.
+Runs as its own process (python monitoring/alerting.py) so the absence rule still fires when the sampler dies.
+"""
+
+import argparse
+import bisect
+import fcntl
+import json
+import math
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from monitoring.metrics_store import MetricsStore
+
+DEFAULT_ALERT_LOG = Path(__file__).resolve().parent / "alerts.jsonl"
+LOCK_FILE = Path(__file__).resolve().parent / "alerting.lock"
+
+
+class ThresholdRule:
+    """Fires when a metric stays above (or below) a threshold for for_sec"""
+
+    def __init__(self, name: str, metric: str, threshold: float, above: bool = True,
+                 for_sec: float = 0, severity: str = "warning"):
+        self.name = name
+        self.metrics = [metric]
+        self.threshold = threshold
+        self.above = above
+        self.for_sec = for_sec
+        self.severity = severity
+        self._breach_since = None
+        self._value = None
+        self._last_ts = -math.inf
+
+    def observe(self, ts: float, values: Dict[str, float]):
+        value = values.get(self.metrics[0])
+        # A sample flushed late says nothing about the current state
+        if value is None or ts < self._last_ts:
+            return
+        self._last_ts = ts
+        self._value = value
+        breached = value > self.threshold if self.above else value < self.threshold
+        if not breached:
+            self._breach_since = None
+        elif self._breach_since is None:
+            self._breach_since = ts
+
+    def check(self, now: float) -> Optional[str]:
+        if self._breach_since is None or now - self._breach_since < self.for_sec:
+            return None
+        direction = ">" if self.above else "<"
+        return f"{self.metrics[0]} = {self._value:.1f} {direction} {self.threshold} for {int(now - self._breach_since)}s"
+
+
+class RateRule:
+    """Fires when a metric changes by more than max_change within window_sec"""
+
+    def __init__(self, name: str, metric: str, max_change: float, window_sec: float,
+                 severity: str = "warning"):
+        self.name = name
+        self.metrics = [metric]
+        self.max_change = max_change
+        self.window_sec = window_sec
+        self.severity = severity
+        self._window = deque()  # (ts, value), oldest first
+
+    def observe(self, ts: float, values: Dict[str, float]):
+        value = values.get(self.metrics[0])
+        if value is None:
+            return
+        if self._window and ts < self._window[-1][0]:
+            # Flushed late: slot it into place (a plain deque append keeps the common case cheap)
+            window = list(self._window)
+            bisect.insort(window, (ts, value))
+            self._window = deque(window)
+        else:
+            self._window.append((ts, value))
+        while self._window and self._window[-1][0] - self._window[0][0] > self.window_sec:
+            self._window.popleft()
+
+    def check(self, now: float) -> Optional[str]:
+        if len(self._window) < 2:
+            return None
+        change = self._window[-1][1] - self._window[0][1]
+        if abs(change) <= self.max_change:
+            return None
+        span = int(self._window[-1][0] - self._window[0][0])
+        return f"{self.metrics[0]} changed by {change:+.1f} in {span}s (limit {self.max_change})"
+
+
+class AbsenceRule:
+    """Fires when a metric has not been written for silent_sec"""
+
+    def __init__(self, name: str, metric: str, silent_sec: float, severity: str = "critical"):
+        self.name = name
+        self.metrics = [metric]
+        self.silent_sec = silent_sec
+        self.severity = severity
+        self._last_seen = time.time()  # grace period from engine start
+
+    def observe(self, ts: float, values: Dict[str, float]):
+        if self.metrics[0] in values:
+            self._last_seen = max(self._last_seen, ts)
+
+    def check(self, now: float) -> Optional[str]:
+        silent = now - self._last_seen
+        if silent < self.silent_sec:
+            return None
+        return f"no {self.metrics[0]} sample for {int(silent)}s"
+
+
+class LLMPercentileRule:
+    """Fires when a model's latency percentile over the last window_sec stays above a threshold for for_sec"""
+
+    metrics = []
+
+    def __init__(self, name: str, model: str, threshold: float, pct: float = 95,
+                 window_sec: float = 300, metric: str = "latency_sec", min_calls: int = 5,
+                 for_sec: float = 0, severity: str = "warning"):
+        self.name = name
+        self.model = model
+        self.threshold = threshold
+        self.pct = pct
+        self.window_sec = window_sec
+        self.metric = metric
+        self.min_calls = min_calls
+        self.for_sec = for_sec
+        self.severity = severity
+        self._window = deque()  # (ts, value), oldest first
+        self._breach_since = None
+
+    def observe_call(self, call: Dict[str, Any]):
+        value = call.get(self.metric)
+        if call.get("model") == self.model and value is not None:
+            self._window.append((call["ts"], value))
+
+    def check(self, now: float) -> Optional[str]:
+        while self._window and now - self._window[0][0] > self.window_sec:
+            self._window.popleft()
+        if len(self._window) < self.min_calls:
+            self._breach_since = None
+            return None
+        values = sorted(value for _, value in self._window)
+        value = values[min(len(values) - 1, math.ceil(self.pct / 100 * len(values)) - 1)]
+        if value <= self.threshold:
+            self._breach_since = None
+            return None
+        if self._breach_since is None:
+            self._breach_since = now
+        if now - self._breach_since < self.for_sec:
+            return None
+        return (f"{self.model} p{self.pct:g} {self.metric} = {value:.2f}s > {self.threshold}s "
+                f"over {len(values)} calls in {int(self.window_sec)}s, for {int(now - self._breach_since)}s")
+
+
+class FileSink:
+    """Appends alerts as JSON lines"""
+
+    def __init__(self, path: Path = DEFAULT_ALERT_LOG):
+        self.path = Path(path)
+
+    def emit(self, alert: Dict[str, Any]):
+        with open(self.path, "a") as f:
+            f.write(json.dumps(alert) + "\n")
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Newest alerts first"""
+        try:
+            with open(self.path) as f:
+                lines = deque(f, maxlen=limit)
+        except FileNotFoundError:
+            return []
+        alerts = []
+        for line in reversed(lines):
+            try:
+                alerts.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return alerts
+
+
+class WebhookSink:
+    """Posts alerts as JSON; delivery failures are printed, never raised"""
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.url = url
+        self.timeout = timeout
+
+    def emit(self, alert: Dict[str, Any]):
+        import requests
+        try:
+            requests.post(self.url, json=alert, timeout=self.timeout)
+        except requests.RequestException as e:
+            print(f"⚠️ Alert webhook failed: {e}")
+
+
+def default_rules() -> List[Any]:
+    return [
+        ThresholdRule("cpu_high", "cpu", 80, for_sec=300),
+        ThresholdRule("memory_high", "memory", 85, for_sec=300),
+        ThresholdRule("disk_high", "disk", 90, severity="critical"),
+        RateRule("memory_climb", "memory_gb", 8, window_sec=600),
+        AbsenceRule("sampler_silent", "cpu", 120),
+        LLMPercentileRule("nyala_latency_p95", "mixtral:8x7b", 5.0, pct=95, window_sec=300, for_sec=120),
+    ]
+
+
+class AlertEngine:
+    def __init__(self, store: MetricsStore, rules: List[Any] = None, sinks: List[Any] = None,
+                 interval: float = 10.0, cooldown_sec: float = 900.0):
+        self.store = store
+        self.rules = rules if rules is not None else default_rules()
+        self.sinks = sinks if sinks is not None else [FileSink()]
+        self.interval = interval
+        self.cooldown_sec = cooldown_sec
+        self.metric_names = sorted({m for rule in self.rules for m in rule.metrics})
+
+        # Cursors start at the current end of each stream - history is never rescanned
+        self._metrics_cursor = store.max_metric_id()
+        self._llm_cursor = store.max_llm_call_id()
+        self._firing: Dict[str, float] = {}  # rule name -> last notification time
+        self._stop = threading.Event()
+
+    def evaluate(self, now: float = None) -> List[Dict[str, Any]]:
+        """Feed only the rows added since the last evaluation, then check every rule"""
+        now = now or time.time()
+        if self.metric_names:
+            rows, self._metrics_cursor = self.store.fetch_since(self.metric_names, self._metrics_cursor)
+            for row in rows:
+                for rule in self.rules:
+                    if rule.metrics:
+                        rule.observe(row["timestamp"], row)
+
+        calls, self._llm_cursor = self.store.llm_calls_since(self._llm_cursor)
+        for call in calls:
+            for rule in self.rules:
+                if hasattr(rule, "observe_call"):
+                    rule.observe_call(call)
+
+        alerts = []
+        for rule in self.rules:
+            message = rule.check(now)
+            alert = self._transition(rule, message, now)
+            if alert:
+                alerts.append(alert)
+                for sink in self.sinks:
+                    try:
+                        sink.emit(alert)
+                    except Exception as e:
+                        print(f"⚠️ Alert sink failed: {e}")
+        return alerts
+
+    def _transition(self, rule, message: Optional[str], now: float) -> Optional[Dict[str, Any]]:
+        """Dedup: notify on firing, again only after the cooldown, and once on resolve"""
+        last = self._firing.get(rule.name)
+        if message is None:
+            if last is None:
+                return None
+            del self._firing[rule.name]
+            state = "resolved"
+        elif last is None:
+            state = "firing"
+        elif now - last >= self.cooldown_sec:
+            state = "repeat"
+        else:
+            return None
+        if state != "resolved":
+            self._firing[rule.name] = now
+        return {"timestamp": datetime.fromtimestamp(now).isoformat(), "rule": rule.name,
+                "severity": rule.severity, "state": state, "message": message or "back to normal"}
+
+    def run(self):
+        next_run = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                for alert in self.evaluate():
+                    print(f"🚨 [{alert['severity']}] {alert['rule']} {alert['state']}: {alert['message']}")
+            except Exception as e:
+                print(f"⚠️ Alert evaluation failed: {e}")
+            next_run += self.interval
+            self._stop.wait(max(0.0, next_run - time.monotonic()))
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.run, name="alert-engine", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HONEY DUO WEALTH alert engine")
+    parser.add_argument("--interval", type=float, default=10.0, help="Seconds between evaluations")
+    parser.add_argument("--webhook", help="Also POST alerts to this URL")
+    args = parser.parse_args()
+
+    # One engine per machine, otherwise every alert is delivered once per running copy
+    lock = open(LOCK_FILE, "a")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        print(f"⚠️ Another alert engine is already running (see {LOCK_FILE})")
+        sys.exit(1)
+
+    sinks = [FileSink()] + ([WebhookSink(args.webhook)] if args.webhook else [])
+    store = MetricsStore()
+    engine = AlertEngine(store, sinks=sinks, interval=args.interval)
+    print(f"🚨 Evaluating {len(engine.rules)} rules every {args.interval}s -> {DEFAULT_ALERT_LOG}")
+    try:
+        engine.run()
+    except KeyboardInterrupt:
+        engine.stop()
+    finally:
+        store.close()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+HONEY DUO WEALTH - Incremental Chart Data
+Per-window cached DataFrames kept current by re-querying only their newest bucket, LTTB-downsampled per column for plotting
+"""
+
+import threading
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from monitoring.metrics_store import MetricsStore
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of n_out points that preserve the visual shape"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Pick the point forming the largest triangle with the last pick and the next bucket's mean
+        areas = np.abs((x[selected] - avg_x) * (y[start:end] - y[selected])
+                       - (x[selected] - x[start:end]) * (avg_y - y[selected]))
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+
+    return indices
+
+
+def downsample(frame: pd.DataFrame, n_out: int, columns: List[str]) -> pd.DataFrame:
+    """LTTB on each column with an equal share of n_out; the frame keeps the union of the picked rows"""
+    if len(frame) <= n_out:
+        return frame
+    x = frame['timestamp'].to_numpy(dtype=float)
+    per_column = max(3, n_out // len(columns))
+    indices = np.unique(np.concatenate([
+        lttb_indices(x, frame[column].ffill().fillna(0.0).to_numpy(dtype=float), per_column)
+        for column in columns
+    ]))
+    return frame.iloc[indices].reset_index(drop=True)
+
+
+class ChartDataCache:
+    def __init__(self, store: MetricsStore, names: List[str], max_points: int = 500, oversample: int = 4):
+        self.store = store
+        self.names = list(names)
+        self.max_points = max_points
+        # Cached at oversample x the plotted resolution, from one tier at one step per window
+        self.oversample = oversample
+        self._windows: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+
+    def get(self, window_sec: int) -> Tuple[pd.DataFrame, int]:
+        """Chart frame for the last window_sec seconds and a version that changes only with new data"""
+        with self._lock:
+            now = time.time()
+            entry = self._windows.get(window_sec)
+            if entry is None:
+                entry = {"step": self.store.step_for(window_sec, self.max_points * self.oversample),
+                         "frame": self._to_frame([]), "last_ts": None, "version": -1}
+                self._windows[window_sec] = entry
+
+            last_ts = self.store.max_ts()
+            if last_ts != entry["last_ts"]:
+                # Re-aggregate only from the newest cached bucket (it may have been partial), so cached
+                # and new rows share a step; an empty cache reads just this window, never from ts 0
+                frame = entry["frame"]
+                since = frame['timestamp'].iloc[-1] if not frame.empty else now - window_sec
+                rows = self.store.query(self.names, since, until=now, step=entry["step"])
+                entry["frame"] = pd.concat([frame[frame['timestamp'] < since], self._to_frame(rows)],
+                                           ignore_index=True)
+                entry["last_ts"] = last_ts
+                entry["version"] += 1
+
+            frame = entry["frame"]
+            frame = entry["frame"] = frame[frame['timestamp'] >= now - window_sec - entry["step"]]
+            return downsample(frame, self.max_points, self.names), entry["version"]
+
+    def _to_frame(self, rows) -> pd.DataFrame:
+        frame = pd.DataFrame(rows, columns=['timestamp'] + self.names)
+        frame['datetime'] = pd.to_datetime(frame['timestamp'], unit='s')
+        return frame
+
+
+def cached_figure(cache, key: str, version: int, build):
+    """Reuse a built figure until its data version changes (cache is e.g. st.session_state)"""
+    cached = cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    figure = build()
+    cache[key] = (version, figure)
+    return figure
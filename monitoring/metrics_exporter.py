@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+HONEY DUO WEALTH - OpenMetrics Exporter
+Serves system, LLM, learner-queue and training metrics for Prometheus-style scrapers
+"""
+
+import argparse
+import math
+import sys
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from monitoring.metrics_store import MetricsStore, LLM_HISTOGRAM_BOUNDS
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PREFIX = "honey_duo"
+
+# store metric -> (exported name, help)
+GAUGES = {
+    "cpu": ("cpu_utilization_percent", "System CPU utilization"),
+    "memory": ("memory_utilization_percent", "System memory utilization"),
+    "memory_gb": ("memory_used_gigabytes", "System memory in use"),
+    "disk": ("disk_utilization_percent", "Root filesystem utilization"),
+    "gpu_util": ("gpu_utilization_percent", "GPU utilization"),
+    "training_active": ("training_active_jobs", "Training jobs currently running"),
+    "training_cpu": ("training_cpu_percent", "CPU used by running training jobs"),
+    "training_rss_gb": ("training_rss_gigabytes", "Resident memory of running training jobs"),
+}
+# Learners publish queue depths as "learner_queue:<learner>:<queue>"
+LEARNER_QUEUE_PREFIX = "learner_queue:"
+LLM_HISTOGRAMS = {
+    "latency_sec": ("llm_latency_seconds", "LLM call wall time"),
+    "ttft_sec": ("llm_time_to_first_token_seconds", "Model load plus prompt evaluation time"),
+}
+
+
+def _labels(**labels) -> str:
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class OpenMetricsExporter:
+    def __init__(self, store: MetricsStore, refresh_interval: float = 5.0, lookback_sec: int = 60):
+        self.store = store
+        self.refresh_interval = refresh_interval
+
+        # Cursors into the store; only rows added since the previous refresh are read
+        self._metrics_cursor = store.metric_id_before(store.max_ts() - lookback_sec)
+        self._llm_cursor = store.max_llm_call_id()
+        self._training_cursor = store.max_training_event_id()
+
+        self._gauges: Dict[str, Tuple[float, int]] = {}  # store metric -> (value, ts)
+        self._llm_calls = defaultdict(int)  # (model, caller, status)
+        self._llm_tokens = defaultdict(int)  # (model, kind)
+        self._llm_histograms = defaultdict(lambda: [[0] * len(LLM_HISTOGRAM_BOUNDS), 0.0])  # (metric, model, caller)
+        self._training_runs = defaultdict(int)  # (ai_name, outcome)
+
+        self._created = time.time()
+        self._lock = threading.Lock()
+        self._rendered = b"# EOF\n"
+        self._stop = threading.Event()
+
+    def refresh(self):
+        """Fold new store rows into the in-memory counters and re-render the exposition"""
+        rows, self._metrics_cursor = self.store.fetch_since(None, self._metrics_cursor)
+        for row in rows:
+            ts = row.pop("timestamp")
+            for name, value in row.items():
+                # Keep the newest sample; rows flushed late can be older than the gauge
+                if ts >= self._gauges.get(name, (None, ts))[1]:
+                    self._gauges[name] = (value, ts)
+
+        calls, self._llm_cursor = self.store.llm_calls_since(self._llm_cursor)
+        for call in calls:
+            model, caller = call["model"] or "unknown", call["caller"] or "unknown"
+            self._llm_calls[(model, caller, call["status"])] += 1
+            self._llm_tokens[(model, "prompt")] += call["prompt_tokens"] or 0
+            self._llm_tokens[(model, "output")] += call["output_tokens"] or 0
+            for metric in LLM_HISTOGRAMS:
+                value = call.get(metric)
+                if value is None:
+                    continue
+                histogram = self._llm_histograms[(metric, model, caller)]
+                histogram[0][next(i for i, bound in enumerate(LLM_HISTOGRAM_BOUNDS) if value <= bound)] += 1
+                histogram[1] += value
+
+        events, self._training_cursor = self.store.training_events_since(self._training_cursor)
+        for event in events:
+            self._training_runs[(event["ai_name"], event["event_type"].replace("training_", ""))] += 1
+
+        rendered = self.render().encode()
+        with self._lock:
+            self._rendered = rendered
+
+    def render(self) -> str:
+        lines: List[str] = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+            lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+
+        for metric, (name, help_text) in GAUGES.items():
+            if metric in self._gauges:
+                family(name, "gauge", help_text)
+                lines.append(f"{PREFIX}_{name} {_number(self._gauges[metric][0])}")
+
+        queues = sorted(metric for metric in self._gauges if metric.startswith(LEARNER_QUEUE_PREFIX))
+        if queues:
+            family("learner_queue_depth", "gauge", "Items waiting in a learner queue")
+            for metric in queues:
+                _, learner, queue_name = metric.split(":", 2)
+                lines.append(f"{PREFIX}_learner_queue_depth{_labels(learner=learner, queue=queue_name)} "
+                             f"{_number(self._gauges[metric][0])}")
+
+        if self._gauges:
+            family("last_sample_timestamp_seconds", "gauge", "Time of the newest sampler reading")
+            lines.append(f"{PREFIX}_last_sample_timestamp_seconds {max(ts for _, ts in self._gauges.values())}")
+
+        family("llm_calls", "counter", "LLM calls by outcome since exporter start")
+        for (model, caller, status), count in sorted(self._llm_calls.items()):
+            lines.append(f"{PREFIX}_llm_calls_total{_labels(model=model, caller=caller, status=status)} {count}")
+            lines.append(f"{PREFIX}_llm_calls_created{_labels(model=model, caller=caller, status=status)} "
+                         f"{self._created:.3f}")
+
+        family("llm_tokens", "counter", "Prompt and output tokens since exporter start")
+        for (model, kind), count in sorted(self._llm_tokens.items()):
+            lines.append(f"{PREFIX}_llm_tokens_total{_labels(model=model, kind=kind)} {count}")
+
+        for metric, (name, help_text) in LLM_HISTOGRAMS.items():
+            family(name, "histogram", help_text)
+            for (hist_metric, model, caller), (counts, total) in sorted(self._llm_histograms.items()):
+                if hist_metric != metric:
+                    continue
+                cumulative = 0
+                for bound, count in zip(LLM_HISTOGRAM_BOUNDS, counts):
+                    cumulative += count
+                    lines.append(f"{PREFIX}_{name}_bucket{_labels(model=model, caller=caller, le=_number(float(bound)))} "
+                                 f"{cumulative}")
+                lines.append(f"{PREFIX}_{name}_count{_labels(model=model, caller=caller)} {cumulative}")
+                lines.append(f"{PREFIX}_{name}_sum{_labels(model=model, caller=caller)} {round(total, 3)}")
+
+        family("training_runs", "counter", "Finished training runs by outcome since exporter start")
+        for (ai_name, outcome), count in sorted(self._training_runs.items()):
+            lines.append(f"{PREFIX}_training_runs_total{_labels(ai=ai_name, outcome=outcome)} {count}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def exposition(self) -> bytes:
+        """Last rendered text - scrapes never touch the database"""
+        with self._lock:
+            return self._rendered
+
+    def run(self):
+        next_run = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"⚠️ Exporter refresh failed: {e}")
+            next_run += self.refresh_interval
+            self._stop.wait(max(0.0, next_run - time.monotonic()))
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.run, name="metrics-exporter", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+        """HTTP server answering GET /metrics from memory (started in a daemon thread)"""
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = exporter.exposition()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # scrapes every few seconds would flood the console
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-exporter-http", daemon=True).start()
+        return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HONEY DUO WEALTH OpenMetrics exporter")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9464)
+    parser.add_argument("--refresh", type=float, default=5.0, help="Seconds between store reads")
+    args = parser.parse_args()
+
+    store = MetricsStore()
+    exporter = OpenMetricsExporter(store, args.refresh)
+    exporter.serve(args.host, args.port)
+    print(f"📡 Serving OpenMetrics on http://{args.host}:{args.port}/metrics")
+    try:
+        exporter.run()
+    except KeyboardInterrupt:
+        exporter.stop()
+    finally:
+        store.close()
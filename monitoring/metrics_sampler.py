@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+HONEY DUO WEALTH - Metrics Sampler
+Samples system metrics into the metrics store at a fixed cadence, independent of dashboard viewers.
+Alerts are evaluated by the separate watchdog process: python monitoring/alerting.py
+"""
+
+import argparse
+import fcntl
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import psutil
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from monitoring.metrics_exporter import OpenMetricsExporter
+from monitoring.metrics_store import MetricsStore
+from monitoring.training_tracker import TrainingProcessTracker
+
+LOCK_FILE = Path(__file__).resolve().parent / "metrics_sampler.lock"
+SYSTEM_METRICS = ['cpu', 'memory', 'memory_gb', 'disk', 'gpu_util',
+                  'training_active', 'training_cpu', 'training_rss_gb']
+
+
+class MetricsSampler:
+    def __init__(self, store: MetricsStore, interval: float = 5.0, gpu_interval: float = 30.0):
+        self.store = store
+        self.interval = interval
+        self.gpu_interval = gpu_interval
+        self._gpu_util = None
+        self._gpu_checked = 0.0
+        self._stop = threading.Event()
+        self.training = TrainingProcessTracker(store)
+        # First call primes psutil's counters; later calls return usage since the previous call
+        psutil.cpu_percent(interval=None)
+
+    def sample(self) -> Dict[str, Optional[float]]:
+        """One non-blocking reading of every system metric"""
+        memory = psutil.virtual_memory()
+        jobs = self.training.poll()
+        return {
+            'cpu': psutil.cpu_percent(interval=None),
+            'memory': memory.percent,
+            'memory_gb': memory.used / (1024**3),
+            'disk': psutil.disk_usage('/').percent,
+            'gpu_util': self._get_gpu_util(),
+            'training_active': len(jobs),
+            'training_cpu': sum(job['cpu_percent'] for job in jobs),
+            'training_rss_gb': sum(job['rss_gb'] for job in jobs)
+        }
+
+    def run(self):
+        """Sample on a fixed schedule until stop() is called"""
+        next_run = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self.store.record_many(self.sample())
+            except Exception as e:
+                print(f"⚠️ Sampling failed: {e}")
+            next_run += self.interval
+            self._stop.wait(max(0.0, next_run - time.monotonic()))
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.run, name="metrics-sampler", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+    def _get_gpu_util(self) -> Optional[float]:
+        """nvidia-smi is slow to spawn, so it runs on its own, longer cadence"""
+        if time.monotonic() - self._gpu_checked < self.gpu_interval:
+            return self._gpu_util
+        self._gpu_checked = time.monotonic()
+        try:
+            result = subprocess.run(
+                ["nvidia-smi", "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits"],
+                capture_output=True, text=True, timeout=5
+            )
+            self._gpu_util = float(result.stdout.split()[0]) if result.returncode == 0 else None
+        except (OSError, subprocess.SubprocessError, ValueError, IndexError):
+            self._gpu_util = None
+        return self._gpu_util
+
+
+def acquire_sampler_lock(lock_file: Path = LOCK_FILE):
+    """Return the held lock file, or None if another sampler is already running"""
+    handle = open(lock_file, 'a+')
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        handle.close()
+        return None
+    handle.seek(0)
+    handle.truncate()
+    handle.write(str(os.getpid()))
+    handle.flush()
+    return handle
+
+
+def start_background_sampler(store: MetricsStore, interval: float = 5.0) -> Optional[MetricsSampler]:
+    """Run the sampler in this process unless one is already running elsewhere"""
+    lock = acquire_sampler_lock()
+    if lock is None:
+        return None
+    sampler = MetricsSampler(store, interval)
+    sampler._lock_handle = lock  # held for the life of the process
+    sampler.start()
+    return sampler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HONEY DUO WEALTH metrics sampler")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between samples")
+    parser.add_argument("--export-port", type=int, default=0,
+                        help="Also serve OpenMetrics on this local port (0 = off)")
+    args = parser.parse_args()
+
+    lock = acquire_sampler_lock()
+    if lock is None:
+        print(f"⚠️ Another sampler is already running (see {LOCK_FILE})")
+        sys.exit(1)
+
+    store = MetricsStore()
+    sampler = MetricsSampler(store, args.interval)
+    if args.export_port:
+        exporter = OpenMetricsExporter(store, args.interval)
+        exporter.start()
+        exporter.serve(port=args.export_port)
+        print(f"📡 OpenMetrics on http://127.0.0.1:{args.export_port}/metrics")
+    print(f"📈 Sampling every {args.interval}s into {store.db_path}")
+    try:
+        sampler.run()
+    except KeyboardInterrupt:
+        sampler.stop()
+    finally:
+        store.close()
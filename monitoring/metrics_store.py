@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+HONEY DUO WEALTH - Metrics Time-Series Store
+SQLite (WAL) store with batched writes and 1s -> 1min -> 1h rollups with retention
+"""
+
+import math
+import queue
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Tuple
+
+DEFAULT_DB = Path(__file__).resolve().parent / "metrics.db"
+
+# id is the insert order: readers follow it, so samples flushed late with an older ts are still seen
+RAW_TABLE = """
+CREATE TABLE IF NOT EXISTS metrics_raw (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value REAL,
+    UNIQUE (ts, name)
+);
+"""
+
+SCHEMA = RAW_TABLE + """
+
+CREATE TABLE IF NOT EXISTS metrics_1m (
+    bucket INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    count INTEGER,
+    sum REAL,
+    min REAL,
+    max REAL,
+    PRIMARY KEY (bucket, name)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS metrics_1h (
+    bucket INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    count INTEGER,
+    sum REAL,
+    min REAL,
+    max REAL,
+    PRIMARY KEY (bucket, name)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS llm_calls (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    model TEXT,
+    caller TEXT,
+    status TEXT,
+    error TEXT,
+    prompt_tokens INTEGER,
+    output_tokens INTEGER,
+    queue_wait_sec REAL,
+    ttft_sec REAL,
+    latency_sec REAL,
+    tokens_per_sec REAL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_ts ON llm_calls(ts);
+
+CREATE TABLE IF NOT EXISTS llm_histograms (
+    bucket INTEGER NOT NULL,
+    model TEXT NOT NULL,
+    caller TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    le REAL NOT NULL,
+    count INTEGER,
+    PRIMARY KEY (bucket, model, caller, metric, le)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS training_events (
+    id INTEGER PRIMARY KEY,
+    ai_name TEXT,
+    event_type TEXT,
+    timestamp INTEGER,
+    cpu_peak REAL,
+    memory_peak REAL,
+    duration_sec INTEGER
+);
+"""
+
+# table -> (bucket seconds, retention seconds)
+TIERS = {
+    "metrics_raw": (1, 6 * 3600),
+    "metrics_1m": (60, 14 * 24 * 3600),
+    "metrics_1h": (3600, 365 * 24 * 3600),
+}
+
+LLM_CALL_RETENTION = 14 * 24 * 3600
+# Hourly latency histograms (upper bounds in seconds; the last bucket is open-ended)
+LLM_HISTOGRAM_METRICS = ("latency_sec", "ttft_sec", "queue_wait_sec")
+LLM_HISTOGRAM_BOUNDS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300, math.inf)
+
+
+class MetricsStore:
+    def __init__(self, db_path: Path = DEFAULT_DB, flush_interval: float = 1.0,
+                 prune_interval: float = 600.0):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.prune_interval = prune_interval
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+        self._migrate_raw_table()
+
+        self._queue = queue.Queue()
+        self._llm_queue = queue.Queue()
+        self._stop = threading.Event()
+        self._last_prune = 0.0
+        self._writer = threading.Thread(target=self._writer_loop, name="metrics-writer", daemon=True)
+        self._writer.start()
+
+    def record(self, name: str, value: float, ts: float = None):
+        """Queue one sample; written with the next batch"""
+        self._queue.put((int(ts or time.time()), name, float(value)))
+
+    def record_many(self, values: Dict[str, float], ts: float = None):
+        """Queue several samples taken at the same instant"""
+        ts = int(ts or time.time())
+        for name, value in values.items():
+            if value is not None:
+                self._queue.put((ts, name, float(value)))
+
+    def record_llm_call(self, call: Dict[str, Any]):
+        """Queue one LLM call record (see ai_family/llm_telemetry.py)"""
+        self._llm_queue.put(call)
+
+    def flush(self):
+        """Write everything queued so far (also called by the writer thread)"""
+        samples = self._drain(self._queue)
+        if samples:
+            self._write_batch(samples)
+        calls = self._drain(self._llm_queue)
+        if calls:
+            self._write_llm_calls(calls)
+
+    def query(self, names: Iterable[str], since: float, until: float = None,
+              max_points: int = 500, step: int = None) -> List[Dict[str, Any]]:
+        """Rows of {timestamp, <name>: avg, ...} at the coarsest step that keeps <= max_points (or at step)"""
+        names = list(names)
+        until = int(until or time.time())
+        since = int(since)
+        step = step or self.step_for(until - since, max_points)
+        table = self._table_for_step(step)
+        resolution = TIERS[table][0]
+        step = math.ceil(step / resolution) * resolution
+
+        placeholders = ", ".join("?" for _ in names)
+        if table == "metrics_raw":
+            sql = f"""
+                SELECT (ts / {step}) * {step} AS t, name, AVG(value)
+                FROM metrics_raw
+                WHERE ts >= ? AND ts <= ? AND name IN ({placeholders})
+                GROUP BY t, name ORDER BY t
+            """
+        else:
+            sql = f"""
+                SELECT (bucket / {step}) * {step} AS t, name, SUM(sum) / SUM(count)
+                FROM {table}
+                WHERE bucket >= ? AND bucket <= ? AND name IN ({placeholders})
+                GROUP BY t, name ORDER BY t
+            """
+
+        with self._lock:
+            rows = self.conn.execute(sql, [since - since % resolution, until, *names]).fetchall()
+
+        series = {}
+        for t, name, value in rows:
+            series.setdefault(t, {"timestamp": t})[name] = value
+        return list(series.values())
+
+    def fetch_since(self, names: Iterable[str], after_id: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Raw rows written after after_id (a client's cursor) as {timestamp, <name>: value, ...} in timestamp
+        order, and the new cursor (names=None: all). Late samples can be older than rows already returned"""
+        with self._lock:
+            if names is None:
+                rows = self.conn.execute(
+                    "SELECT id, ts, name, value FROM metrics_raw WHERE id > ? ORDER BY id", (int(after_id),)
+                ).fetchall()
+            else:
+                names = list(names)
+                placeholders = ", ".join("?" for _ in names)
+                rows = self.conn.execute(f"""
+                    SELECT id, ts, name, value FROM metrics_raw
+                    WHERE id > ? AND name IN ({placeholders}) ORDER BY id
+                """, [int(after_id), *names]).fetchall()
+
+        series = {}
+        for _, ts, name, value in rows:
+            series.setdefault(ts, {"timestamp": ts})[name] = value
+        return sorted(series.values(), key=lambda row: row["timestamp"]), (rows[-1][0] if rows else int(after_id))
+
+    def max_metric_id(self) -> int:
+        """Cursor for fetch_since at the current end of the raw table"""
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM metrics_raw").fetchone()[0]
+
+    def metric_id_before(self, ts: float) -> int:
+        """Cursor for fetch_since that starts with the first raw row at or after ts"""
+        with self._lock:
+            row = self.conn.execute("SELECT MIN(id) FROM metrics_raw WHERE ts >= ?", (int(ts),)).fetchone()
+            if row[0] is not None:
+                return row[0] - 1
+            return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM metrics_raw").fetchone()[0]
+
+    def llm_calls_since(self, after_id: int, limit: int = 5000) -> Tuple[List[Dict[str, Any]], int]:
+        """LLM call records with id > after_id (a client's cursor) and the new cursor"""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT id, ts, model, caller, status, prompt_tokens, output_tokens,
+                       latency_sec, ttft_sec, queue_wait_sec
+                FROM llm_calls WHERE id > ? ORDER BY id LIMIT ?
+            """, (int(after_id), limit)).fetchall()
+        columns = ("id", "ts", "model", "caller", "status", "prompt_tokens", "output_tokens",
+                   "latency_sec", "ttft_sec", "queue_wait_sec")
+        return [dict(zip(columns, row)) for row in rows], (rows[-1][0] if rows else int(after_id))
+
+    def max_llm_call_id(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM llm_calls").fetchone()[0]
+
+    def llm_percentiles(self, since: float, metric: str = "latency_sec",
+                        percentiles=(50, 95, 99)) -> List[Dict[str, Any]]:
+        """Per model and caller: call/error counts and percentiles estimated from the hourly histograms"""
+        with self._lock:
+            hist_rows = self.conn.execute("""
+                SELECT model, caller, le, SUM(count) FROM llm_histograms
+                WHERE bucket >= ? AND metric = ?
+                GROUP BY model, caller, le ORDER BY model, caller, le
+            """, (int(since) - int(since) % 3600, metric)).fetchall()
+            count_rows = self.conn.execute("""
+                SELECT model, caller, COUNT(*), SUM(status != 'success') FROM llm_calls
+                WHERE ts >= ? GROUP BY model, caller
+            """, (since,)).fetchall()
+
+        histograms = defaultdict(list)
+        for model, caller, le, count in hist_rows:
+            histograms[(model, caller)].append((le, count))
+
+        results = []
+        for model, caller, calls, errors in count_rows:
+            row = {"model": model, "caller": caller, "calls": calls, "errors": errors}
+            for pct in percentiles:
+                row[f"p{pct}"] = self._histogram_percentile(histograms.get((model, caller), []), pct)
+            results.append(row)
+        return results
+
+    def max_ts(self) -> int:
+        """Newest raw timestamp written so far (0 when empty)"""
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(MAX(ts), 0) FROM metrics_raw").fetchone()[0]
+
+    def latest(self, names: Iterable[str]) -> Dict[str, float]:
+        """Most recent raw value of each metric"""
+        result = {}
+        with self._lock:
+            for name in names:
+                row = self.conn.execute(
+                    "SELECT value FROM metrics_raw WHERE name = ? ORDER BY ts DESC LIMIT 1", (name,)
+                ).fetchone()
+                if row:
+                    result[name] = row[0]
+        return result
+
+    def record_training_event(self, ai_name: str, event_type: str, cpu_peak: float = None,
+                              memory_peak: float = None, duration_sec: int = None, ts: float = None):
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO training_events (ai_name, event_type, timestamp, cpu_peak, memory_peak, duration_sec) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (ai_name, event_type, int(ts or time.time()), cpu_peak, memory_peak, duration_sec)
+            )
+            self.conn.commit()
+
+    def training_events(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent training runs with their resource peaks"""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT ai_name, event_type, timestamp, cpu_peak, memory_peak, duration_sec
+                FROM training_events ORDER BY timestamp DESC LIMIT ?
+            """, (limit,)).fetchall()
+        columns = ("ai_name", "event_type", "timestamp", "cpu_peak", "memory_peak", "duration_sec")
+        return [dict(zip(columns, row)) for row in rows]
+
+    def training_events_since(self, after_id: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Training events with id > after_id and the new cursor"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT id, ai_name, event_type FROM training_events WHERE id > ? ORDER BY id", (int(after_id),)
+            ).fetchall()
+        return [dict(zip(("id", "ai_name", "event_type"), row)) for row in rows], (rows[-1][0] if rows else int(after_id))
+
+    def max_training_event_id(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM training_events").fetchone()[0]
+
+    def prune(self, now: float = None):
+        """Apply per-tier retention"""
+        now = int(now or time.time())
+        with self._lock:
+            for table, (_, retention) in TIERS.items():
+                column = "ts" if table == "metrics_raw" else "bucket"
+                self.conn.execute(f"DELETE FROM {table} WHERE {column} < ?", (now - retention,))
+            self.conn.execute("DELETE FROM llm_calls WHERE ts < ?", (now - LLM_CALL_RETENTION,))
+            self.conn.execute("DELETE FROM llm_histograms WHERE bucket < ?", (now - TIERS["metrics_1h"][1],))
+            self.conn.commit()
+
+    def close(self):
+        self._stop.set()
+        self._writer.join(timeout=5)
+        self.flush()
+        with self._lock:
+            self.conn.close()
+
+    def _migrate_raw_table(self):
+        """Rebuild a metrics_raw from before the id column (raw keeps hours, so the copy is small)"""
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(metrics_raw)")]
+        if "id" in columns:
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have migrated while we waited for the write lock
+            if "id" not in [row[1] for row in self.conn.execute("PRAGMA table_info(metrics_raw)")]:
+                self.conn.execute("ALTER TABLE metrics_raw RENAME TO metrics_raw_old")
+                self.conn.execute(RAW_TABLE)
+                self.conn.execute("INSERT INTO metrics_raw (ts, name, value) "
+                                  "SELECT ts, name, value FROM metrics_raw_old ORDER BY ts")
+                self.conn.execute("DROP TABLE metrics_raw_old")
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+
+    def _writer_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+                if time.time() - self._last_prune > self.prune_interval:
+                    self.prune()
+                    self._last_prune = time.time()
+            except sqlite3.Error as e:
+                print(f"⚠️ Metrics store write failed: {e}")
+
+    def _write_batch(self, samples: List[tuple]):
+        with self._lock:
+            # One transaction per batch, holding the write lock from the start so other writer processes
+            # queue behind it; any error rolls the whole batch back
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Raw keeps one sample per (second, name), the first, and the rollups count exactly those
+                inserted = [sample for sample in samples if self.conn.execute(
+                    "INSERT OR IGNORE INTO metrics_raw (ts, name, value) VALUES (?, ?, ?)", sample).rowcount]
+                self._upsert_rollups(inserted)
+                self.conn.commit()
+            except sqlite3.Error:
+                self.conn.rollback()
+                raise
+
+    def _upsert_rollups(self, samples: List[tuple]):
+        # Pre-aggregate the batch so each rollup bucket is one upsert
+        rollups = {table: defaultdict(lambda: [0, 0.0, math.inf, -math.inf])
+                   for table in ("metrics_1m", "metrics_1h")}
+        for ts, name, value in samples:
+            for table, agg in rollups.items():
+                size = TIERS[table][0]
+                bucket = agg[(ts - ts % size, name)]
+                bucket[0] += 1
+                bucket[1] += value
+                bucket[2] = min(bucket[2], value)
+                bucket[3] = max(bucket[3], value)
+
+        for table, agg in rollups.items():
+            self.conn.executemany(f"""
+                INSERT INTO {table} (bucket, name, count, sum, min, max) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(bucket, name) DO UPDATE SET
+                    count = count + excluded.count, sum = sum + excluded.sum,
+                    min = MIN(min, excluded.min), max = MAX(max, excluded.max)
+            """, [(bucket, name, *values) for (bucket, name), values in agg.items()])
+
+    def _write_llm_calls(self, calls: List[Dict[str, Any]]):
+        histogram = defaultdict(int)
+        for call in calls:
+            bucket = int(call["ts"]) - int(call["ts"]) % 3600
+            for metric in LLM_HISTOGRAM_METRICS:
+                value = call.get(metric)
+                if value is not None:
+                    le = next(bound for bound in LLM_HISTOGRAM_BOUNDS if value <= bound)
+                    histogram[(bucket, call["model"], call["caller"], metric, le)] += 1
+
+        columns = ("ts", "model", "caller", "status", "error", "prompt_tokens", "output_tokens",
+                   "queue_wait_sec", "ttft_sec", "latency_sec", "tokens_per_sec")
+        with self._lock:
+            self.conn.executemany(
+                f"INSERT INTO llm_calls ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                [tuple(call.get(column) for column in columns) for call in calls]
+            )
+            self.conn.executemany("""
+                INSERT INTO llm_histograms (bucket, model, caller, metric, le, count) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(bucket, model, caller, metric, le) DO UPDATE SET count = count + excluded.count
+            """, [(*key, count) for key, count in histogram.items()])
+            self.conn.commit()
+
+    @staticmethod
+    def _histogram_percentile(buckets: List[tuple], pct: float):
+        """Linear interpolation inside the bucket holding the pct-th observation"""
+        total = sum(count for _, count in buckets)
+        if not total:
+            return None
+        target = pct / 100 * total
+        seen, lower = 0, 0.0
+        for le, count in buckets:
+            if seen + count >= target:
+                if math.isinf(le):
+                    return lower  # open-ended bucket: best bound we have
+                return round(lower + (le - lower) * (target - seen) / count, 3)
+            seen += count
+            lower = le
+        return lower
+
+    @staticmethod
+    def _drain(q: queue.Queue) -> List:
+        items = []
+        while True:
+            try:
+                items.append(q.get_nowait())
+            except queue.Empty:
+                return items
+
+    @staticmethod
+    def step_for(window_sec: float, max_points: int) -> int:
+        """Smallest step giving <= max_points over the window, from a tier whose retention still covers it"""
+        step = max(1, math.ceil(window_sec / max_points))
+        covering = [resolution for resolution, retention in TIERS.values() if retention >= window_sec]
+        return max(step, min(covering)) if covering else max(step, TIERS["metrics_1h"][0])
+
+    @staticmethod
+    def _table_for_step(step: int) -> str:
+        if step < 60:
+            return "metrics_raw"
+        if step < 3600:
+            return "metrics_1m"
+        return "metrics_1h"
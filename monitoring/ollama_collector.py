@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+HONEY DUO WEALTH - Ollama Resource Collector
+Loaded models, their memory and expiry from the Ollama HTTP API, plus runner process RSS/CPU
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+import psutil
+import requests
+
+# Blueprint allocation for the AI family's LLM stack
+LLM_BUDGET_GB = 38
+MODEL_BUDGETS_GB = {"mistral:7b": 4, "mixtral:8x7b": 26, "llama2:13b": 8}
+
+GB = 1024**3
+
+
+class OllamaCollector:
+    def __init__(self, base_url: str = "http://localhost:11434", ttl: float = 10.0,
+                 tags_ttl: float = 60.0, process_scan_ttl: float = 30.0, timeout: float = 2.0):
+        self.base_url = base_url.rstrip("/")
+        self.ttl = ttl
+        self.tags_ttl = tags_ttl
+        self.process_scan_ttl = process_scan_ttl
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._cached: Optional[Dict[str, Any]] = None
+        self._cached_at = 0.0
+        self._tags: List[str] = []
+        self._tags_at = 0.0
+        self._runners: Dict[int, psutil.Process] = {}
+        self._runners_scanned_at = 0.0
+        self._loaded_names = ()
+        self._blob_models: Dict[str, str] = {}  # model blob path -> model name (from /api/show)
+        self._shown_models = set()
+
+    def collect(self) -> Dict[str, Any]:
+        """Cached snapshot; at most one round of HTTP calls per ttl"""
+        with self._lock:
+            if self._cached is not None and time.monotonic() - self._cached_at < self.ttl:
+                return self._cached
+            self._cached = self._collect()
+            self._cached_at = time.monotonic()
+            return self._cached
+
+    def is_online(self) -> bool:
+        return self.collect()["online"]
+
+    def _collect(self) -> Dict[str, Any]:
+        try:
+            loaded = self._get_json("/api/ps").get("models", [])
+            available = self._get_tags()
+        except (requests.RequestException, ValueError):
+            return {"online": False, "available": [], "loaded": [], "runners": [],
+                    "loaded_gb": 0.0, "budget_gb": LLM_BUDGET_GB, "timestamp": datetime.now().isoformat()}
+
+        models = []
+        for model in loaded:
+            name = model.get("name", "")
+            models.append({
+                "name": name,
+                "size_gb": round(model.get("size", 0) / GB, 2),
+                "vram_gb": round(model.get("size_vram", 0) / GB, 2),
+                "budget_gb": MODEL_BUDGETS_GB.get(name),
+                "expires_at": model.get("expires_at")
+            })
+
+        names = tuple(sorted(m["name"] for m in models))
+        runners = self._runner_usage(rescan=names != self._loaded_names)
+        self._loaded_names = names
+        for name in names:
+            self._learn_blob(name)
+
+        return {
+            "online": True,
+            "available": available,
+            "loaded": models,
+            "runners": runners,
+            "loaded_gb": round(sum(m["size_gb"] for m in models), 2),
+            "runner_rss_gb": round(sum(r["rss_gb"] for r in runners), 2),
+            "runner_cpu_percent": round(sum(r["cpu_percent"] for r in runners), 1),
+            "budget_gb": LLM_BUDGET_GB,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def _get_tags(self) -> List[str]:
+        """Installed models change rarely - refreshed on a slower cadence"""
+        if time.monotonic() - self._tags_at > self.tags_ttl:
+            self._tags = [m.get("name", "") for m in self._get_json("/api/tags").get("models", [])]
+            self._tags_at = time.monotonic()
+        return self._tags
+
+    def _runner_usage(self, rescan: bool) -> List[Dict[str, Any]]:
+        """RSS/CPU of ollama processes; the process table is only rescanned when models change"""
+        if rescan or time.monotonic() - self._runners_scanned_at > self.process_scan_ttl:
+            found = {}
+            for proc in psutil.process_iter(['name']):
+                if 'ollama' in (proc.info.get('name') or '').lower():
+                    # Keep existing Process objects so cpu_percent() measures since the last collect
+                    found[proc.pid] = self._runners.get(proc.pid, proc)
+            self._runners = found
+            self._runners_scanned_at = time.monotonic()
+
+        usage = []
+        for pid, proc in list(self._runners.items()):
+            try:
+                with proc.oneshot():
+                    cmdline = proc.cmdline()
+                    usage.append({
+                        "pid": pid,
+                        "role": "runner" if "runner" in cmdline or "--model" in cmdline else "server",
+                        "model": self._model_for_cmdline(cmdline),
+                        "rss_gb": round(proc.memory_info().rss / GB, 2),
+                        "cpu_percent": proc.cpu_percent(interval=None)
+                    })
+            except psutil.Error:
+                self._runners.pop(pid, None)
+        return usage
+
+    def _learn_blob(self, name: str):
+        """Map a model's weights blob to its name once, so runner processes can be attributed"""
+        if name in self._shown_models:
+            return
+        try:
+            response = requests.post(f"{self.base_url}/api/show", json={"model": name}, timeout=self.timeout)
+            response.raise_for_status()
+            modelfile = response.json().get("modelfile", "")
+        except (requests.RequestException, ValueError):
+            return  # Retried on the next collect
+        self._shown_models.add(name)
+        for line in modelfile.splitlines():
+            if line.startswith("FROM /"):
+                self._blob_models[line[5:].strip()] = name
+
+    def _model_for_cmdline(self, cmdline: List[str]) -> Optional[str]:
+        if "--model" in cmdline:
+            index = cmdline.index("--model") + 1
+            if index < len(cmdline):
+                return self._blob_models.get(cmdline[index])
+        return None
+
+    def _get_json(self, path: str) -> Dict[str, Any]:
+        response = requests.get(f"{self.base_url}{path}", timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
@@ -6,15 +6,128 @@ Real-time monitoring and control of AI family training
 
 import streamlit as st
 import json
+import sys
+import threading
+import time
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import plotly.graph_objects as go
 import plotly.express as px
 
+class DataCache:
+    """Loader results kept for a TTL, dropped early when any watched file's mtime changes"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> (loaded_at, signature, value)
+        
+    def get(self, key, loader, ttl, watch=()):
+        signature = self._signature(watch)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() - entry[0] < ttl and entry[1] == signature:
+                return entry[2]
+        value = loader()
+        with self._lock:
+            self._entries[key] = (time.monotonic(), signature, value)
+        return value
+        
+    def peek(self, key, default=None):
+        """Last loaded value for key, however old"""
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry[2] if entry else default
+        
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            
+    @staticmethod
+    def _signature(paths):
+        signature = []
+        for path in paths:
+            try:
+                signature.append(path.stat().st_mtime_ns)
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+class ActionRunner:
+    """Runs long dashboard actions one at a time off the render thread"""
+    
+    def __init__(self, on_done=None):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dashboard-action")
+        self._lock = threading.Lock()
+        self._actions = []
+        self._on_done = on_done
+        
+    def submit(self, label, fn, *args):
+        action = {"label": label, "state": "queued", "result": None,
+                  "submitted": datetime.now().strftime("%H:%M:%S")}
+        with self._lock:
+            self._actions.append(action)
+        self._executor.submit(self._run, action, fn, args)
+        return action
+        
+    def actions(self, limit=10):
+        with self._lock:
+            return [dict(action) for action in self._actions[-limit:]]
+            
+    def busy(self):
+        return any(action["state"] in ("queued", "running") for action in self.actions())
+        
+    def _run(self, action, fn, args):
+        action["state"] = "running"
+        try:
+            action["result"] = fn(*args)
+            action["state"] = "done"
+        except Exception as e:
+            action["result"] = str(e)
+            action["state"] = "failed"
+        if self._on_done:
+            self._on_done()
+
+@st.cache_resource
+def get_training_manager(project_root: str):
+    """One manager (and job runner) per Streamlit server, shared across reruns"""
+    sys.path.append(project_root)
+    from ai_family.llm_training_manager import LLMTrainingManager
+    manager = LLMTrainingManager(project_root)
+    manager.resume_training_jobs()
+    return manager
+
+@st.cache_resource
+def get_data_cache():
+    """Dashboard data shared by every session"""
+    return DataCache()
+
+@st.cache_resource
+def get_action_runner():
+    """Background actions; finished actions drop cached data so the next render reloads it"""
+    return ActionRunner(on_done=get_data_cache().invalidate)
+
 class TrainingDashboard:
     def __init__(self):
         self.project_root = Path("~/honey_duo_wealth").expanduser()
+        self._manager = None
+        self.cache = get_data_cache()
+        self.actions = get_action_runner()
+        
+        ai_family = self.project_root / "ai_family"
+        registry_db = ai_family / "models" / "registry.db"
+        # Registry writes land in the WAL first, so both files are watched
+        self.registry_files = (registry_db, Path(f"{registry_db}-wal"))
+        self.jobs_dir = ai_family / "training_jobs"
+        self.summary_file = ai_family / "claudae" / "training" / "training_summary.json"
+        
+    @property
+    def manager(self):
+        """Training manager backed by the model registry"""
+        if self._manager is None:
+            self._manager = get_training_manager(str(self.project_root))
+        return self._manager
         
     def run(self):
         st.set_page_config(page_title="HONEY DUO WEALTH Training", layout="wide")
@@ -39,6 +152,7 @@ class TrainingDashboard:
             
         # Training controls
         st.markdown("---")
+        self.show_training_jobs()
         self.show_training_controls(selected_ai)
         
     def show_training_status(self):
@@ -127,6 +241,42 @@ class TrainingDashboard:
         else:
             st.info("No training data collected yet")
             
+    def show_training_jobs(self):
+        """Display progress of background training jobs, refreshed on its own while any job is active"""
+        st.subheader("⏳ Training Jobs")
+        jobs = self.get_training_jobs()  # loads the manager, which puts ai_family on the path
+        from ai_family.training_jobs import ACTIVE_STATES
+        
+        polling = any(job["state"] in ACTIVE_STATES for job in jobs)
+        st.fragment(self._render_training_jobs, run_every="2s" if polling else None)(polling, ACTIVE_STATES)
+        
+    def get_training_jobs(self):
+        return self.cache.get("jobs", self.manager.job_runner.list_jobs, ttl=5, watch=self._job_watch_files())
+        
+    def _render_training_jobs(self, polling, active_states):
+        jobs = self.get_training_jobs()
+        if polling and not any(job["state"] in active_states for job in jobs):
+            st.rerun()  # Last job finished: redraw the whole page so status and versions pick it up
+        if not jobs:
+            st.info("No training jobs yet")
+            return
+            
+        for job in jobs[-5:]:
+            total = job.get("total_steps") or 0
+            step = job.get("step") or 0
+            st.write(f"**{job['ai_name'].upper()} {job['version']}** - {job['state']}")
+            st.progress(min(1.0, step / total) if total else 0.0)
+            
+            eta = f"{job['eta_sec']:.0f}s" if job.get("eta_sec") is not None else "-"
+            loss = f"{job['loss']:.4f}" if job.get("loss") is not None else "-"
+            st.caption(f"Step {step}/{total or '?'} | Loss {loss} | "
+                       f"{job.get('samples_per_sec', 0)} samples/s | ETA {eta}")
+            
+    def _job_watch_files(self):
+        """New job records change the jobs dir; progress lands in each version's training_status.json"""
+        status_files = sorted({job["status_file"] for job in self.cache.peek("jobs", []) if job.get("status_file")})
+        return (self.jobs_dir,) + tuple(Path(status_file) for status_file in status_files)
+            
     def show_training_controls(self, selected_ai):
         """Display training control panel"""
         st.subheader("🎮 Training Controls")
@@ -135,28 +285,26 @@ class TrainingDashboard:
         
         with col1:
             if st.button("📊 Generate Dataset"):
-                with st.spinner("Generating dataset..."):
-                    result = self.generate_dataset(selected_ai)
-                st.success(f"Dataset generated: {result}")
+                self.actions.submit(f"Generate dataset ({selected_ai})", self.generate_dataset, selected_ai)
                 
         with col2:
             if st.button("🎓 Start Training"):
-                with st.spinner("Starting training..."):
-                    result = self.start_training(selected_ai)
-                st.success(f"Training started: {result}")
+                self.actions.submit(f"Start training ({selected_ai})", self.start_training, selected_ai)
                 
         with col3:
             if st.button("✅ Validate Model"):
-                with st.spinner("Validating model..."):
-                    result = self.validate_model(selected_ai)
-                st.success(f"Validation complete: {result}")
+                self.actions.submit(f"Validate ({selected_ai})", self.validate_model, selected_ai)
                 
         with col4:
-            if st.button("🚀 Deploy Model"):
-                with st.spinner("Deploying model..."):
-                    result = self.deploy_model(selected_ai)
-                st.success(f"Model deployed: {result}")
+            status = self.get_training_status()
+            deployable = [ai for ai in self._target_ais(selected_ai)
+                          if status.get(ai, {}).get("latest_status") == "validated"]
+            if st.button("🚀 Deploy Model", disabled=not deployable,
+                         help="Deploys the latest version once it has been validated"):
+                self.actions.submit(f"Deploy ({selected_ai})", self.deploy_model, selected_ai)
                 
+        self.show_actions()
+        
         # Advanced controls
         with st.expander("Advanced Training Options"):
             col1, col2 = st.columns(2)
@@ -179,90 +327,126 @@ class TrainingDashboard:
             }
             
             if st.button("🔧 Apply Custom Training"):
-                with st.spinner("Applying custom training configuration..."):
-                    result = self.custom_training(selected_ai, training_config)
-                st.success(f"Custom training applied: {result}")
+                self.actions.submit(f"Custom training ({selected_ai})", self.custom_training,
+                                    selected_ai, training_config)
+                
+    def show_actions(self):
+        """Background action progress, refreshed on its own only while anything is pending"""
+        polling = self.actions.busy()
+        st.fragment(self._render_actions, run_every="2s" if polling else None)(polling)
+        
+    def _render_actions(self, polling):
+        if polling and not self.actions.busy():
+            st.rerun()  # Last action finished: redraw the whole page with fresh data, which stops the polling
+        for action in reversed(self.actions.actions()):
+            icon = {"queued": "⏳", "running": "🔄", "done": "✅", "failed": "❌"}[action["state"]]
+            result = f" - {action['result']}" if action["result"] else ""
+            st.caption(f"{icon} {action['submitted']} {action['label']}{result}")
                 
     def get_training_status(self):
         """Get current training status"""
-        # Mock data - integrate with actual training manager
-        return {
-            "claudae": {
-                "total_versions": 2,
-                "latest_version": "v2",
-                "production_status": "Deployed",
-                "training_examples": 15
-            },
-            "nyala": {
-                "total_versions": 1,
-                "latest_version": "v1", 
-                "production_status": "Training",
-                "training_examples": 8
-            },
-            "deon": {
-                "total_versions": 1,
-                "latest_version": "v1",
-                "production_status": "Not Deployed",
-                "training_examples": 5
-            }
-        }
+        return self.cache.get("status", self.manager.get_model_status, ttl=30,
+                              watch=self.registry_files + (self.summary_file,))
         
     def get_version_timeline(self):
         """Get version timeline data"""
+        return self.cache.get("timeline", self._load_version_timeline, ttl=60, watch=self.registry_files)
+        
+    def _load_version_timeline(self):
+        now = datetime.now().isoformat()
         return [
-            {"ai_name": "CLAUDAE", "version": "v1", "start": "2025-06-01", "end": "2025-06-02"},
-            {"ai_name": "CLAUDAE", "version": "v2", "start": "2025-06-03", "end": "2025-06-04"},
-            {"ai_name": "NYALA", "version": "v1", "start": "2025-06-03", "end": "2025-06-04"},
-            {"ai_name": "DEON", "version": "v1", "start": "2025-06-04", "end": "2025-06-05"}
+            {
+                "ai_name": row["ai_name"].upper(),
+                "version": row["version"],
+                "start": row["created"],
+                "end": row["superseded"] or now
+            }
+            for row in self.manager.registry.version_timeline()
         ]
         
     def get_training_metrics(self):
         """Get training metrics over time"""
+        return self.cache.get("metrics", self._load_training_metrics, ttl=60, watch=self.registry_files)
+        
+    def _load_training_metrics(self):
         return [
-            {"ai_name": "claudae", "date": "2025-06-01", "performance": 0.75},
-            {"ai_name": "claudae", "date": "2025-06-02", "performance": 0.82},
-            {"ai_name": "claudae", "date": "2025-06-03", "performance": 0.88},
-            {"ai_name": "nyala", "date": "2025-06-02", "performance": 0.70},
-            {"ai_name": "nyala", "date": "2025-06-03", "performance": 0.78},
-            {"ai_name": "deon", "date": "2025-06-03", "performance": 0.73}
+            {
+                "ai_name": row["ai_name"],
+                "date": row["created"],
+                "performance": row["metrics"].get("average_score", 0),
+                "tokens_per_sec": row["metrics"].get("avg_tokens_per_sec", 0)
+            }
+            for row in self.manager.registry.metrics_history()
         ]
         
     def get_data_insights(self):
         """Get training data insights"""
+        return self.cache.get("insights", self._load_data_insights, ttl=300, watch=(self.summary_file,))
+        
+    def _load_data_insights(self):
+        """Category counts from the collector's last summary (no corpus rescan)"""
+        try:
+            with open(self.summary_file) as f:
+                summary = json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
         return {
-            "categories": {
-                "Market Data": 8,
-                "AI Integration": 4,
-                "Trading": 6,
-                "Monitoring": 3
-            },
-            "recent_sessions": [
-                "market_data_pipeline (4 examples)",
-                "ai_data_integration (2 examples)", 
-                "nyala_integration (3 examples)",
-                "full_pipeline_test (1 example)"
-            ]
+            "categories": summary.get("categories", {}),
+            "recent_sessions": summary.get("recent_activity", [])
         }
         
+    def _target_ais(self, ai_name):
+        return self.manager.ai_names if ai_name == "all" else [ai_name]
+        
     def generate_dataset(self, ai_name):
         """Generate training dataset"""
-        return f"Dataset generated for {ai_name} with 15 examples"
+        results = self.manager.prepare_training_datasets(self._target_ais(ai_name))
+        return ", ".join(f"{ai}: {result['examples']} examples" for ai, result in results.items())
         
-    def start_training(self, ai_name):
-        """Start model training"""
-        return f"Training started for {ai_name} v3"
+    def start_training(self, ai_name, training_params=None):
+        """Start model training in the background"""
+        params = training_params or {"epochs": 3, "batch_size": 4, "learning_rate": 2e-5}
+        started = []
+        for ai in self._target_ais(ai_name):
+            version_id, _ = self.manager.create_model_version(ai, self.manager.base_models[ai], "Dashboard training run")
+            result = self.manager.fine_tune_model(ai, version_id, params, wait=False)
+            started.append(result["job_id"])
+        return ", ".join(started)
         
     def validate_model(self, ai_name):
-        """Validate trained model"""
-        return f"Validation passed: 87% accuracy for {ai_name}"
+        """Validate the latest version of each AI"""
+        results = []
+        for ai in self._target_ais(ai_name):
+            version = self.manager.get_model_status(ai)[ai]["latest_version"]
+            if not version:
+                results.append(f"{ai}: no versions")
+                continue
+            try:
+                metrics = self.manager.validate_model(ai, version)
+            except ValueError as e:
+                results.append(str(e))
+                continue
+            results.append(f"{ai} {version}: {metrics.get('average_score', 0):.2f}")
+        return ", ".join(results)
         
     def deploy_model(self, ai_name):
-        """Deploy model to production"""
-        return f"{ai_name} v3 deployed to production"
+        """Deploy the latest version of each AI to production, if it has been validated"""
+        deployed = []
+        for ai in self._target_ais(ai_name):
+            status = self.manager.get_model_status(ai)[ai]
+            version = status["latest_version"]
+            if not version:
+                continue
+            if status["latest_status"] != "validated":
+                deployed.append(f"{ai} {version}: not validated ({status['latest_status']})")
+                continue
+            self.manager.deploy_model(ai, version)
+            deployed.append(f"{ai} {version}")
+        return ", ".join(deployed) or "nothing to deploy"
         
     def custom_training(self, ai_name, config):
         """Apply custom training configuration"""
-        return f"Custom training applied to {ai_name}: {config}"
+        return self.start_training(ai_name, config)
 
 if __name__ == "__main__":
     dashboard = TrainingDashboard()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+HONEY DUO WEALTH - Training Process Tracker
+Follows training jobs through the job runner's pidfiles and records their CPU/RSS peaks
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Any
+
+import psutil
+
+DEFAULT_JOBS_DIR = Path(__file__).resolve().parent.parent / "ai_family" / "training_jobs"
+
+GB = 1024**3
+# Allowance between psutil create_time() and the "started" time the runner writes to the pidfile
+PID_CLOCK_SLACK_SEC = 2.0
+
+
+class TrainingProcessTracker:
+    def __init__(self, store, jobs_dir: Path = DEFAULT_JOBS_DIR):
+        self.store = store
+        self.pid_dir = Path(jobs_dir) / "pids"  # training_jobs.PID_DIR_NAME
+        self._tracked: Dict[int, Dict[str, Any]] = {}
+        self._dir_mtime = None
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Sample every registered trainer; finished ones are written to training_events"""
+        self._sync_registrations()
+
+        active = []
+        for pid, entry in list(self._tracked.items()):
+            try:
+                with entry["process"].oneshot():
+                    cpu = entry["process"].cpu_percent(interval=None)
+                    rss = entry["process"].memory_info().rss
+            except psutil.Error:
+                self._finish(pid)
+                continue
+            entry["cpu_peak"] = max(entry["cpu_peak"], cpu)
+            entry["rss_peak"] = max(entry["rss_peak"], rss)
+            active.append({
+                "job_id": entry["job_id"],
+                "ai_name": entry["ai_name"],
+                "pid": pid,
+                "cpu_percent": cpu,
+                "rss_gb": round(rss / GB, 2),
+                "cpu_peak": entry["cpu_peak"],
+                "rss_peak_gb": round(entry["rss_peak"] / GB, 2),
+                "running_sec": int(time.time() - entry["started"])
+            })
+        return active
+
+    def _sync_registrations(self):
+        """Re-read the pid directory only when its contents changed"""
+        try:
+            mtime = self.pid_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime == self._dir_mtime:
+            return
+        self._dir_mtime = mtime
+
+        registered = {}
+        if mtime is not None:
+            for entry in os.scandir(self.pid_dir):
+                if not entry.name.endswith(".pid"):
+                    continue
+                try:
+                    with open(entry.path) as f:
+                        info = json.load(f)
+                    registered[info["pid"]] = info
+                except (OSError, json.JSONDecodeError, KeyError):
+                    continue
+
+        for pid in [pid for pid in self._tracked if pid not in registered]:
+            self._finish(pid)
+
+        for pid, info in registered.items():
+            if pid in self._tracked:
+                continue
+            try:
+                process = psutil.Process(pid)
+                if not self._is_registered_trainer(process, info):
+                    continue
+                process.cpu_percent(interval=None)  # prime the counter
+            except psutil.Error:
+                continue
+            self._tracked[pid] = dict(info, process=process, cpu_peak=0.0, rss_peak=0,
+                                      started=info.get("started", time.time()))
+
+    @staticmethod
+    def _is_registered_trainer(process: psutil.Process, info: Dict[str, Any]) -> bool:
+        """A stale pidfile's PID may belong to a newer, unrelated process"""
+        # The runner registers right after starting the trainer, so the trainer cannot be younger
+        if "started" in info and process.create_time() > info["started"] + PID_CLOCK_SLACK_SEC:
+            return False
+        return "script" not in info or info["script"] in process.cmdline()
+
+    def _finish(self, pid: int):
+        entry = self._tracked.pop(pid, None)
+        if entry is None:
+            return
+        state = "ended"
+        try:
+            with open(entry["status_file"]) as f:
+                state = json.load(f).get("state", state)
+        except (OSError, json.JSONDecodeError, KeyError):
+            pass
+        if state in ("queued", "running"):
+            state = "ended"  # exited before the runner recorded the outcome
+        self.store.record_training_event(
+            entry["ai_name"], f"training_{state}",
+            cpu_peak=entry["cpu_peak"],
+            memory_peak=round(entry["rss_peak"] / GB, 3),
+            duration_sec=int(time.time() - entry["started"]),
+            ts=entry["started"]
+        )
@@ -6,13 +6,17 @@ System health and training monitoring with historical data
 
 import streamlit as st
 import psutil
-import subprocess
-import pandas as pd
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import sqlite3
+from datetime import datetime
 from pathlib import Path
-import time
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from monitoring.metrics_store import MetricsStore
+from monitoring.metrics_sampler import start_background_sampler
+from monitoring.chart_data import ChartDataCache, cached_figure
+from monitoring.ollama_collector import OllamaCollector
+from monitoring.alerting import FileSink
 
 st.set_page_config(
     page_title="HONEY DUO WEALTH Monitor",
@@ -21,15 +25,18 @@ st.set_page_config(
 )
 
 def get_system_metrics():
+    """Latest sampler readings - the page itself never samples"""
+    latest = get_metrics_store().latest(['cpu', 'memory', 'memory_gb', 'disk'])
     return {
-        'cpu': psutil.cpu_percent(interval=0.1),
-        'memory': psutil.virtual_memory().percent,
-        'memory_gb': psutil.virtual_memory().used / (1024**3),
-        'disk': psutil.disk_usage('/').percent,
+        'cpu': latest.get('cpu', 0.0),
+        'memory': latest.get('memory', 0.0),
+        'memory_gb': latest.get('memory_gb', 0.0),
+        'disk': latest.get('disk', 0.0),
         'storage': get_storage_info(),
         'ollama': check_ollama()
     }
 
+@st.cache_data(ttl=60)
 def get_storage_info():
     """Get detailed storage information"""
     storage = {}
@@ -51,12 +58,13 @@ def get_storage_info():
     
     return storage
 
+@st.cache_resource
+def get_ollama_collector():
+    """Shared collector - its TTL cache means one API round per 10s however many viewers"""
+    return OllamaCollector()
+
 def check_ollama():
-    try:
-        subprocess.run(["ollama", "list"], capture_output=True, check=True, timeout=3)
-        return "🟢 Online"
-    except:
-        return "🔴 Offline"
+    return "🟢 Online" if get_ollama_collector().is_online() else "🔴 Offline"
 
 def get_training_status():
     try:
@@ -68,163 +76,209 @@ def get_training_status():
     except:
         return {}
 
-def log_metrics(metrics):
-    """Log current metrics to database"""
-    db_path = Path("monitoring/metrics.db")
-    db_path.parent.mkdir(exist_ok=True)
-    
-    conn = sqlite3.connect(db_path)
-    
-    # Drop and recreate table with correct schema
-    conn.execute('DROP TABLE IF EXISTS metrics')
-    conn.execute('''
-        CREATE TABLE metrics (
-            timestamp INTEGER PRIMARY KEY,
-            cpu REAL,
-            memory REAL,
-            memory_gb REAL,
-            disk REAL
-        )
-    ''')
-    
-    conn.execute('''
-        INSERT INTO metrics VALUES (?, ?, ?, ?, ?)
-    ''', (
-        int(datetime.now().timestamp()),
-        metrics['cpu'], metrics['memory'], metrics['memory_gb'], metrics['disk']
-    ))
-    conn.commit()
-    conn.close()
+@st.cache_resource
+def get_metrics_store():
+    """One store (connection + batch writer) per Streamlit server"""
+    return MetricsStore()
+
+@st.cache_resource
+def ensure_sampler():
+    """Start the sampler in this server unless a standalone one already holds the lock"""
+    return start_background_sampler(get_metrics_store())
+
+@st.cache_resource
+def get_chart_cache():
+    """Per-window chart frames shared by every session"""
+    return ChartDataCache(get_metrics_store(), ['cpu', 'memory', 'memory_gb'])
 
 def get_historical_data(hours=24):
-    """Get historical metrics from database"""
-    db_path = Path("monitoring/metrics.db")
-    if not db_path.exists():
-        return pd.DataFrame()
-        
-    since = int((datetime.now() - timedelta(hours=hours)).timestamp())
-    conn = sqlite3.connect(db_path)
+    """Cached window frame, topped up with only the rows added since the last refresh"""
+    return get_chart_cache().get(hours * 3600)
+
+def get_llm_latency(hours=24):
+    """p50/p95/p99 latency per model and caller, plus p95 time-to-first-token and queue wait"""
+    store = get_metrics_store()
+    since = datetime.now().timestamp() - hours * 3600
+    ttft = {(r['model'], r['caller']): r['p95'] for r in store.llm_percentiles(since, 'ttft_sec', (95,))}
+    queue_wait = {(r['model'], r['caller']): r['p95'] for r in store.llm_percentiles(since, 'queue_wait_sec', (95,))}
     
-    try:
-        df = pd.read_sql_query('''
-            SELECT timestamp, cpu, memory, memory_gb
-            FROM metrics 
-            WHERE timestamp > ? 
-            ORDER BY timestamp DESC LIMIT 500
-        ''', conn, params=[since])
-        
-        if not df.empty:
-            df['datetime'] = pd.to_datetime(df['timestamp'], unit='s')
-        return df
-    except:
-        return pd.DataFrame()
-    finally:
-        conn.close()
+    rows = []
+    for r in store.llm_percentiles(since, 'latency_sec'):
+        key = (r['model'], r['caller'])
+        rows.append({
+            'Model': r['model'], 'Caller': r['caller'], 'Calls': r['calls'], 'Errors': r['errors'],
+            'p50 (s)': r['p50'], 'p95 (s)': r['p95'], 'p99 (s)': r['p99'],
+            'TTFT p95 (s)': ttft.get(key), 'Queue p95 (s)': queue_wait.get(key)
+        })
+    return rows
+
+def get_recent_alerts(limit=10):
+    """Tail of the alert log written by the alert engine (python monitoring/alerting.py)"""
+    return FileSink().recent(limit)
+
+def build_usage_figure(hist_data):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=hist_data['datetime'], y=hist_data['cpu'], 
+                           name='CPU %', line_color='#ff6b6b'))
+    fig.add_trace(go.Scatter(x=hist_data['datetime'], y=hist_data['memory'], 
+                           name='Memory %', line_color='#4ecdc4'))
+    fig.update_layout(title="CPU & Memory %", height=300, template="plotly_dark")
+    return fig
+
+def build_memory_figure(hist_data):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=hist_data['datetime'], y=hist_data['memory_gb'], 
+                           name='Memory GB', line_color='#45b7d1'))
+    fig.update_layout(title="Memory Usage (GB)", height=300, template="plotly_dark")
+    return fig
 
 # Header
 st.title("🏠 HONEY DUO WEALTH")
 st.markdown("**System & Training Monitor**")
 
-# Get and log current metrics
-current_metrics = get_system_metrics()
-log_metrics(current_metrics)
+ensure_sampler()
 
-# System Health
-col1, col2, col3, col4 = st.columns(4)
+@st.fragment(run_every="30s")
+def live_panels():
+    """Re-rendered every 30s without blocking the script or re-sampling"""
+    current_metrics = get_system_metrics()
 
-with col1:
-    color = "🔴" if current_metrics['cpu'] > 80 else "🟡" if current_metrics['cpu'] > 60 else "🟢"
-    st.metric("CPU", f"{current_metrics['cpu']:.0f}%", delta=color)
+    # System Health
+    col1, col2, col3, col4 = st.columns(4)
 
-with col2:
-    color = "🔴" if current_metrics['memory'] > 85 else "🟡" if current_metrics['memory'] > 70 else "🟢"
-    st.metric("Memory", f"{current_metrics['memory']:.0f}%", 
-              delta=f"{current_metrics['memory_gb']:.1f}GB {color}")
+    with col1:
+        color = "🔴" if current_metrics['cpu'] > 80 else "🟡" if current_metrics['cpu'] > 60 else "🟢"
+        st.metric("CPU", f"{current_metrics['cpu']:.0f}%", delta=color)
 
-with col3:
-    color = "🔴" if current_metrics['disk'] > 90 else "🟡" if current_metrics['disk'] > 80 else "🟢"
-    st.metric("Disk", f"{current_metrics['disk']:.0f}%", delta=color)
+    with col2:
+        color = "🔴" if current_metrics['memory'] > 85 else "🟡" if current_metrics['memory'] > 70 else "🟢"
+        st.metric("Memory", f"{current_metrics['memory']:.0f}%", 
+                  delta=f"{current_metrics['memory_gb']:.1f}GB {color}")
 
-with col4:
-    st.metric("AI Models", current_metrics['ollama'])
+    with col3:
+        color = "🔴" if current_metrics['disk'] > 90 else "🟡" if current_metrics['disk'] > 80 else "🟢"
+        st.metric("Disk", f"{current_metrics['disk']:.0f}%", delta=color)
 
-# Storage Breakdown
-st.markdown("---")
-st.subheader("💾 Storage Allocation")
+    with col4:
+        st.metric("AI Models", current_metrics['ollama'])
 
-storage_info = current_metrics['storage']
-cols = st.columns(len(storage_info))
+    # Storage Breakdown
+    st.markdown("---")
+    st.subheader("💾 Storage Allocation")
 
-for i, (mount, info) in enumerate(storage_info.items()):
-    with cols[i]:
-        color = "🔴" if info['percent'] > 90 else "🟡" if info['percent'] > 80 else "🟢"
-        st.metric(
-            f"{mount}", 
-            f"{info['percent']:.0f}%",
-            delta=f"{info['free']:.0f}GB free {color}"
-        )
-        st.caption(f"{info['total']:.0f}GB total ({info['fstype']})")
+    storage_info = current_metrics['storage']
+    cols = st.columns(len(storage_info))
 
-st.markdown("---")
+    for i, (mount, info) in enumerate(storage_info.items()):
+        with cols[i]:
+            color = "🔴" if info['percent'] > 90 else "🟡" if info['percent'] > 80 else "🟢"
+            st.metric(
+                f"{mount}", 
+                f"{info['percent']:.0f}%",
+                delta=f"{info['free']:.0f}GB free {color}"
+            )
+            st.caption(f"{info['total']:.0f}GB total ({info['fstype']})")
 
-# Historical Charts
-st.subheader("📈 Historical Usage")
+    st.markdown("---")
 
-timeframe = st.selectbox("Timeframe", ["6h", "24h", "48h"], index=1)
-hours = {"6h": 6, "24h": 24, "48h": 48}[timeframe]
+    # Historical Charts
+    st.subheader("📈 Historical Usage")
 
-hist_data = get_historical_data(hours)
+    timeframe = st.selectbox("Timeframe", ["6h", "24h", "48h"], index=1)
+    hours = {"6h": 6, "24h": 24, "48h": 48}[timeframe]
 
-if not hist_data.empty:
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=hist_data['datetime'], y=hist_data['cpu'], 
-                               name='CPU %', line_color='#ff6b6b'))
-        fig.add_trace(go.Scatter(x=hist_data['datetime'], y=hist_data['memory'], 
-                               name='Memory %', line_color='#4ecdc4'))
-        fig.update_layout(title="CPU & Memory %", height=300, template="plotly_dark")
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=hist_data['datetime'], y=hist_data['memory_gb'], 
-                               name='Memory GB', line_color='#45b7d1'))
-        fig.update_layout(title="Memory Usage (GB)", height=300, template="plotly_dark")
-        st.plotly_chart(fig, use_container_width=True)
-else:
-    st.info("📊 Collecting historical data...")
-
-st.markdown("---")
-
-# Training Status
-st.subheader("🎓 AI Training Status")
-
-training_stats = get_training_status()
-
-col1, col2, col3 = st.columns(3)
-
-for i, ai in enumerate(['claudae', 'nyala', 'deon']):
-    with [col1, col2, col3][i]:
-        stats = training_stats.get(ai, {})
-        status = stats.get('production_status', 'Not Ready')
-        examples = stats.get('training_examples', 0)
-        version = stats.get('latest_version', 'None')
-        
-        if status == "Deployed":
-            st.success(f"✅ **{ai.upper()}**")
-        elif status == "Training":
-            st.warning(f"🟡 **{ai.upper()}**")
+    hist_data, version = get_historical_data(hours)
+
+    if not hist_data.empty:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig = cached_figure(st.session_state, f"usage_{timeframe}", version,
+                                lambda: build_usage_figure(hist_data))
+            st.plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            fig = cached_figure(st.session_state, f"memory_{timeframe}", version,
+                                lambda: build_memory_figure(hist_data))
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("📊 Collecting historical data...")
+
+    st.markdown("---")
+
+    # LLM Memory
+    st.subheader("🧠 LLM Memory")
+
+    ollama = get_ollama_collector().collect()
+    if ollama['online']:
+        budget = ollama['budget_gb']
+        st.progress(min(1.0, ollama['loaded_gb'] / budget),
+                    text=f"{ollama['loaded_gb']:.1f}GB of {budget}GB LLM budget loaded | "
+                         f"runners {ollama['runner_rss_gb']:.1f}GB RSS, {ollama['runner_cpu_percent']:.0f}% CPU")
+        if ollama['loaded']:
+            cols = st.columns(len(ollama['loaded']))
+            for col, model in zip(cols, ollama['loaded']):
+                with col:
+                    model_budget = f" / {model['budget_gb']}GB" if model['budget_gb'] else ""
+                    st.metric(model['name'], f"{model['size_gb']:.1f}GB{model_budget}",
+                              delta=f"{model['vram_gb']:.1f}GB VRAM")
+                    if model['expires_at']:
+                        st.caption(f"Unloads {model['expires_at'][:19].replace('T', ' ')}")
         else:
-            st.info(f"⚪ **{ai.upper()}**")
-            
-        st.caption(f"v{version} | {examples} examples")
+            st.info("No models loaded")
+    else:
+        st.warning("Ollama API unreachable")
+
+    st.markdown("---")
+
+    # Alerts
+    st.subheader("🚨 Recent Alerts")
+
+    alerts = get_recent_alerts()
+    if alerts:
+        st.dataframe(alerts, use_container_width=True, hide_index=True)
+    else:
+        st.success("No alerts raised")
+    st.caption("Alerts are raised by the watchdog process: python monitoring/alerting.py")
+
+    st.markdown("---")
+
+    # LLM Latency
+    st.subheader("⏱️ LLM Latency")
+
+    llm_rows = get_llm_latency(hours)
+    if llm_rows:
+        st.dataframe(llm_rows, use_container_width=True, hide_index=True)
+    else:
+        st.info("No LLM calls recorded in timeframe")
+
+    st.markdown("---")
+
+    # Training Status
+    st.subheader("🎓 AI Training Status")
+
+    training_stats = get_training_status()
+
+    col1, col2, col3 = st.columns(3)
+
+    for i, ai in enumerate(['claudae', 'nyala', 'deon']):
+        with [col1, col2, col3][i]:
+            stats = training_stats.get(ai, {})
+            status = stats.get('production_status', 'Not Ready')
+            examples = stats.get('training_examples', 0)
+            version = stats.get('latest_version', 'None')
+
+            if status == "Deployed":
+                st.success(f"✅ **{ai.upper()}**")
+            elif status == "Training":
+                st.warning(f"🟡 **{ai.upper()}**")
+            else:
+                st.info(f"⚪ **{ai.upper()}**")
+
+            st.caption(f"v{version} | {examples} examples")
 
-# Footer
-st.markdown("---")
-st.caption(f"Last updated: {datetime.now().strftime('%H:%M:%S')} | Auto-refresh: 30s")
+    # Footer
+    st.markdown("---")
+    st.caption(f"Last updated: {datetime.now().strftime('%H:%M:%S')} | Auto-refresh: 30s")
 
-# Auto refresh
-time.sleep(30)
-st.rerun()
\ No newline at end of file
+live_panels()
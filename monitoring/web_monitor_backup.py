@@ -5,19 +5,18 @@ Scalable, optimized monitoring with data retention policies
 """
 
 import streamlit as st
-import psutil
-import time
-import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
-from datetime import datetime, timedelta
-import subprocess
+from datetime import datetime
 import sys
 import json
-import sqlite3
 from pathlib import Path
-import threading
-import queue
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from monitoring.metrics_store import MetricsStore, TIERS
+from monitoring.metrics_sampler import start_background_sampler
+from monitoring.chart_data import ChartDataCache, cached_figure
+from monitoring.ollama_collector import OllamaCollector
 
 # Replace the page_link lines with:
 with st.sidebar:
@@ -62,125 +61,67 @@ st.markdown("""
 
 class OptimizedMetricsTracker:
     def __init__(self):
-        self.db_path = Path("monitoring/metrics.db")
-        self.db_path.parent.mkdir(exist_ok=True)
-        self.init_database()
-        self.data_queue = queue.Queue()
-        self.retention_hours = 168  # 1 week
-        
-    def init_database(self):
-        """Initialize optimized database with indexes and retention"""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS metrics (
-                timestamp INTEGER PRIMARY KEY,
-                cpu REAL,
-                memory REAL,
-                memory_gb REAL,
-                disk REAL,
-                gpu_util TEXT,
-                training_status TEXT
-            )
-        ''')
-        conn.execute('CREATE INDEX IF NOT EXISTS idx_timestamp ON metrics(timestamp)')
-        
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS training_events (
-                id INTEGER PRIMARY KEY,
-                ai_name TEXT,
-                event_type TEXT,
-                timestamp INTEGER,
-                cpu_peak REAL,
-                memory_peak REAL,
-                duration_sec INTEGER
-            )
-        ''')
-        conn.commit()
-        conn.close()
+        self.db_path = Path(__file__).resolve().parent / "metrics.db"
+        self.store = MetricsStore(self.db_path)
+        self.charts = ChartDataCache(self.store, ['cpu', 'memory', 'memory_gb', 'training_active'])
+        # e.g. "1s for 6h, 1m for 14d, 1h for 365d" - straight from the store's tiers
+        self.retention = ", ".join(f"{self._span(step)} for {self._span(keep)}" for step, keep in TIERS.values())
         
     def cleanup_old_data(self):
-        """Remove data older than retention period"""
-        cutoff = int((datetime.now() - timedelta(hours=self.retention_hours)).timestamp())
-        conn = sqlite3.connect(self.db_path)
-        conn.execute('DELETE FROM metrics WHERE timestamp < ?', (cutoff,))
-        conn.execute('DELETE FROM training_events WHERE timestamp < ?', (cutoff,))
-        conn.commit()
-        conn.close()
-        
-    def log_metrics(self, metrics):
-        """Efficiently log metrics"""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute('''
-            INSERT OR REPLACE INTO metrics VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            int(datetime.now().timestamp()),
-            metrics['cpu'], metrics['memory'], metrics['memory_gb'],
-            metrics['disk'], metrics['gpu'], metrics['training_status']
-        ))
-        conn.commit()
-        conn.close()
+        """Apply the store's retention policy now"""
+        self.store.prune()
         
     def get_recent_data(self, minutes=60):
-        """Get recent data efficiently"""
-        since = int((datetime.now() - timedelta(minutes=minutes)).timestamp())
-        conn = sqlite3.connect(self.db_path)
+        """Cached window frame plus its data version; only new rows are fetched"""
+        return self.charts.get(minutes * 60)
         
-        df = pd.read_sql_query('''
-            SELECT timestamp, cpu, memory, memory_gb, training_status
-            FROM metrics 
-            WHERE timestamp > ? 
-            ORDER BY timestamp DESC LIMIT 1000
-        ''', conn, params=[since])
-        
-        conn.close()
-        
-        if not df.empty:
-            df['datetime'] = pd.to_datetime(df['timestamp'], unit='s')
-        return df
+    @staticmethod
+    def _span(seconds):
+        for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+            if seconds >= size and seconds % size == 0:
+                return f"{seconds // size}{unit}"
+        return f"{seconds}s"
 
-# Initialize tracker
+# Initialize tracker; sampling runs in the background, never in the page script
 @st.cache_resource
 def get_tracker():
-    return OptimizedMetricsTracker()
+    tracker = OptimizedMetricsTracker()
+    start_background_sampler(tracker.store)
+    return tracker
 
 tracker = get_tracker()
 
-# Efficient data fetching
-@st.cache_data(ttl=10)  # Cache for 10 seconds
 def get_system_metrics():
-    """Get current system metrics"""
+    """Latest sampler readings"""
+    latest = tracker.store.latest(['cpu', 'memory', 'memory_gb', 'disk', 'gpu_util',
+                                   'training_active', 'training_cpu', 'training_rss_gb'])
+    gpu_util = latest.get('gpu_util')
+    jobs = int(latest.get('training_active') or 0)
     return {
-        'cpu': psutil.cpu_percent(interval=0.1),
-        'memory': psutil.virtual_memory().percent,
-        'memory_gb': psutil.virtual_memory().used / (1024**3),
-        'disk': psutil.disk_usage('/').percent,
-        'gpu': get_gpu_info(),
-        'training_status': detect_training()
+        'cpu': latest.get('cpu', 0.0),
+        'memory': latest.get('memory', 0.0),
+        'memory_gb': latest.get('memory_gb', 0.0),
+        'disk': latest.get('disk', 0.0),
+        'gpu': f"{gpu_util:.0f}%" if gpu_util is not None else "N/A",
+        'training_status': (f"Training: {jobs} job(s), {latest.get('training_cpu', 0):.0f}% CPU, "
+                            f"{latest.get('training_rss_gb', 0):.1f}GB RSS") if jobs else "Idle"
     }
 
-@st.cache_data(ttl=30)
-def get_gpu_info():
-    """Get GPU information"""
-    try:
-        result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits"],
-            capture_output=True, text=True, timeout=5
-        )
-        return f"{result.stdout.strip()}%" if result.returncode == 0 else "N/A"
-    except:
-        return "N/A"
+def build_usage_figure(hist_data):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=hist_data['datetime'], y=hist_data['cpu'], 
+                           name='CPU %', line_color='#ff6b6b'))
+    fig.add_trace(go.Scatter(x=hist_data['datetime'], y=hist_data['memory'], 
+                           name='Memory %', line_color='#4ecdc4'))
+    fig.update_layout(title="CPU & Memory Usage", height=300, 
+                    template="plotly_dark", margin=dict(l=0, r=0, t=30, b=0))
+    return fig
 
-@st.cache_data(ttl=10)
-def detect_training():
-    """Detect active training processes"""
-    try:
-        for proc in psutil.process_iter(['name', 'cmdline']):
-            cmdline = ' '.join(proc.info.get('cmdline', []))
-            if any(word in cmdline.lower() for word in ['train', 'fine-tune', 'llm']):
-                return f"Training: {proc.info['name']}"
-    except:
-        pass
-    return "Idle"
+def build_training_figure(training_events):
+    fig = px.scatter(training_events, x='datetime', y='cpu', 
+                   title="Training Activity", template="plotly_dark")
+    fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0))
+    return fig
 
 @st.cache_data(ttl=60)
 def get_training_stats():
@@ -206,80 +147,76 @@ with st.sidebar:
     show_charts = st.toggle("Show Charts", True)
     chart_timeframe = st.selectbox("Chart Range", ["1h", "6h", "24h"], index=0)
 
-# Get current metrics
-current_metrics = get_system_metrics()
-tracker.log_metrics(current_metrics)
+@st.fragment(run_every=refresh_rate if auto_refresh else None)
+def live_panels():
+    """Metrics and charts refresh in place; the rest of the page is left alone"""
+    current_metrics = get_system_metrics()
 
-# Real-time metrics row
-col1, col2, col3, col4 = st.columns(4)
+    # Real-time metrics row
+    col1, col2, col3, col4 = st.columns(4)
 
-with col1:
-    cpu_color = "🔴" if current_metrics['cpu'] > 80 else "🟡" if current_metrics['cpu'] > 60 else "🟢"
-    st.metric("CPU Usage", f"{current_metrics['cpu']:.1f}%", 
-              delta=f"{cpu_color}")
+    with col1:
+        cpu_color = "🔴" if current_metrics['cpu'] > 80 else "🟡" if current_metrics['cpu'] > 60 else "🟢"
+        st.metric("CPU Usage", f"{current_metrics['cpu']:.1f}%", 
+                  delta=f"{cpu_color}")
 
-with col2:
-    mem_color = "🔴" if current_metrics['memory'] > 85 else "🟡" if current_metrics['memory'] > 70 else "🟢"
-    st.metric("Memory", f"{current_metrics['memory']:.1f}%", 
-              delta=f"{current_metrics['memory_gb']:.1f}GB {mem_color}")
+    with col2:
+        mem_color = "🔴" if current_metrics['memory'] > 85 else "🟡" if current_metrics['memory'] > 70 else "🟢"
+        st.metric("Memory", f"{current_metrics['memory']:.1f}%", 
+                  delta=f"{current_metrics['memory_gb']:.1f}GB {mem_color}")
 
-with col3:
-    disk_color = "🔴" if current_metrics['disk'] > 90 else "🟡" if current_metrics['disk'] > 80 else "🟢"
-    st.metric("Disk Usage", f"{current_metrics['disk']:.1f}%", 
-              delta=f"{disk_color}")
-
-with col4:
-    st.metric("GPU", current_metrics['gpu'])
-
-# Training status alert
-if "Training" in current_metrics['training_status']:
-    st.markdown(f"""
-    <div class="alert-box">
-        🔥 <strong>Active Training Detected:</strong> {current_metrics['training_status']}
-    </div>
-    """, unsafe_allow_html=True)
-
-# Historical charts
-if show_charts:
-    st.subheader("📈 System Performance")
-    
-    timeframe_minutes = {"1h": 60, "6h": 360, "24h": 1440}[chart_timeframe]
-    hist_data = tracker.get_recent_data(timeframe_minutes)
-    
-    if not hist_data.empty:
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=hist_data['datetime'], y=hist_data['cpu'], 
-                                   name='CPU %', line_color='#ff6b6b'))
-            fig.add_trace(go.Scatter(x=hist_data['datetime'], y=hist_data['memory'], 
-                                   name='Memory %', line_color='#4ecdc4'))
-            fig.update_layout(title="CPU & Memory Usage", height=300, 
-                            template="plotly_dark", margin=dict(l=0, r=0, t=30, b=0))
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Training events overlay
-            training_events = hist_data[hist_data['training_status'] != 'Idle']
-            if not training_events.empty:
-                fig = px.scatter(training_events, x='datetime', y='cpu', 
-                               color='training_status', title="Training Activity",
-                               template="plotly_dark")
-                fig.update_layout(height=300, margin=dict(l=0, r=0, t=30, b=0))
+    with col3:
+        disk_color = "🔴" if current_metrics['disk'] > 90 else "🟡" if current_metrics['disk'] > 80 else "🟢"
+        st.metric("Disk Usage", f"{current_metrics['disk']:.1f}%", 
+                  delta=f"{disk_color}")
+
+    with col4:
+        st.metric("GPU", current_metrics['gpu'])
+
+    # Training status alert
+    if "Training" in current_metrics['training_status']:
+        st.markdown(f"""
+        <div class="alert-box">
+            🔥 <strong>Active Training Detected:</strong> {current_metrics['training_status']}
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Historical charts
+    if show_charts:
+        st.subheader("📈 System Performance")
+
+        timeframe_minutes = {"1h": 60, "6h": 360, "24h": 1440}[chart_timeframe]
+        hist_data, version = tracker.get_recent_data(timeframe_minutes)
+
+        if not hist_data.empty:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                fig = cached_figure(st.session_state, f"usage_{chart_timeframe}", version,
+                                    lambda: build_usage_figure(hist_data))
                 st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("No training activity in timeframe")
+
+            with col2:
+                # Training events overlay
+                training_events = hist_data[hist_data['training_active'] > 0]
+                if not training_events.empty:
+                    fig = cached_figure(st.session_state, f"training_{chart_timeframe}", version,
+                                        lambda: build_training_figure(training_events))
+                    st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.info("No training activity in timeframe")
+
+live_panels()
 
 # AI Family Status
 st.subheader("🤖 AI Family Status")
 
-# Check ollama status
-try:
-    subprocess.run(["ollama", "list"], capture_output=True, check=True, timeout=5)
-    ollama_running = True
-except:
-    ollama_running = False
+# Check ollama status (cached API query, no subprocess per refresh)
+@st.cache_resource
+def get_ollama_collector():
+    return OllamaCollector()
+
+ollama_running = get_ollama_collector().is_online()
 
 col1, col2, col3 = st.columns(3)
 
@@ -320,6 +257,21 @@ if "error" not in training_stats:
                 if st.button(f"Manage {ai_name.upper()}", key=f"manage_{ai_name}"):
                     st.info(f"Training management for {ai_name} - Ready for implementation")
 
+recent_runs = tracker.store.training_events(limit=10)
+if recent_runs:
+    st.caption("Recent training runs")
+    st.dataframe([
+        {
+            "AI": run["ai_name"].upper(),
+            "Outcome": run["event_type"].replace("training_", ""),
+            "Started": datetime.fromtimestamp(run["timestamp"]).strftime('%Y-%m-%d %H:%M'),
+            "Duration (s)": run["duration_sec"],
+            "CPU peak %": run["cpu_peak"],
+            "RSS peak GB": run["memory_peak"]
+        }
+        for run in recent_runs
+    ], use_container_width=True, hide_index=True)
+
 # Footer with cleanup
 if st.button("🧹 Cleanup Old Data"):
     tracker.cleanup_old_data()
@@ -327,9 +279,4 @@ if st.button("🧹 Cleanup Old Data"):
 
 st.markdown("---")
 st.caption(f"Last updated: {datetime.now().strftime('%H:%M:%S')} | "
-          f"Data retention: {tracker.retention_hours}h")
-
-# Auto refresh
-if auto_refresh:
-    time.sleep(refresh_rate)
-    st.rerun()
\ No newline at end of file
+          f"Data retention: {tracker.retention}")
\ No newline at end of file
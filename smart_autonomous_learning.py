@@ -17,12 +17,13 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, asdict
 from enum import Enum
-import requests
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import queue
 import threading
 
+from ai_family.llm_telemetry import post_generate, record_metrics
+from ai_family.generated_files import write_json_if_changed, is_generated
+
 class SystemState(Enum):
     DORMANT = "dormant"     # Lightweight monitoring
     ACTIVE = "active"       # Full CLAUDAE analysis
@@ -67,7 +68,7 @@ class SmartAutonomousLearning:
         # System state
         self.state = SystemState.DORMANT
         self.current_cycle: Optional[LearningCycle] = None
-        self.observer = Observer()
+        self.observer = None  # created when monitoring starts
         self.change_handler = SmartChangeHandler(self)
         
         # Thread-safe communication
@@ -115,6 +116,8 @@ class SmartAutonomousLearning:
             for pattern in skip_patterns:
                 if pattern in str(rel_path):
                     return False
+            if is_generated(file_path):
+                return False
             
             # Include user files
             include_extensions = {'.py', '.md', '.json', '.yaml', '.yml', '.txt'}
@@ -214,9 +217,10 @@ CONTENT: {content[:1500]}
 Identify the development pattern. Respond with JSON:
 {{"pattern_type": "Test Development|Refactoring|New Features|Bug Fixes|Integration|Documentation", "confidence": 0.0_to_1.0, "description": "brief_description", "significance": "project_impact"}}"""
             
-            response = requests.post(
+            response = post_generate(
+                "smart_learning",
                 f"{self.claudae_url}/api/generate",
-                json={
+                {
                     "model": self.claudae_model,
                     "prompt": prompt,
                     "stream": False,
@@ -318,6 +322,9 @@ Identify the development pattern. Respond with JSON:
         self.logger.info(f"⏱️ Inactivity timeout: {self.inactivity_timeout/60} minutes")
         
         # Start file system monitoring
+        from watchdog.observers import Observer
+        
+        self.observer = Observer()
         self.observer.schedule(self.change_handler, str(self.project_root), recursive=True)
         self.observer.start()
         
@@ -329,6 +336,10 @@ Identify the development pattern. Respond with JSON:
         try:
             while True:
                 await asyncio.sleep(10)
+                record_metrics({
+                    "learner_queue:smart:file_changes": self.file_change_queue.qsize(),
+                    "learner_queue:smart:pending_files": len(self.pending_files)
+                })
         except KeyboardInterrupt:
             await self.graceful_shutdown()
     
@@ -340,8 +351,9 @@ Identify the development pattern. Respond with JSON:
             await self.process_pending_files()
             await self.start_analysis_phase()
         
-        self.observer.stop()
-        self.observer.join()
+        if self.observer:
+            self.observer.stop()
+            self.observer.join()
         
         # Generate handoff
         cycle_files = list(self.learning_dir.glob("cycle_*.json"))
@@ -353,8 +365,7 @@ Identify the development pattern. Respond with JSON:
         }
         
         handoff_file = self.learning_dir / "shutdown_handoff.json"
-        with open(handoff_file, 'w') as f:
-            json.dump(handoff, f, indent=2)
+        write_json_if_changed(handoff_file, handoff)
         
         print(f"\n🚀 SMART LEARNING SYSTEM - SESSION HANDOFF")
         print(f"Total cycles: {len(cycle_files)}")
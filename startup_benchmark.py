@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+HONEY DUO WEALTH - Startup Benchmark
+Cold-start wall time of the CLI entry points, with the slowest imports from python -X importtime
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+QUICK_BUDGET_MS = 150
+
+# name -> (python arguments, quick command held to QUICK_BUDGET_MS)
+ENTRY_POINTS = {
+    "training status": (["ai_family/llm_training_manager.py", "status"], True),
+    "migration --help": (["claudae_migration.py", "--help"], True),
+    "import review generator": (["-c", "import claudae_review_generator"], True),
+    "import foundation": (["-c", "import claudae_foundation"], False),
+    "import migration": (["-c", "import claudae_migration"], False),
+    "import smart learner": (["-c", "import smart_autonomous_learning"], False),
+    "import clean learner": (["-c", "import claudae_clean_autonomous"], False),
+    "import integrated learner": (["-c", "import claudae_integrated_autonomous"], False),
+}
+
+
+def run_once(args: List[str], importtime: bool = False) -> subprocess.CompletedProcess:
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + args
+    return subprocess.run(command, cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60,
+                          env=dict(os.environ, PYTHONPATH=os.pathsep.join(
+                              filter(None, [str(PROJECT_ROOT), os.environ.get("PYTHONPATH")]))))
+
+
+def is_project_module(name: str) -> bool:
+    top_level = name.split(".")[0]
+    return (PROJECT_ROOT / f"{top_level}.py").exists() or (PROJECT_ROOT / top_level).is_dir()
+
+
+def slowest_imports(stderr: str, top: int) -> List[Dict[str, Any]]:
+    """Outside modules pulled in directly by project code (or by the interpreter), by cumulative import time"""
+    lines = [line[len("import time:"):].split("|") for line in stderr.splitlines()
+             if line.startswith("import time:") and "cumulative" not in line]
+    parents: List[str] = []
+    imports = []
+    # importtime prints children before their parent, so walk backwards to see parents first
+    for _, cumulative, name in reversed(lines):
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        module = name.strip()
+        del parents[depth:]
+        parents.append(module)
+        if is_project_module(module) or (depth and not is_project_module(parents[depth - 1])):
+            continue
+        imports.append({"module": module, "ms": round(int(cumulative) / 1000, 1)})
+    return sorted(imports, key=lambda i: i["ms"], reverse=True)[:top]
+
+
+def benchmark(name: str, args: List[str], quick: bool, runs: int, top: int) -> Dict[str, Any]:
+    run_once(args)  # warm the OS file cache so every run measures the same thing
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = run_once(args)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    profile = run_once(args, importtime=True)
+    median_ms = statistics.median(timings)
+    return {
+        "name": name,
+        "command": " ".join(args),
+        "exit_code": result.returncode,
+        "error": result.stderr.strip().splitlines()[-1] if result.returncode else None,
+        "min_ms": round(min(timings), 1),
+        "median_ms": round(median_ms, 1),
+        "budget_ms": QUICK_BUDGET_MS if quick else None,
+        "within_budget": median_ms <= QUICK_BUDGET_MS if quick else None,
+        "slowest_imports": slowest_imports(profile.stderr, top)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure CLI cold-start time")
+    parser.add_argument("entry_points", nargs="*", help=f"Subset of: {', '.join(ENTRY_POINTS)}")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="Slowest imports to list per entry point")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero if a quick command is over budget")
+    args = parser.parse_args()
+
+    results = [benchmark(name, *ENTRY_POINTS[name], args.runs, args.top)
+               for name in (args.entry_points or ENTRY_POINTS)]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"🚀 Startup benchmark ({args.runs} runs, {sys.executable})")
+        for r in results:
+            if r["exit_code"]:
+                status = f"❌ exit {r['exit_code']}: {r['error']}"
+            elif r["budget_ms"] is None:
+                status = ""
+            else:
+                status = "✅" if r["within_budget"] else f"⚠️ over {r['budget_ms']} ms budget"
+            print(f"\n{r['name']:<28} median {r['median_ms']:>7.1f} ms  min {r['min_ms']:>7.1f} ms  {status}")
+            for i in r["slowest_imports"]:
+                print(f"    {i['ms']:>7.1f} ms  {i['module']}")
+
+    over_budget = [r for r in results if r["within_budget"] is False or (r["budget_ms"] and r["exit_code"])]
+    sys.exit(1 if args.check and over_budget else 0)
@@ -4,33 +4,71 @@ HONEY DUO WEALTH - System Monitor Dashboard
 Real-time monitoring of AI family and system resources
 """
 
+import argparse
 import psutil
 import subprocess
+import sys
+import threading
 import time
 import json
 from datetime import datetime
 
+from monitoring.ollama_collector import OllamaCollector
+
+# Seconds between samples of each source; slow or expensive sources refresh less often
+SOURCE_INTERVALS = {
+    "system": 2,
+    "gpu": 30,
+    "storage": 60,
+    "ai_models": 10,
+    "monitor": 10
+}
+
 class SystemMonitor:
-    def __init__(self):
+    def __init__(self, intervals=None):
         self.ai_models = {
             "CLAUDAE": "mistral:7b",
             "NYALA": "mixtral:8x7b", 
             "DEON": "llama2:13b"
         }
+        self.ollama = OllamaCollector()
+        self.intervals = dict(SOURCE_INTERVALS, **(intervals or {}))
+        self.sources = {
+            "system": self.get_system_stats,
+            "gpu": self.get_gpu_stats,
+            "storage": self.check_storage_mount,
+            "ai_models": lambda: {"models": self.check_ai_models(), "llm_memory": self.get_llm_memory()},
+            "monitor": self.get_monitor_cost
+        }
+        
+        self._latest = {}
+        self._lock = threading.Lock()
+        self._updates = []  # (source, data) pairs not yet consumed by the output loop
+        self._updated = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+        self._previous_lines = []
+        
+        self._process = psutil.Process()
+        self._cpu_mark = (self._own_cpu_seconds(), time.monotonic())
+        # First call primes psutil's counter; later calls return usage since the previous call
+        psutil.cpu_percent(interval=None)
     
     def get_system_stats(self):
         """Get current system resource usage"""
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
         return {
-            "cpu_percent": psutil.cpu_percent(interval=1),
+            "cpu_percent": psutil.cpu_percent(interval=None),
             "memory": {
-                "total": f"{psutil.virtual_memory().total / (1024**3):.1f}GB",
-                "used": f"{psutil.virtual_memory().used / (1024**3):.1f}GB",
-                "percent": psutil.virtual_memory().percent
+                "total": f"{memory.total / (1024**3):.1f}GB",
+                "used": f"{memory.used / (1024**3):.1f}GB",
+                "percent": memory.percent
             },
             "disk": {
-                "total": f"{psutil.disk_usage('/').total / (1024**3):.1f}GB",
-                "used": f"{psutil.disk_usage('/').used / (1024**3):.1f}GB",
-                "percent": psutil.disk_usage('/').percent
+                "total": f"{disk.total / (1024**3):.1f}GB",
+                "used": f"{disk.used / (1024**3):.1f}GB",
+                "percent": disk.percent
             }
         }
     
@@ -48,21 +86,34 @@ class SystemMonitor:
             return {"mounted": False}
     
     def check_ai_models(self):
-        """Check Ollama model status"""
-        try:
-            result = subprocess.run(["ollama", "list"], capture_output=True, text=True)
-            models_output = result.stdout.lower()
-            
-            status = {}
-            for name, model in self.ai_models.items():
-                status[name] = {
-                    "model": model,
-                    "available": model.lower() in models_output,
-                    "status": "Ready" if model.lower() in models_output else "Loading"
-                }
-            return status
-        except:
+        """Check Ollama model status (installed, loaded and resident memory)"""
+        ollama = self.ollama.collect()
+        if not ollama["online"]:
             return {"error": "Cannot check Ollama status"}
+            
+        loaded = {m["name"]: m for m in ollama["loaded"]}
+        status = {}
+        for name, model in self.ai_models.items():
+            available = model in ollama["available"]
+            status[name] = {
+                "model": model,
+                "available": available,
+                "loaded": model in loaded,
+                "memory_gb": loaded[model]["size_gb"] if model in loaded else 0.0,
+                "expires_at": loaded[model]["expires_at"] if model in loaded else None,
+                "status": "Loaded" if model in loaded else "Ready" if available else "Missing"
+            }
+        return status
+        
+    def get_llm_memory(self):
+        """Loaded model memory against the blueprint's LLM budget"""
+        ollama = self.ollama.collect()
+        return {
+            "loaded_gb": ollama["loaded_gb"],
+            "budget_gb": ollama["budget_gb"],
+            "runner_rss_gb": ollama.get("runner_rss_gb", 0.0),
+            "runner_cpu_percent": ollama.get("runner_cpu_percent", 0.0)
+        }
     
     def get_gpu_stats(self):
         """Get GPU usage if available"""
@@ -70,7 +121,7 @@ class SystemMonitor:
             result = subprocess.run([
                 "nvidia-smi", "--query-gpu=name,memory.used,memory.total,utilization.gpu",
                 "--format=csv,noheader,nounits"
-            ], capture_output=True, text=True)
+            ], capture_output=True, text=True, timeout=5)
             
             if result.returncode == 0:
                 gpu_data = result.stdout.strip().split(', ')
@@ -84,60 +135,176 @@ class SystemMonitor:
             pass
         return {"status": "Not available"}
     
-    def display_dashboard(self):
-        """Display real-time dashboard"""
-        print("\033[2J\033[H")  # Clear screen
-        print("🏠 HONEY DUO WEALTH - System Monitor")
-        print("=" * 50)
-        print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print()
+    def get_monitor_cost(self):
+        """CPU used by this monitor (including spawned nvidia-smi) since the previous call"""
+        cpu_seconds, now = self._own_cpu_seconds(), time.monotonic()
+        last_cpu, last_now = self._cpu_mark
+        self._cpu_mark = (cpu_seconds, now)
+        elapsed = now - last_now
+        return {
+            "cpu_percent": round(100 * (cpu_seconds - last_cpu) / elapsed, 2) if elapsed > 0 else 0.0,
+            "rss_mb": round(self._process.memory_info().rss / (1024**2), 1)
+        }
+    
+    def _own_cpu_seconds(self):
+        times = self._process.cpu_times()
+        return times.user + times.system + times.children_user + times.children_system
+    
+    def start(self):
+        """Sample every source on its own cadence in a background thread"""
+        for source in self.sources:
+            thread = threading.Thread(target=self._sample_loop, args=(source,),
+                                      name=f"monitor-{source}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def stop(self):
+        self._stop.set()
+        self._updated.set()
+    
+    def _sample_loop(self, source):
+        next_run = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                data = self.sources[source]()
+            except Exception as e:
+                data = {"error": str(e)}
+            with self._lock:
+                self._latest[source] = data
+                self._updates.append((source, data))
+            self._updated.set()
+            next_run += self.intervals[source]
+            self._stop.wait(max(0.0, next_run - time.monotonic()))
+    
+    def _take_updates(self):
+        """Block until a sampler publishes, then hand back everything published since the last call"""
+        self._updated.wait()
+        with self._lock:
+            self._updated.clear()
+            updates, self._updates = self._updates, []
+            return updates, dict(self._latest)
+    
+    def render_lines(self, latest):
+        """Dashboard as a list of lines, built from the latest sample of each source"""
+        lines = [
+            "🏠 HONEY DUO WEALTH - System Monitor",
+            "=" * 50,
+            f"Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            ""
+        ]
         
         # System Resources
-        stats = self.get_system_stats()
-        print("💻 System Resources:")
-        print(f"   CPU: {stats['cpu_percent']:.1f}%")
-        print(f"   RAM: {stats['memory']['used']}/{stats['memory']['total']} ({stats['memory']['percent']:.1f}%)")
-        print(f"   Disk: {stats['disk']['used']}/{stats['disk']['total']} ({stats['disk']['percent']:.1f}%)")
+        stats = latest.get("system")
+        lines.append("💻 System Resources:")
+        if stats and "error" not in stats:
+            lines.append(f"   CPU: {stats['cpu_percent']:.1f}%")
+            lines.append(f"   RAM: {stats['memory']['used']}/{stats['memory']['total']} ({stats['memory']['percent']:.1f}%)")
+            lines.append(f"   Disk: {stats['disk']['used']}/{stats['disk']['total']} ({stats['disk']['percent']:.1f}%)")
+        else:
+            lines.append("   ⏳ Sampling...")
         
         # GPU Status
-        gpu = self.get_gpu_stats()
-        print("\n🎮 GPU Status:")
-        if "name" in gpu:
-            print(f"   {gpu['name']}")
-            print(f"   Memory: {gpu['memory_used']}/{gpu['memory_total']}")
-            print(f"   Usage: {gpu['utilization']}")
+        gpu = latest.get("gpu")
+        lines.extend(["", "🎮 GPU Status:"])
+        if gpu is None:
+            lines.append("   ⏳ Sampling...")
+        elif "name" in gpu:
+            lines.append(f"   {gpu['name']}")
+            lines.append(f"   Memory: {gpu['memory_used']}/{gpu['memory_total']}")
+            lines.append(f"   Usage: {gpu['utilization']}")
         else:
-            print(f"   {gpu['status']}")
+            lines.append(f"   {gpu.get('status', gpu.get('error'))}")
         
         # Storage
-        storage = self.check_storage_mount()
-        print("\n💾 8TB Storage:")
-        if storage["mounted"]:
-            print(f"   Total: {storage['total']}")
-            print(f"   Used: {storage['used']}")
-            print(f"   Free: {storage['free']}")
+        storage = latest.get("storage")
+        lines.extend(["", "💾 8TB Storage:"])
+        if storage is None:
+            lines.append("   ⏳ Sampling...")
+        elif storage.get("mounted"):
+            lines.append(f"   Total: {storage['total']}")
+            lines.append(f"   Used: {storage['used']}")
+            lines.append(f"   Free: {storage['free']}")
         else:
-            print("   ❌ Not mounted")
+            lines.append("   ❌ Not mounted")
         
         # AI Family Status
-        ai_status = self.check_ai_models()
-        print("\n🤖 AI Family Status:")
-        for name, info in ai_status.items():
-            if name != "error":
-                status_icon = "✅" if info["available"] else "⏳"
-                print(f"   {status_icon} {name}: {info['status']} ({info['model']})")
+        ai = latest.get("ai_models")
+        lines.extend(["", "🤖 AI Family Status:"])
+        if ai is None:
+            lines.append("   ⏳ Sampling...")
+        elif "error" in ai:
+            lines.append(f"   ❌ {ai['error']}")
+        else:
+            for name, info in ai["models"].items():
+                if name != "error":
+                    status_icon = "✅" if info["available"] else "⏳"
+                    memory = f", {info['memory_gb']:.1f}GB resident" if info["loaded"] else ""
+                    lines.append(f"   {status_icon} {name}: {info['status']} ({info['model']}{memory})")
+            if "error" in ai["models"]:
+                lines.append(f"   ❌ {ai['models']['error']}")
+            llm_memory = ai["llm_memory"]
+            lines.append(f"   LLM memory: {llm_memory['loaded_gb']:.1f}/{llm_memory['budget_gb']}GB budget | "
+                         f"runners {llm_memory['runner_rss_gb']:.1f}GB RSS, {llm_memory['runner_cpu_percent']:.0f}% CPU")
         
-        print(f"\n📊 Next update in 5 seconds... (Ctrl+C to exit)")
+        monitor = latest.get("monitor")
+        cost = f"{monitor['cpu_percent']:.2f}% CPU, {monitor['rss_mb']:.0f}MB" if monitor and "error" not in monitor else "measuring"
+        lines.extend(["", f"📊 Monitor cost: {cost} (Ctrl+C to exit)"])
+        return lines
+    
+    def display_dashboard(self, latest=None):
+        """Redraw only the lines that changed since the previous frame"""
+        if latest is None:
+            latest = {source: sample() for source, sample in self.sources.items()}
+        lines = self.render_lines(latest)
+        
+        if not self._previous_lines:
+            out = ["\033[2J\033[H"]  # Clear screen once
+            changed = range(len(lines))
+        else:
+            out = []
+            changed = [i for i, line in enumerate(lines)
+                       if i >= len(self._previous_lines) or self._previous_lines[i] != line]
+        for i in changed:
+            out.append(f"\033[{i + 1};1H{lines[i]}\033[K")  # Move to the row, write, clear the rest
+        if len(lines) < len(self._previous_lines):
+            out.append(f"\033[{len(lines) + 1};1H\033[J")
+        out.append(f"\033[{len(lines) + 1};1H")
+        
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        self._previous_lines = lines
     
     def run_continuous(self):
         """Run continuous monitoring"""
+        self.start()
         try:
             while True:
-                self.display_dashboard()
-                time.sleep(5)
+                _, latest = self._take_updates()
+                self.display_dashboard(latest)
         except KeyboardInterrupt:
+            self.stop()
             print("\n\n👋 Monitor stopped. AI family continues running.")
+    
+    def run_json(self):
+        """Stream one JSON object per source update, one per line, for piping to other tools"""
+        self.start()
+        try:
+            while True:
+                updates, _ = self._take_updates()
+                for source, data in updates:
+                    sys.stdout.write(json.dumps({"timestamp": datetime.now().isoformat(),
+                                                 "source": source, "data": data}) + "\n")
+                sys.stdout.flush()
+        except (KeyboardInterrupt, BrokenPipeError):
+            self.stop()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HONEY DUO WEALTH system monitor")
+    parser.add_argument("--json", action="store_true", help="Stream JSON lines instead of drawing the dashboard")
+    args = parser.parse_args()
+    
     monitor = SystemMonitor()
-    monitor.run_continuous()
\ No newline at end of file
+    if args.json:
+        monitor.run_json()
+    else:
+        monitor.run_continuous()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Alerting Tests
+Rules on their own, then the engine over a throwaway metrics.db
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from monitoring.alerting import (AbsenceRule, AlertEngine, FileSink, LLMPercentileRule, RateRule,
+                                 ThresholdRule)
+from monitoring.metrics_store import MetricsStore
+
+T0 = 1_750_000_000
+
+
+class RuleTest(unittest.TestCase):
+    def test_threshold_must_hold_for_for_sec(self):
+        rule = ThresholdRule("cpu_high", "cpu", 80, for_sec=60)
+        rule.observe(T0, {"cpu": 90})
+        self.assertIsNone(rule.check(T0 + 30))
+        self.assertIn("cpu = 90.0 > 80", rule.check(T0 + 60))
+
+        rule.observe(T0 + 61, {"cpu": 10})
+        rule.observe(T0 + 20, {"cpu": 95})  # flushed late: older than the current state
+        self.assertIsNone(rule.check(T0 + 120))
+
+    def test_rate_over_the_window(self):
+        rule = RateRule("memory_climb", "memory_gb", 8, window_sec=600)
+        rule.observe(T0, {"memory_gb": 10})
+        rule.observe(T0 + 300, {"memory_gb": 20})
+        self.assertIn("changed by +10.0 in 300s", rule.check(T0 + 300))
+
+        rule.observe(T0 + 1000, {"memory_gb": 21})  # T0 has left the window
+        self.assertIsNone(rule.check(T0 + 1000))
+
+    def test_rate_orders_late_samples(self):
+        rule = RateRule("memory_climb", "memory_gb", 8, window_sec=600)
+        rule.observe(T0 + 100, {"memory_gb": 10})
+        rule.observe(T0 + 200, {"memory_gb": 12})
+        rule.observe(T0 + 50, {"memory_gb": 1})
+        self.assertEqual([ts for ts, _ in rule._window], [T0 + 50, T0 + 100, T0 + 200])
+        self.assertIn("changed by +11.0 in 150s", rule.check(T0 + 200))
+
+    def test_absence(self):
+        rule = AbsenceRule("sampler_silent", "cpu", 120)
+        rule.observe(T0, {"cpu": 1})
+        rule._last_seen = T0  # no engine-start grace period in this test
+        self.assertIsNone(rule.check(T0 + 60))
+        self.assertIn("no cpu sample for 180s", rule.check(T0 + 180))
+
+    def test_llm_percentile_needs_enough_calls_for_for_sec(self):
+        rule = LLMPercentileRule("slow", "mixtral:8x7b", 5.0, pct=95, window_sec=300, min_calls=3, for_sec=60)
+        for i in range(3):
+            rule.observe_call({"model": "mixtral:8x7b", "ts": T0 + i, "latency_sec": 9.0})
+            rule.observe_call({"model": "mistral:7b", "ts": T0 + i, "latency_sec": 90.0})
+        self.assertIsNone(rule.check(T0 + 10))  # breached, but not yet for 60s
+        self.assertIn("p95 latency_sec = 9.00s > 5.0s over 3 calls", rule.check(T0 + 70))
+        self.assertIsNone(rule.check(T0 + 400))  # calls aged out of the window
+
+
+class AlertEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp.name)
+        self.store = MetricsStore(self.tmp_path / "metrics.db", flush_interval=3600)
+        self.sink = FileSink(self.tmp_path / "alerts.jsonl")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_fires_repeats_after_cooldown_and_resolves(self):
+        engine = AlertEngine(self.store, rules=[ThresholdRule("disk_high", "disk", 90)], sinks=[self.sink],
+                             cooldown_sec=100)
+        self.store.record("disk", 95, ts=T0)
+        self.store.flush()
+
+        self.assertEqual([a["state"] for a in engine.evaluate(now=T0)], ["firing"])
+        self.assertEqual(engine.evaluate(now=T0 + 50), [])
+        self.assertEqual([a["state"] for a in engine.evaluate(now=T0 + 100)], ["repeat"])
+
+        self.store.record("disk", 50, ts=T0 + 101)
+        self.store.flush()
+        self.assertEqual([a["state"] for a in engine.evaluate(now=T0 + 101)], ["resolved"])
+        self.assertEqual([a["state"] for a in self.sink.recent()], ["resolved", "repeat", "firing"])
+
+    def test_late_samples_are_still_evaluated(self):
+        self.store.record("memory_gb", 20, ts=T0 + 100)
+        self.store.flush()
+        engine = AlertEngine(self.store, rules=[RateRule("memory_climb", "memory_gb", 8, window_sec=600)],
+                             sinks=[])
+        self.store.record("memory_gb", 30, ts=T0 + 200)
+        self.store.flush()
+        self.assertEqual(engine.evaluate(now=T0 + 200), [])  # history before the engine started is skipped
+
+        self.store.record("memory_gb", 15, ts=T0 + 150)  # flushed after a newer sample
+        self.store.flush()
+        alerts = engine.evaluate(now=T0 + 200)
+        self.assertEqual([a["rule"] for a in alerts], ["memory_climb"])
+        self.assertIn("changed by +15.0 in 50s", alerts[0]["message"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Artifact Store Tests
+Ingests a version directory into a throwaway store and materialises releases from its blobs
+"""
+
+import hashlib
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ai_family.artifact_store import ArtifactStore
+
+
+class ArtifactStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp.name)
+        self.version_dir = self.tmp_path / "versions" / "deon" / "v1"
+        (self.version_dir / "model").mkdir(parents=True)
+        (self.version_dir / "checkpoints" / "checkpoint-2").mkdir(parents=True)
+        (self.version_dir / "model" / "weights.bin").write_bytes(b"weights-v1")
+        (self.version_dir / "model.bin").write_bytes(b"model")
+        (self.version_dir / "metadata.json").write_text('{"version": "v1"}')
+        (self.version_dir / "train.log").write_text("step 1")
+        (self.version_dir / "checkpoints" / "checkpoint-2" / "state.json").write_text("{}")
+        self.store = ArtifactStore(self.tmp_path / "artifacts")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ingest_stores_read_only_copies_by_sha256(self):
+        manifest = self.store.ingest(self.version_dir)
+
+        self.assertEqual(manifest, {
+            "model.bin": hashlib.sha256(b"model").hexdigest(),
+            "model/weights.bin": hashlib.sha256(b"weights-v1").hexdigest(),
+        })
+        weights = self.version_dir / "model" / "weights.bin"
+        blob = self.store.blob_path(manifest["model/weights.bin"])
+        self.assertEqual(stat.S_IMODE(blob.stat().st_mode), 0o444)
+        self.assertFalse(os.path.samefile(blob, weights))
+
+        # A trainer rewriting the file in place must not reach the stored blob
+        with open(weights, "r+b") as f:
+            f.write(b"WEIGHTS")
+        self.assertEqual(blob.read_bytes(), b"weights-v1")
+
+    def test_unchanged_files_are_not_rehashed(self):
+        self.store.ingest(self.version_dir)
+        with mock.patch.object(ArtifactStore, "_hash_file", wraps=self.store._hash_file) as hash_file:
+            self.store.ingest(self.version_dir)
+            self.assertEqual(hash_file.call_count, 0)
+
+            (self.version_dir / "model.bin").write_bytes(b"model, retrained")
+            manifest = self.store.ingest(self.version_dir)
+            self.assertEqual(hash_file.call_count, 1)
+        self.assertEqual(manifest["model.bin"], hashlib.sha256(b"model, retrained").hexdigest())
+
+    def test_materialize_links_blobs_and_copies_metadata(self):
+        manifest = self.store.ingest(self.version_dir)
+        release_dir = self.tmp_path / "releases" / f"v1-{self.store.manifest_id(manifest)}"
+        self.store.materialize(manifest, self.version_dir, release_dir)
+
+        self.assertEqual(sorted(str(p.relative_to(release_dir)) for p in release_dir.rglob("*") if p.is_file()),
+                         [".manifest.json", "metadata.json", "model.bin", "model/weights.bin"])
+        self.assertTrue(os.path.samefile(release_dir / "model.bin", self.store.blob_path(manifest["model.bin"])))
+        self.assertFalse(os.path.samefile(release_dir / "metadata.json", self.version_dir / "metadata.json"))
+
+    def test_swap_symlink_repoints_production(self):
+        production = self.tmp_path / "production"
+        for name in ("v1-aaaa", "v2-bbbb"):
+            (self.tmp_path / name).mkdir()
+            self.store.swap_symlink(production, self.tmp_path / name)
+            self.assertEqual(production.resolve(), (self.tmp_path / name).resolve())
+        self.assertEqual(os.readlink(production), "v2-bbbb")  # relative, so the tree can move
+
+    def test_manifest_id_is_stable(self):
+        self.assertEqual(ArtifactStore.manifest_id({"a": "1", "b": "2"}), ArtifactStore.manifest_id({"b": "2", "a": "1"}))
+        self.assertNotEqual(ArtifactStore.manifest_id({"a": "1"}), ArtifactStore.manifest_id({"a": "2"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Snapshot Store Tests
+Snapshots, restores, verifies and prunes a small tree in a throwaway store
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from claudae_backup import SnapshotStore, blake2b_file
+
+
+class SnapshotStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp.name)
+        self.source = self.tmp_path / "source"
+        (self.source / "docs").mkdir(parents=True)
+        (self.source / "a.txt").write_text("alpha")
+        (self.source / "docs" / "b.md").write_text("# beta")
+        (self.source / "docs" / "copy.md").write_text("# beta")  # same content, one blob
+        self.store = SnapshotStore(self.tmp_path / "store")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_snapshot_and_restore(self):
+        snapshot = self.store.snapshot(self.source, "phase2")
+
+        self.assertEqual(snapshot["files"], 3)
+        self.assertEqual(snapshot["new_blobs"], 2)
+        self.assertEqual(len(snapshot["new_digests"]), 2)
+        self.assertEqual(snapshot["failed"], [])
+
+        target = self.tmp_path / "restored"
+        self.assertEqual(self.store.restore(snapshot["snapshot_id"], target), 3)
+        self.assertEqual((target / "docs" / "copy.md").read_text(), "# beta")
+        self.assertEqual((target / "a.txt").stat().st_mtime_ns, (self.source / "a.txt").stat().st_mtime_ns)
+
+        self.assertEqual(self.store.restore(snapshot["snapshot_id"], self.tmp_path / "subset", ["a.txt"]), 1)
+        self.assertFalse((self.tmp_path / "subset" / "docs").exists())
+
+    def test_unchanged_files_are_neither_rehashed_nor_stored_again(self):
+        self.store.snapshot(self.source, "phase2")
+        (self.source / "a.txt").write_text("alpha, edited")
+        snapshot = self.store.snapshot(self.source, "phase2")
+
+        self.assertEqual(snapshot["rehashed"], 1)
+        self.assertEqual(snapshot["new_blobs"], 1)
+        self.assertEqual(snapshot["new_digests"], [blake2b_file(self.source / "a.txt")])
+
+    def test_verify_finds_corrupt_and_missing_blobs(self):
+        snapshot = self.store.snapshot(self.source, "phase2")
+        manifest = self.store.load(snapshot["snapshot_id"])["files"]
+        self.assertTrue(self.store.verify(snapshot["snapshot_id"])["ok"])
+
+        corrupt = self.store.blob_path(manifest["a.txt"]["digest"])
+        corrupt.write_text("alphA")  # same size, so only a re-hash can tell
+        missing = self.store.blob_path(manifest["docs/b.md"]["digest"])
+        missing.unlink()
+
+        stat_only = self.store.verify(snapshot["snapshot_id"], rehash=False)
+        self.assertEqual(stat_only["missing"], [missing.name])
+        self.assertEqual(stat_only["corrupt"], [])
+        self.assertEqual(stat_only["rehashed"], 0)
+
+        report = self.store.verify(snapshot["snapshot_id"], max_workers=2)
+        self.assertFalse(report["ok"])
+        self.assertEqual(report["corrupt"], [corrupt.name])
+        self.assertEqual(report["missing"], [missing.name])
+
+    def test_verify_can_rehash_only_selected_blobs(self):
+        first = self.store.snapshot(self.source, "phase2")
+        old_digest = self.store.load(first["snapshot_id"])["files"]["a.txt"]["digest"]
+        self.store.blob_path(old_digest).write_text("ALPHA")
+        (self.source / "new.txt").write_text("gamma")
+        second = self.store.snapshot(self.source, "phase2")
+
+        report = self.store.verify(second["snapshot_id"], rehash=second["new_digests"])
+        self.assertTrue(report["ok"])  # the reused, corrupted blob was only stat'ed
+        self.assertEqual(report["rehashed"], 1)
+        self.assertEqual(report["bytes_hashed"], len("gamma"))
+
+    def test_files_that_cannot_be_read_are_skipped(self):
+        unreadable = self.source / "secret.txt"
+        unreadable.write_text("x")
+        os.chmod(unreadable, 0)
+        if os.access(unreadable, os.R_OK):
+            self.skipTest("running as root")
+        snapshot = self.store.snapshot(self.source, "phase2")
+
+        self.assertEqual(snapshot["files"], 3)
+        self.assertEqual([failure["path"] for failure in snapshot["failed"]], ["secret.txt"])
+
+    def test_prune_keeps_the_newest_snapshots_of_one_label(self):
+        ids = []
+        for content in ("one", "two", "three"):
+            (self.source / "a.txt").write_text(content)
+            ids.append(self.store.snapshot(self.source, "phase2")["snapshot_id"])
+        other = self.store.snapshot(self.source, "phase2b")["snapshot_id"]
+
+        self.assertEqual(self.store.list_snapshots("phase2"), ids)
+        removed = self.store.prune("phase2", keep=1)
+
+        self.assertEqual(removed, 2)  # the "one" and "two" blobs; "three" is still referenced
+        self.assertEqual(self.store.list_snapshots("phase2"), ids[-1:])
+        self.assertEqual(self.store.list_snapshots("phase2b"), [other])
+        self.assertTrue(self.store.verify(ids[-1])["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Change Feed Tests
+The project manager's cached feed of commits and learning journal records, in a throwaway project
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ai_family import generated_files
+from ai_family.claudae.project_manager import CLAUDAEProjectManager
+
+
+class ChangeFeedTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        patcher = mock.patch.object(generated_files, "TAG_REGISTRY", self.root / "logs" / "generated_writes.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(generated_files, "TAG_LOCK", self.root / "logs" / "generated_writes.json.lock")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.journal_dir = self.root / "claudae_foundation" / "autonomous_learning"
+        self.journal_dir.mkdir(parents=True)
+        self.manager = CLAUDAEProjectManager(self.root)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def journal(self, kind, stamp, file_name, pattern="Refactoring"):
+        (self.journal_dir / f"{kind}_learning_{stamp}.json").write_text(json.dumps({
+            "timestamp": f"{stamp[:4]}-{stamp[4:6]}-{stamp[6:8]}T{stamp[9:11]}:{stamp[11:13]}:{stamp[13:15]}",
+            "file_path": f"/project/{file_name}",
+            "claudae_analysis": {"development_pattern": pattern}
+        }))
+
+    def git(self, *args):
+        subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                       cwd=self.root, check=True, capture_output=True)
+
+    def test_both_journal_kinds_in_timestamp_order(self):
+        self.journal("user", "20250605_033645", "a.py")
+        self.journal("integrated", "20250605_040000", "b.py", "Feature addition")
+        self.journal("integrated", "20250605_031906", "c.py")
+
+        feed = self.manager._refresh_change_feed()
+        self.assertEqual([c["summary"] for c in feed["changes"]],
+                         ["Feature addition in b.py", "Refactoring in a.py", "Refactoring in c.py"])
+        self.assertEqual(feed["journal_cursor"], "20250605_040000.json/integrated_learning_20250605_040000.json")
+
+        # Only records past the cursor are read, whichever kind they are
+        self.journal("user", "20250605_050000", "d.py")
+        self.journal("user", "20250605_035959", "too_old.py")
+        feed = self.manager._refresh_change_feed()
+        self.assertEqual(len(feed["changes"]), 4)
+        self.assertEqual(feed["changes"][0]["summary"], "Refactoring in d.py")
+
+    def test_feeds_with_the_old_cursor_are_rebuilt(self):
+        self.journal("user", "20250605_033645", "a.py")
+        self.journal("integrated", "20250605_031906", "c.py")
+        self.manager.memory_dir.mkdir()
+        self.manager.change_feed_file.write_text(json.dumps({
+            "last_commit": None, "last_journal_entry": "user_learning_20250605_033645.json",
+            "changes": [{"source": "journal", "summary": "Refactoring in a.py", "timestamp": "2025-06-05T03:36:45"}]
+        }))
+
+        feed = self.manager._refresh_change_feed()
+        self.assertNotIn("last_journal_entry", feed)
+        self.assertEqual([c["summary"] for c in feed["changes"]], ["Refactoring in a.py", "Refactoring in c.py"])
+
+    def test_commits_since_the_cached_head(self):
+        self.git("init", "-q")
+        self.git("commit", "-q", "--allow-empty", "-m", "First commit")
+        self.assertEqual([c["summary"] for c in self.manager._refresh_change_feed()["changes"]], ["First commit"])
+
+        self.git("commit", "-q", "--allow-empty", "-m", "Second commit")
+        feed = self.manager._refresh_change_feed()
+        self.assertEqual(sorted(c["summary"] for c in feed["changes"]), ["First commit", "Second commit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
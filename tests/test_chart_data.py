@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Chart Data Tests
+LTTB downsampling and the per-window chart cache over a throwaway metrics.db
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+try:
+    import numpy as np
+    import pandas as pd
+    from monitoring.chart_data import ChartDataCache, downsample, lttb_indices
+except ImportError:  # the dashboards' optional plotting stack
+    np = None
+from monitoring.metrics_store import MetricsStore
+
+
+@unittest.skipIf(np is None, "chart_data needs numpy and pandas")
+class LTTBTest(unittest.TestCase):
+    def test_keeps_endpoints_and_count(self):
+        x = np.arange(1000, dtype=float)
+        indices = lttb_indices(x, np.sin(x / 50), 100)
+
+        self.assertEqual(len(indices), 100)
+        self.assertEqual((indices[0], indices[-1]), (0, 999))
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+    def test_keeps_a_single_spike(self):
+        y = np.zeros(1000)
+        y[537] = 100.0
+        self.assertIn(537, lttb_indices(np.arange(1000, dtype=float), y, 50))
+
+    def test_short_series_are_returned_whole(self):
+        self.assertEqual(list(lttb_indices(np.arange(10, dtype=float), np.zeros(10), 20)), list(range(10)))
+
+    def test_downsample_keeps_each_columns_spike(self):
+        frame = pd.DataFrame({"timestamp": np.arange(1000), "cpu": np.zeros(1000), "memory": np.zeros(1000)})
+        frame.loc[100, "cpu"] = 90.0
+        frame.loc[800, "memory"] = 90.0
+        sampled = downsample(frame, 60, ["cpu", "memory"])
+
+        self.assertLessEqual(len(sampled), 60)
+        self.assertEqual(sampled["cpu"].max(), 90.0)
+        self.assertEqual(sampled["memory"].max(), 90.0)
+        self.assertIs(downsample(frame, 2000, ["cpu"]), frame)
+
+
+@unittest.skipIf(np is None, "chart_data needs numpy and pandas")
+class ChartDataCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = MetricsStore(Path(self.tmp.name) / "metrics.db", flush_interval=3600)
+        self.cache = ChartDataCache(self.store, ["cpu"], max_points=50)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_version_changes_only_with_new_data(self):
+        now = int(time.time())
+        for i in range(300):
+            self.store.record("cpu", i % 7, ts=now - 300 + i)
+        self.store.flush()
+
+        frame, version = self.cache.get(600)
+        self.assertLessEqual(len(frame), 50)
+        self.assertEqual(self.cache.get(600)[1], version)
+
+        self.store.record("cpu", 99, ts=now)
+        self.store.flush()
+        frame, new_version = self.cache.get(600)
+        self.assertEqual(new_version, version + 1)
+        self.assertGreater(frame["cpu"].max(), 6)  # averaged into its bucket, but there
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Generated File Tests
+Change-only atomic writes and the cross-process write tags, with the tag registry in a temp dir
+"""
+
+import json
+import multiprocessing
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ai_family import generated_files
+from ai_family.generated_files import (generated_file, ignore_lines, is_generated, write_if_changed,
+                                       write_json_if_changed)
+
+
+def tag_files(directory, worker, count):
+    """Writer process (forked, so the test's registry patch carries over): tags count files of its own"""
+    for i in range(count):
+        write_if_changed(directory / f"w{worker}_{i}.md", f"{worker}/{i}")
+
+
+class GeneratedFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp.name)
+        self.registry = self.tmp_path / "logs" / "generated_writes.json"
+        for name, value in (("TAG_REGISTRY", self.registry),
+                            ("TAG_LOCK", self.registry.with_name(f"{self.registry.name}.lock")),
+                            ("_tags", {}), ("_tags_mtime_ns", None)):
+            patcher = mock.patch.object(generated_files, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_writes_only_when_content_changes(self):
+        path = self.tmp_path / "README.md"
+        self.assertTrue(write_if_changed(path, "# Docs\n"))
+        inode = path.stat().st_ino
+        self.assertFalse(write_if_changed(path, "# Docs\n"))
+        self.assertEqual(path.stat().st_ino, inode)
+
+        key = ignore_lines("Generated:")
+        self.assertTrue(write_if_changed(path, "Generated: monday\n# Docs v2\n", key))
+        self.assertFalse(write_if_changed(path, "Generated: tuesday\n# Docs v2\n", key))
+        self.assertEqual(path.read_text(), "Generated: monday\n# Docs v2\n")
+
+    def test_json_ignore_keys(self):
+        path = self.tmp_path / "status.json"
+        self.assertTrue(write_json_if_changed(path, {"ok": True, "updated": 1}, ignore_keys=["updated"]))
+        self.assertFalse(write_json_if_changed(path, {"ok": True, "updated": 2}, ignore_keys=["updated"]))
+        self.assertTrue(write_json_if_changed(path, {"ok": False, "updated": 3}, ignore_keys=["updated"]))
+        self.assertEqual(json.loads(path.read_text()), {"ok": False, "updated": 3})
+
+    def test_tagged_writes_until_someone_else_edits(self):
+        path = self.tmp_path / "index.md"
+        with generated_file(path) as f:
+            f.write("generated")
+        self.assertTrue(is_generated(path))
+        self.assertEqual(list(self.tmp_path.glob("*.claudae-tmp")), [])
+
+        path.write_text("edited by hand")
+        self.assertFalse(is_generated(path))
+        self.assertTrue(is_generated(self.registry))
+        self.assertTrue(is_generated(self.tmp_path / ".index.md.1.2.claudae-tmp"))
+
+    def test_a_failed_write_leaves_the_target_alone(self):
+        path = self.tmp_path / "report.md"
+        path.write_text("previous")
+        with self.assertRaises(RuntimeError):
+            with generated_file(path) as f:
+                f.write("half")
+                raise RuntimeError("generator failed")
+        self.assertEqual(path.read_text(), "previous")
+        self.assertEqual(list(self.tmp_path.glob("*.claudae-tmp")), [])
+
+    def test_concurrent_writers_keep_every_tag(self):
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=tag_files, args=(self.tmp_path, worker, 20))
+                   for worker in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+            self.assertEqual(worker.exitcode, 0)
+
+        self.assertEqual(len(json.loads(self.registry.read_text())), 80)
+        self.assertTrue(all(is_generated(path) for path in self.tmp_path.glob("w*.md")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Metrics Exporter Tests
+Renders the OpenMetrics exposition from a throwaway metrics.db and serves it over HTTP
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+import urllib.request
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from monitoring.metrics_exporter import CONTENT_TYPE, OpenMetricsExporter
+from monitoring.metrics_store import MetricsStore
+
+
+class OpenMetricsExporterTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = MetricsStore(Path(self.tmp.name) / "metrics.db", flush_interval=3600)
+        self.now = int(time.time())
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def exporter(self):
+        return OpenMetricsExporter(self.store, lookback_sec=60)
+
+    def test_gauges_queues_and_counters(self):
+        self.store.record("cpu", 10, ts=self.now - 600)  # outside the lookback
+        exporter = self.exporter()
+        self.store.record_many({"cpu": 42.5, 'learner_queue:claudae:"docs"': 3}, ts=self.now)
+        self.store.record("cpu", 12.0, ts=self.now - 5)  # flushed late: the gauge keeps the newest
+        self.store.record_llm_call({"ts": self.now, "model": "mistral:7b", "caller": "probe", "status": "success",
+                                    "prompt_tokens": 12, "output_tokens": 20, "latency_sec": 0.4, "ttft_sec": 0.1})
+        self.store.record_training_event("deon", "training_completed", ts=self.now)
+        self.store.flush()
+        exporter.refresh()
+        text = exporter.exposition().decode()
+
+        self.assertIn("honey_duo_cpu_utilization_percent 42.5\n", text)
+        self.assertIn('honey_duo_learner_queue_depth{learner="claudae",queue="\\"docs\\""} 3.0\n', text)
+        self.assertIn('honey_duo_llm_calls_total{model="mistral:7b",caller="probe",status="success"} 1\n', text)
+        self.assertIn('honey_duo_llm_tokens_total{model="mistral:7b",kind="output"} 20\n', text)
+        self.assertIn('honey_duo_llm_latency_seconds_bucket{model="mistral:7b",caller="probe",le="0.5"} 1\n', text)
+        self.assertIn('honey_duo_llm_latency_seconds_bucket{model="mistral:7b",caller="probe",le="0.25"} 0\n', text)
+        self.assertIn('honey_duo_llm_latency_seconds_bucket{model="mistral:7b",caller="probe",le="+Inf"} 1\n', text)
+        self.assertIn('honey_duo_training_runs_total{ai="deon",outcome="completed"} 1\n', text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+    def test_counters_only_grow_with_new_rows(self):
+        exporter = self.exporter()
+        call = {"ts": self.now, "model": "mistral:7b", "caller": "probe", "status": "error"}
+        self.store.record_llm_call(call)
+        self.store.flush()
+        exporter.refresh()
+        exporter.refresh()
+        self.store.record_llm_call(call)
+        self.store.flush()
+        exporter.refresh()
+
+        self.assertIn('honey_duo_llm_calls_total{model="mistral:7b",caller="probe",status="error"} 2\n',
+                      exporter.exposition().decode())
+
+    def test_serves_the_last_rendering(self):
+        exporter = self.exporter()
+        self.store.record("disk", 71, ts=self.now)
+        self.store.flush()
+        exporter.refresh()
+        server = exporter.serve(port=0)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics", timeout=5) as response:
+                self.assertEqual(response.headers["Content-Type"], CONTENT_TYPE)
+                self.assertIn(b"honey_duo_disk_utilization_percent 71.0\n", response.read())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
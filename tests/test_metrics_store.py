@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Metrics Store Tests
+Rollups, deduplication, retention and the insert-order cursor against a throwaway metrics.db
+"""
+
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from monitoring.metrics_store import MetricsStore, TIERS
+
+T0 = 1_750_000_000 - 1_750_000_000 % 3600  # an hour boundary
+
+
+class MetricsStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / "metrics.db"
+        # The writer thread never fires on its own; tests flush explicitly
+        self.store = MetricsStore(self.db_path, flush_interval=3600)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def rollup(self, table, name):
+        return self.store.conn.execute(
+            f"SELECT bucket, count, sum, min, max FROM {table} WHERE name = ? ORDER BY bucket", (name,)
+        ).fetchall()
+
+    def test_rollups_aggregate_each_minute_and_hour(self):
+        for i in range(120):
+            self.store.record("cpu", i, ts=T0 + i)
+        self.store.flush()
+
+        self.assertEqual(self.rollup("metrics_1m", "cpu"), [
+            (T0, 60, sum(range(60)), 0, 59),
+            (T0 + 60, 60, sum(range(60, 120)), 60, 119),
+        ])
+        self.assertEqual(self.rollup("metrics_1h", "cpu"), [(T0, 120, sum(range(120)), 0, 119)])
+
+        rows = self.store.query(["cpu"], T0, until=T0 + 119, step=60)
+        self.assertEqual(rows, [{"timestamp": T0, "cpu": 29.5}, {"timestamp": T0 + 60, "cpu": 89.5}])
+
+    def test_first_sample_per_second_wins_and_rollups_count_only_it(self):
+        self.store.record_many({"cpu": 10, "memory": 50}, ts=T0)
+        self.store.record("cpu", 99, ts=T0)  # same second, same batch
+        self.store.flush()
+        self.store.record("cpu", 77, ts=T0)  # same second, later batch
+        self.store.flush()
+
+        self.assertEqual(self.store.latest(["cpu", "memory"]), {"cpu": 10.0, "memory": 50.0})
+        self.assertEqual(self.rollup("metrics_1m", "cpu"), [(T0, 1, 10.0, 10.0, 10.0)])
+
+    def test_a_failed_batch_is_rolled_back(self):
+        with self.assertRaises(sqlite3.Error):
+            self.store._write_batch([(T0, "cpu", 1.0), (T0 + 1, "cpu", object())])
+        self.assertEqual(self.store.conn.execute("SELECT COUNT(*) FROM metrics_raw").fetchone()[0], 0)
+        self.assertEqual(self.rollup("metrics_1m", "cpu"), [])
+
+    def test_retention_per_tier(self):
+        now = T0 + 400 * 24 * 3600
+        for table, (_, retention) in TIERS.items():
+            for name in ("kept", "expired"):
+                age = retention - 3600 if name == "kept" else retention + 3600
+                column = "ts" if table == "metrics_raw" else "bucket"
+                self.store.conn.execute(f"INSERT INTO {table} ({column}, name) VALUES (?, ?)", (now - age, name))
+        self.store.conn.commit()
+
+        self.store.prune(now=now)
+        for table in TIERS:
+            names = [row[0] for row in self.store.conn.execute(f"SELECT name FROM {table}")]
+            self.assertEqual(names, ["kept"], table)
+
+    def test_fetch_since_follows_insert_order(self):
+        cursor = self.store.max_metric_id()
+        self.store.record("cpu", 50, ts=T0 + 10)
+        self.store.flush()
+        rows, cursor = self.store.fetch_since(["cpu"], cursor)
+        self.assertEqual(rows, [{"timestamp": T0 + 10, "cpu": 50.0}])
+
+        # Flushed late with an older timestamp: still newer than the cursor
+        self.store.record("cpu", 40, ts=T0 + 5)
+        self.store.record("memory", 70, ts=T0 + 11)
+        self.store.flush()
+        rows, cursor = self.store.fetch_since(["cpu"], cursor)
+        self.assertEqual(rows, [{"timestamp": T0 + 5, "cpu": 40.0}])
+        self.assertEqual(self.store.fetch_since(["cpu"], cursor)[0], [])
+        self.assertEqual(self.store.metric_id_before(T0 + 11), self.store.max_metric_id() - 1)
+
+    def test_old_raw_tables_are_migrated(self):
+        self.store.close()
+        legacy_path = Path(self.tmp.name) / "legacy.db"
+        conn = sqlite3.connect(legacy_path)
+        conn.execute("CREATE TABLE metrics_raw (ts INTEGER NOT NULL, name TEXT NOT NULL, value REAL, "
+                     "PRIMARY KEY (ts, name)) WITHOUT ROWID")
+        conn.executemany("INSERT INTO metrics_raw VALUES (?, 'cpu', ?)", [(T0 + 1, 1.0), (T0, 0.0)])
+        conn.commit()
+        conn.close()
+
+        self.store = MetricsStore(legacy_path, flush_interval=3600)
+        rows, cursor = self.store.fetch_since(["cpu"], 0)
+        self.assertEqual(rows, [{"timestamp": T0, "cpu": 0.0}, {"timestamp": T0 + 1, "cpu": 1.0}])
+        self.assertEqual(cursor, 2)
+
+    def test_step_for_uses_a_tier_that_still_covers_the_window(self):
+        self.assertEqual(MetricsStore.step_for(3600, 500), 8)
+        self.assertEqual(MetricsStore.step_for(24 * 3600, 2000), 60)  # raw keeps only 6h
+        self.assertEqual(MetricsStore.step_for(30 * 24 * 3600, 2000), 3600)
+
+
+if __name__ == "__main__":
+    unittest.main()
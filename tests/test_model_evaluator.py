@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Model Evaluator Tests
+Runs the evaluator against a local stub of Ollama's /api/generate
+"""
+
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ai_family import llm_telemetry
+from ai_family.llm_training_manager import LLMTrainingManager
+from ai_family.model_evaluator import ModelEvaluator
+from monitoring.metrics_store import MetricsStore
+
+
+class StubOllama(BaseHTTPRequestHandler):
+    """Answers /api/generate with a fixed reply: 20 output tokens in 0.5s"""
+
+    requests = []
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        StubOllama.requests.append(payload)
+        if self.path != "/api/generate":
+            self.send_error(404)
+            return
+        body = json.dumps({
+            "model": payload["model"],
+            "response": "The risk grade is B with a stop loss in place",
+            "done": True,
+            "prompt_eval_count": 12,
+            "eval_count": 20,
+            "eval_duration": 500_000_000,
+            "total_duration": 600_000_000
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ModelEvaluatorTest(unittest.TestCase):
+    SUITE = {
+        "suite_version": "1.0",
+        "pass_threshold": 0.5,
+        "options": {"temperature": 0},
+        "cases": {
+            "grade": {"input": "Grade this trade", "expected_patterns": ["risk grade", "[A-F]\\b"]},
+            "stop": {"input": "Where is the stop?", "expected_pattern": "take profit"}
+        }
+    }
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp.name)
+        # Telemetry goes to a throwaway store, never monitoring/metrics.db
+        self.store = MetricsStore(self.tmp_path / "metrics.db")
+        self._saved_store, llm_telemetry._store = llm_telemetry._store, self.store
+
+        StubOllama.requests = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubOllama)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.evaluator = ModelEvaluator(self.tmp_path / "suites",
+                                        base_url=f"http://127.0.0.1:{self.server.server_port}", timeout=5)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        llm_telemetry._store = self._saved_store
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_results_are_scored_timed_and_cached(self):
+        results = self.evaluator.run_suite(self.SUITE, self.tmp_path, "mistral:7b")
+
+        self.assertEqual(len(StubOllama.requests), 2)
+        self.assertEqual(StubOllama.requests[0]["options"], {"temperature": 0})
+        grade, stop = results["grade"], results["stop"]
+        self.assertEqual(grade["status"], "success")
+        self.assertEqual(grade["score"], 1.0)
+        self.assertTrue(grade["passed"])
+        self.assertEqual(stop["score"], 0.0)
+        self.assertFalse(stop["passed"])
+        self.assertEqual(grade["tokens_per_sec"], 40.0)
+        self.assertEqual(grade["prompt_tokens"], 12)
+        self.assertGreaterEqual(grade["latency_sec"], 0)
+        self.assertNotIn("cached", grade)
+
+        cached = self.evaluator.run_suite(self.SUITE, self.tmp_path, "mistral:7b")
+        self.assertEqual(len(StubOllama.requests), 2)
+        self.assertTrue(all(result["cached"] for result in cached.values()))
+        self.assertEqual(cached["grade"]["score"], grade["score"])
+
+        # A different model misses the cache
+        self.evaluator.run_suite(self.SUITE, self.tmp_path, "llama2:13b")
+        self.assertEqual(len(StubOllama.requests), 4)
+
+    def test_performance_metrics(self):
+        results = self.evaluator.run_suite(self.SUITE, self.tmp_path, "mistral:7b")
+        metrics = LLMTrainingManager(self.tmp_path)._calculate_performance_metrics(results)
+
+        self.assertEqual(metrics["total_tests"], 2)
+        self.assertEqual(metrics["errors"], 0)
+        self.assertEqual(metrics["average_score"], 0.5)
+        self.assertEqual(metrics["pass_rate"], 0.5)
+        self.assertIsNotNone(metrics["latency_p50_sec"])
+        self.assertGreaterEqual(metrics["latency_p95_sec"], metrics["latency_p50_sec"])
+        self.assertEqual(metrics["avg_tokens_per_sec"], 40.0)
+
+    def test_unreachable_server_is_an_uncached_error(self):
+        self.server.shutdown()
+        self.server.server_close()
+        results = self.evaluator.run_suite(self.SUITE, self.tmp_path, "mistral:7b")
+
+        self.assertEqual({result["status"] for result in results.values()}, {"error"})
+        self.assertEqual(json.loads((self.tmp_path / "eval_cache.json").read_text()), {})
+        metrics = LLMTrainingManager(self.tmp_path)._calculate_performance_metrics(results)
+        self.assertEqual(metrics["errors"], 2)
+        self.assertIsNone(metrics["latency_p50_sec"])
+
+    def test_empty_suite(self):
+        suite = dict(self.SUITE, cases={})
+        results = self.evaluator.run_suite(suite, self.tmp_path, "mistral:7b")
+        metrics = LLMTrainingManager(self.tmp_path)._calculate_performance_metrics(results)
+
+        self.assertEqual(results, {})
+        self.assertEqual(metrics["total_tests"], 0)
+        self.assertEqual(metrics["average_score"], 0.0)
+        self.assertEqual(metrics["pass_rate"], 0.0)
+        self.assertIsNone(metrics["latency_p95_sec"])
+
+
+if __name__ == "__main__":
+    unittest.main()
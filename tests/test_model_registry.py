@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Model Registry Tests
+Versions, deployments and the legacy import against a throwaway registry.db
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ai_family.model_registry import ModelRegistry
+
+
+class ModelRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmp.name)
+        self.versions_dir = self.tmp_path / "versions"
+        self.models_dir = self.tmp_path / "models"
+        self.db_path = self.models_dir / "registry.db"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def registry(self):
+        return ModelRegistry(self.db_path, self.versions_dir, self.models_dir)
+
+    def test_reads_on_a_fresh_install_create_nothing(self):
+        registry = self.registry()
+        registry.ensure_imported(["deon"])
+
+        summary = registry.status_summary(["deon"])["deon"]
+        self.assertEqual(summary["total_versions"], 0)
+        self.assertIsNone(summary["latest_version"])
+        self.assertEqual(registry.next_version_num("deon"), 1)
+        self.assertEqual(registry.deployment_history("deon"), [])
+        self.assertIsNone(registry.latest_dataset("deon"))
+        self.assertFalse(self.models_dir.exists())
+
+    def test_versions_and_deployments(self):
+        registry = self.registry()
+        reader = self.registry()  # opened before the DB existed
+        registry.upsert_version({"ai_name": "deon", "version": "v1", "status": "created"})
+        registry.upsert_version({"ai_name": "deon", "version": "v2", "status": "created"})
+        registry.upsert_version({"ai_name": "deon", "version": "v2", "status": "validated",
+                                 "performance_metrics": {"average_score": 0.8}})
+        registry.record_deployment("deon", "v1", "deployed", "v1-aaaa")
+        registry.record_deployment("deon", "v2", "deployed", "v2-bbbb")
+        registry.record_dataset("deon", "deon.json", "abc", 42)
+
+        summary = reader.status_summary(["deon", "nyala"])
+        self.assertEqual(summary["deon"]["total_versions"], 2)
+        self.assertEqual(summary["deon"]["latest_version"], "v2")
+        self.assertEqual(summary["deon"]["latest_status"], "validated")
+        self.assertEqual(summary["deon"]["production_version"], "v2")
+        self.assertEqual(summary["deon"]["training_examples"], 42)
+        self.assertEqual(summary["nyala"]["total_versions"], 0)
+        self.assertEqual(reader.next_version_num("deon"), 3)
+        self.assertEqual([d["version"] for d in reader.deployment_history("deon")], ["v2", "v1"])
+        self.assertEqual(reader.metrics_history(), [
+            {"ai_name": "deon", "version": "v2", "created": None, "metrics": {"average_score": 0.8}}])
+
+    def test_legacy_files_are_imported_once(self):
+        version_dir = self.versions_dir / "deon" / "v1"
+        version_dir.mkdir(parents=True)
+        (version_dir / "metadata.json").write_text(json.dumps({"version": "v1", "status": "trained"}))
+        (self.models_dir / "deon").mkdir(parents=True)
+        (self.models_dir / "deon" / "deployment_log.json").write_text(json.dumps(
+            [{"version": "v1", "timestamp": "2025-06-01T00:00:00"}]))
+
+        self.registry().ensure_imported(["deon"])
+        self.registry().ensure_imported(["deon"])
+
+        registry = self.registry()
+        self.assertEqual(registry.status_summary(["deon"])["deon"]["latest_status"], "trained")
+        self.assertEqual(len(registry.deployment_history("deon")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Training Job Tests
+Runs the generated dummy trainer to completion, re-attaches to a trainer that outlived its launcher
+and refuses to validate a version without its own Ollama model
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from ai_family.llm_training_manager import LLMTrainingManager
+
+DUMMY_PARAMS = {"trainer": "dummy", "epochs": 2, "batch_size": 4, "save_steps": 2, "dummy_step_sec": 0.01}
+
+
+class TrainingJobTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        # Finished runs would otherwise call `ollama create` on the developer's machine
+        patcher = mock.patch.object(LLMTrainingManager, "build_ollama_model")
+        self.build_ollama_model = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = LLMTrainingManager(self.tmp.name)
+
+    def tearDown(self):
+        self.manager.job_runner.executor.shutdown(wait=True)
+        self.tmp.cleanup()
+
+    def new_version(self, ai_name="deon"):
+        version_id, version_dir = self.manager.create_model_version(ai_name, "llama2:13b", "test run")
+        dataset_file = Path(self.tmp.name) / "dataset.json"
+        dataset_file.write_text(json.dumps([{"input": f"q{i}", "output": f"a{i}"} for i in range(10)]))
+        script = self.manager._generate_training_script(ai_name, dataset_file, DUMMY_PARAMS, version_dir)
+        return version_id, version_dir, script
+
+    def metadata(self, version_dir):
+        return json.loads((version_dir / "metadata.json").read_text())
+
+    def test_dummy_trainer_runs_to_completion(self):
+        version_id, version_dir, script = self.new_version()
+        job_id = self.manager._execute_training("deon", version_id, script)
+        status = self.manager.job_runner.wait(job_id, poll_interval=0.05)
+
+        self.assertEqual(status["state"], "completed", (version_dir / "train.log").read_text())
+        self.assertEqual(status["step"], 6)  # ceil(10 / 4) steps per epoch, 2 epochs
+        self.assertEqual(status["total_steps"], 6)
+        self.assertEqual((version_dir / "model.bin").read_bytes(), b"dummy-model-6")
+        self.assertTrue((version_dir / "checkpoints" / "checkpoint-6" / "trainer_state.json").exists())
+        self.assertEqual(list(self.manager.job_runner.pid_dir.iterdir()), [])
+
+        metadata = self.metadata(version_dir)
+        self.assertEqual(metadata["status"], "trained")
+        self.assertEqual(metadata["training_result"]["steps"], 6)
+        self.assertEqual(self.manager.get_model_status("deon")["deon"]["latest_status"], "trained")
+        self.build_ollama_model.assert_called_once_with("deon", version_id)
+
+    def test_validation_needs_the_versions_own_ollama_model(self):
+        version_id, version_dir, _ = self.new_version()
+
+        with self.assertRaisesRegex(ValueError, f"deon {version_id} has no Ollama model"):
+            self.manager.validate_model("deon", version_id)
+        self.assertEqual(self.metadata(version_dir)["status"], "created")
+
+    def test_resume_reattaches_to_a_running_trainer(self):
+        version_id, version_dir, script = self.new_version()
+        (version_dir / "train_config.json").write_text(json.dumps(
+            dict(json.loads((version_dir / "train_config.json").read_text()), dummy_step_sec=0.1)))
+
+        # Launch the way an earlier dashboard process would have, then forget about it:
+        # the trainer is re-parented away from us, as after a restart
+        runner = self.manager.job_runner
+        runner._write_json(runner.jobs_dir / f"deon_{version_id}.json", {
+            "job_id": f"deon_{version_id}", "ai_name": "deon", "version": version_id,
+            "script": str(script), "version_dir": str(version_dir),
+            "status_file": str(version_dir / "training_status.json"),
+            "log_file": str(version_dir / "train.log"), "submitted": "earlier"
+        })
+        launcher = subprocess.run(
+            ["sh", "-c", f'"{sys.executable}" -u "{script}" >> "{version_dir / "train.log"}" 2>&1 & echo $!'],
+            cwd=version_dir, capture_output=True, text=True, check=True
+        )
+        pid = int(launcher.stdout)
+        job_file = runner.jobs_dir / f"deon_{version_id}.json"
+        runner._write_json(job_file, dict(json.loads(job_file.read_text()), pid=pid))
+        runner._write_json(version_dir / "training_status.json", {"state": "running", "step": 0, "pid": pid})
+
+        restarted = LLMTrainingManager(self.tmp.name)
+        done = threading.Event()
+        completed = []
+        relaunched = restarted.job_runner.resume_interrupted(
+            on_complete=lambda job: (restarted._on_training_complete(job), completed.append(job), done.set()),
+            poll_interval=0.05)
+        try:
+            self.assertEqual(relaunched, [])  # still running, so watched rather than started twice
+            self.assertTrue(done.wait(30), "on_complete never ran for the re-attached trainer")
+        finally:
+            restarted.job_runner.executor.shutdown(wait=False)
+
+        self.assertEqual(completed[0]["state"], "completed")
+        self.assertEqual(self.metadata(version_dir)["status"], "trained")
+
+
+if __name__ == "__main__":
+    unittest.main()